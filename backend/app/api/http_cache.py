@@ -0,0 +1,60 @@
+# app/api/http_cache.py
+"""라우트 응답 캐시 (TTL + single-flight) 및 GET 응답용 ETag / If-None-Match 처리"""
+
+import asyncio
+import hashlib
+import weakref
+from typing import Any
+
+import msgspec
+from cachetools import TTLCache
+from fastapi import Request, Response
+
+# dict / msgspec.Struct 응답 본문을 모두 직렬화
+_json_encoder = msgspec.json.Encoder()
+
+# 캐시 미스 시 동일 키 중복 수집 방지용 lock
+# (대기/보유 중인 요청이 참조하는 동안만 유지되어 진행 중 lock이 축출되지 않음)
+_inflight_locks: "weakref.WeakValueDictionary[Any, asyncio.Lock]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+async def get_or_fetch(cache: TTLCache, key, fetch, refresh: bool = False):
+    """TTL 캐시 조회 후 미스 시 키별 lock 안에서 한 번만 수집 (single-flight)"""
+    if not refresh and key in cache:
+        return cache[key]
+
+    lock_key = (id(cache), key)
+    lock = _inflight_locks.get(lock_key)
+    if lock is None:
+        lock = _inflight_locks[lock_key] = asyncio.Lock()
+
+    async with lock:
+        # 대기 중 다른 요청이 채웠으면 재사용
+        if not refresh and key in cache:
+            return cache[key]
+        value = await fetch()
+        cache[key] = value
+        return value
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match 헤더(복수 값, 약한 ETag 포함)와 비교"""
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in candidates
+
+
+def etag_response(request: Request, payload: Any, max_age: int = 30) -> Response:
+    """본문 해시로 ETag를 붙여 응답, 클라이언트 ETag와 같으면 304 반환"""
+    body = _json_encoder.encode(payload)
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": f"max-age={max_age}"}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
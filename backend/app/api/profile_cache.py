@@ -0,0 +1,26 @@
+# app/api/profile_cache.py
+"""사용자 포트폴리오/선호도 조회 캐시와 쓰기 후 무효화 (/users, /user 라우터 공용)"""
+
+from typing import Tuple
+
+from cachetools import TTLCache
+
+# GET /users/profile/{user_id} 응답 캐시
+profile_cache = TTLCache(maxsize=1024, ttl=60)
+
+# 사용자별 쓰기 세대 - 쓰기 전에 시작된 조회 결과는 이전 세대 키로 저장되어 재사용되지 않음
+# (profile_cache보다 길게 유지: 세대가 만료돼 0으로 돌아갈 때는 이전 세대 항목도 이미 만료됨)
+_profile_generations = TTLCache(
+    maxsize=4 * profile_cache.maxsize, ttl=10 * profile_cache.ttl
+)
+
+
+def profile_cache_key(user_id: str) -> Tuple[str, int]:
+    """profile_cache 키 (사용자 ID + 현재 쓰기 세대)"""
+    return user_id, _profile_generations.get(user_id, 0)
+
+
+def invalidate_profile(user_id: str):
+    """user_portfolios / user_preferences 를 쓰는 모든 라우트에서 쓰기 직후 호출"""
+    profile_cache.pop(profile_cache_key(user_id), None)
+    _profile_generations[user_id] = _profile_generations.get(user_id, 0) + 1
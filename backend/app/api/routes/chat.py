@@ -1,35 +1,117 @@
 from fastapi import APIRouter, Query, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
+from sse_starlette.sse import EventSourceResponse, ServerSentEvent
 from typing import Optional
 from ...services.core.enhanced_rag_workflow import EnhancedRAGWorkflow
+import asyncio
 import json
 import logging
+import threading
+import orjson
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+
+def _sse(obj) -> ServerSentEvent:
+    """SSE 이벤트 생성 (orjson 직렬화, 프레이밍은 EventSourceResponse가 처리)"""
+    return ServerSentEvent(data=orjson.dumps(obj).decode())
+
+
+# 진행 이벤트 묶음 전송 설정
+_PROGRESS_BATCH_WINDOW = 0.05  # 초
+_TERMINAL_STATUSES = frozenset({"completed", "error"})
+_STREAM_END = object()
+
+
+async def _coalesce_progress(events, window: float = _PROGRESS_BATCH_WINDOW):
+    """진행 이벤트를 짧은 시간 창 단위로 묶어서 전달 (완료/오류 이벤트는 즉시 전달)"""
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def _pump():
+        try:
+            async for event in events:
+                await queue.put(event)
+        finally:
+            await queue.put(_STREAM_END)
+
+    pump_task = asyncio.create_task(_pump())
+    loop = asyncio.get_running_loop()
+    try:
+        item = await queue.get()
+        while item is not _STREAM_END:
+            batch = []
+            terminal = None
+            deadline = loop.time() + window
+            while item is not _STREAM_END:
+                if item.get("status") in _TERMINAL_STATUSES:
+                    terminal = item
+                    item = None
+                    break
+                batch.append(item)
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    item = None
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    item = None
+                    break
+
+            # 단일 이벤트는 기존 형식 그대로 전달 (프론트엔드 하위 호환)
+            if len(batch) == 1:
+                yield batch[0]
+            elif batch:
+                yield {"status": "processing", "batch": batch}
+            if terminal is not None:
+                yield terminal
+
+            if item is None:
+                item = await queue.get()
+
+        # 워크플로우에서 발생한 예외 전파
+        await pump_task
+    finally:
+        pump_task.cancel()
 
 # 전역 워크플로우 인스턴스 (lazy loading)
 _enhanced_workflow = None
+_workflow_lock = threading.Lock()
 
 
 def get_enhanced_workflow():
-    """EnhancedRAGWorkflow 인스턴스를 lazy loading으로 가져오기"""
+    """EnhancedRAGWorkflow 인스턴스를 lazy loading으로 가져오기
+
+    동시 첫 요청에서 무거운 초기화가 중복 실행되지 않도록 double-checked locking 사용
+    """
     global _enhanced_workflow
     if _enhanced_workflow is None:
-        try:
-            _enhanced_workflow = EnhancedRAGWorkflow()
-            logger.info("EnhancedRAGWorkflow 초기화 완료")
-        except Exception as e:
-            logger.error(f"EnhancedRAGWorkflow 초기화 실패: {str(e)}")
-            raise HTTPException(
-                status_code=503,
-                detail=f"RAG 워크플로우 서비스를 사용할 수 없습니다: {str(e)}",
-            )
+        with _workflow_lock:
+            if _enhanced_workflow is None:
+                try:
+                    _enhanced_workflow = EnhancedRAGWorkflow()
+                    logger.info("EnhancedRAGWorkflow 초기화 완료")
+                except Exception as e:
+                    logger.error(f"EnhancedRAGWorkflow 초기화 실패: {str(e)}")
+                    raise HTTPException(
+                        status_code=503,
+                        detail=f"RAG 워크플로우 서비스를 사용할 수 없습니다: {str(e)}",
+                    )
     return _enhanced_workflow
 
 
+async def warm_up_workflow():
+    """서버 시작 시 백그라운드에서 워크플로우 미리 초기화 (첫 채팅 요청 지연 방지)"""
+    try:
+        await asyncio.to_thread(get_enhanced_workflow)
+    except HTTPException as e:
+        # 초기화 실패 시 첫 요청에서 다시 시도
+        logger.warning(f"워크플로우 사전 초기화 실패: {e.detail}")
+
+
 class ChatQueryRequest(BaseModel):
     query: str
     conversation_id: str = None
@@ -63,28 +145,19 @@ async def chat_stream(
             
             logger.info(f"채팅 요청 - 사용자: {user_id} ({user_name}), 질문: {query[:50]}...")
             
-            # EnhancedRAGWorkflow를 lazy loading으로 가져오기
-            workflow = get_enhanced_workflow()
+            # EnhancedRAGWorkflow를 lazy loading으로 가져오기 (최초 생성이 이벤트 루프를 막지 않도록 스레드에서 실행)
+            workflow = await asyncio.to_thread(get_enhanced_workflow)
 
             # 시작 상태 전송
-            yield f"data: {json.dumps({'status': 'processing', 'message': '답변을 생성하고 있습니다...', 'step': 'start'}, ensure_ascii=False)}\n\n"
-
-            # 진행 상황 콜백 함수
-            async def progress_callback(step: str, message: str, data: dict = None):
-                progress_data = {
-                    "status": "processing",
-                    "step": step,
-                    "message": message,
-                }
-                if data:
-                    progress_data["data"] = data
-                yield f"data: {json.dumps(progress_data, ensure_ascii=False)}\n\n"
-
-            # 워크플로우 실행 (진행 상황 콜백과 함께)
-            async for progress in workflow.chat_with_progress(
-                query=query, user_id=user_id, user_context=parsed_user_context
+            yield _sse({'status': 'processing', 'message': '답변을 생성하고 있습니다...', 'step': 'start'})
+
+            # 워크플로우 실행 (진행 상황 스트리밍)
+            async for progress in _coalesce_progress(
+                workflow.chat_with_progress(
+                    query=query, user_id=user_id, user_context=parsed_user_context
+                )
             ):
-                yield f"data: {json.dumps(progress, ensure_ascii=False)}\n\n"
+                yield _sse(progress)
 
         except HTTPException as he:
             # HTTPException은 그대로 전파
@@ -92,14 +165,14 @@ async def chat_stream(
         except Exception as e:
             logger.error(f"채팅 스트리밍 중 오류: {str(e)}")
             error_response = {"error": str(e), "status": "error"}
-            yield f"data: {json.dumps(error_response, ensure_ascii=False)}\n\n"
+            yield _sse(error_response)
 
-    return StreamingResponse(
+    # keep-alive ping으로 긴 Planning 실행 중 프록시 타임아웃 방지
+    return EventSourceResponse(
         generate_response(),
-        media_type="text/event-stream",
+        ping=15,
         headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
             "Access-Control-Allow-Origin": "*",
         },
     )
@@ -110,8 +183,8 @@ async def chat_stream(
 async def chat_post(request: ChatQueryRequest):
     """일반 POST 채팅 (스트리밍 아님)"""
     try:
-        # EnhancedRAGWorkflow를 lazy loading으로 가져오기
-        workflow = get_enhanced_workflow()
+        # EnhancedRAGWorkflow를 lazy loading으로 가져오기 (warm-up이 lock을 잡고 있어도 이벤트 루프를 막지 않도록 스레드에서 실행)
+        workflow = await asyncio.to_thread(get_enhanced_workflow)
         result = await workflow.chat(query=request.query, user_id=request.user_id)
         return {"response": result, "success": True}
     except HTTPException:
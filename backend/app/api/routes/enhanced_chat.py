@@ -1,44 +1,171 @@
 # app/api/routes/enhanced_chat.py
 
 from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from typing import Dict, List, Optional, Any
+from sse_starlette.sse import EventSourceResponse, ServerSentEvent
+from typing import TYPE_CHECKING, Dict, List, Optional, Any
 from datetime import datetime
+from functools import lru_cache
+import asyncio
 import logging
+import re
+
+import orjson
+from cachetools import TTLCache
+
+if TYPE_CHECKING:
+    from app.services.core.personalized_insight_generator import (
+        PersonalizedInsightGenerator,
+    )
+    from app.services.storage.insight_storage import InsightStorage
+    from app.services.storage.user_memory import UserMemorySystem
+    from app.services.external.hyperclova_client import MultiLLMClient
+    from app.services.core.agents import (
+        SimpleAgent,
+        PlanningAgent,
+        RetrieverAgent,
+        CriticAgent1,
+        ContextIntegratorAgent,
+        ReportGeneratorAgent,
+        ClovaXLLM,
+    )
 
-from app.services.core.personalized_insight_generator import (
-    PersonalizedInsightGenerator,
-)
-from app.services.storage.insight_storage import InsightStorage
-from app.services.storage.user_memory import UserMemorySystem
-from app.services.external.hyperclova_client import MultiLLMClient
-from app.services.core.agents import (
-    SimpleAgent,
-    PlanningAgent,
-    RetrieverAgent,
-    CriticAgent1,
-    ContextIntegratorAgent,
-    ReportGeneratorAgent,
-    ClovaXLLM,
+logger = logging.getLogger(__name__)
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Simple Query 판단/응답 캐시 (정규화된 쿼리 기준, 5분)
+_simple_query_cache: TTLCache = TTLCache(maxsize=2048, ttl=300)
+_simple_response_cache: TTLCache = TTLCache(maxsize=2048, ttl=300)
+
+# 재검색 결과 병합 대상 키
+_MERGE_LIST_KEYS = ("financial_data", "news_data", "market_analysis", "graph_data")
+_MERGE_COUNTER_KEYS = ("successful_queries", "failed_queries")
+
+# 주요 종목명 → 종목코드 매핑
+_STOCK_CODE_MAPPING = {
+    "삼성전자": "005930",
+    "SK하이닉스": "000660",
+    "LG화학": "051910",
+    "현대차": "005380",
+    "NAVER": "035420",
+    "카카오": "035720",
+    "셀트리온": "068270",
+    "현대중공업": "009540",
+    "포스코": "005490",
+    "LG전자": "066570",
+    "KT": "030200",
+    "아모레퍼시픽": "090430",
+}
+
+
+def _build_stock_name_fragments(mapping: Dict[str, str]) -> Dict[str, str]:
+    """종목명의 모든 부분 문자열 → 종목코드 사전 생성 (매핑 순서 우선)"""
+    fragments = {}
+    for name, code in mapping.items():
+        for start in range(len(name)):
+            for end in range(start + 1, len(name) + 1):
+                fragments.setdefault(name[start:end], code)
+    return fragments
+
+
+# 부분 매칭용 종목명 조각 사전
+_STOCK_NAME_FRAGMENTS = _build_stock_name_fragments(_STOCK_CODE_MAPPING)
+
+# 액션 아이템 키워드 및 사전 필터용 첫 글자 집합
+_ACTION_KEYWORDS = ("권장", "제안", "고려", "추천", "검토")
+_ACTION_TRIGGER_CHARS = frozenset(keyword[0] for keyword in _ACTION_KEYWORDS)
+_ACTION_KEYWORD_PATTERN = re.compile("|".join(_ACTION_KEYWORDS))
+
+# LLM 응답 본문에서 JSON 객체 추출용 정규식
+_JSON_OBJECT_PATTERN = re.compile(rb"\{.*\}", re.DOTALL)
+
+# 엔티티 추출용 다중 패턴 정규식 (긴 종목명 우선 매칭)
+_ENTITY_PATTERN = re.compile(
+    "|".join(
+        re.escape(name) for name in sorted(_STOCK_CODE_MAPPING, key=len, reverse=True)
+    )
 )
 
-logger = logging.getLogger(__name__)
-router = APIRouter()
 
-# 전역 인스턴스들
-insight_generator = PersonalizedInsightGenerator()
-insight_storage = InsightStorage()
-user_memory = UserMemorySystem()
-llm_client = MultiLLMClient()
+# 전역 인스턴스들 (무거운 모듈은 첫 사용 시 import 및 생성)
+@lru_cache(maxsize=1)
+def get_insight_generator() -> "PersonalizedInsightGenerator":
+    # 다른 라우터와 같은 인스턴스 (데이터 수집기/Graph RAG 중복 생성 방지)
+    from app.deps import get_insight_generator as get_shared_insight_generator
+
+    return get_shared_insight_generator()
+
+
+@lru_cache(maxsize=1)
+def get_insight_storage() -> "InsightStorage":
+    from app.services.storage.insight_storage import InsightStorage
+
+    return InsightStorage()
+
+
+@lru_cache(maxsize=1)
+def get_user_memory() -> "UserMemorySystem":
+    from app.services.storage.user_memory import UserMemorySystem
+
+    return UserMemorySystem()
+
+
+@lru_cache(maxsize=1)
+def get_llm_client() -> "MultiLLMClient":
+    from app.services.external.hyperclova_client import MultiLLMClient
+
+    return MultiLLMClient()
+
 
 # 새로운 에이전트 워크플로우
-clova_llm = ClovaXLLM()
-simple_agent = SimpleAgent(clova_llm)
-planning_agent = PlanningAgent(clova_llm)
-retriever_agent = RetrieverAgent(llm=clova_llm)
-critic_agent = CriticAgent1(clova_llm)
-context_integrator = ContextIntegratorAgent(clova_llm)
-report_generator = ReportGeneratorAgent(clova_llm)
+@lru_cache(maxsize=1)
+def get_clova_llm() -> "ClovaXLLM":
+    from app.services.core.agents import ClovaXLLM
+
+    return ClovaXLLM()
+
+
+@lru_cache(maxsize=1)
+def get_simple_agent() -> "SimpleAgent":
+    from app.services.core.agents import SimpleAgent
+
+    return SimpleAgent(get_clova_llm())
+
+
+@lru_cache(maxsize=1)
+def get_planning_agent() -> "PlanningAgent":
+    from app.services.core.agents import PlanningAgent
+
+    return PlanningAgent(get_clova_llm())
+
+
+@lru_cache(maxsize=1)
+def get_retriever_agent() -> "RetrieverAgent":
+    from app.services.core.agents import RetrieverAgent
+
+    return RetrieverAgent(llm=get_clova_llm())
+
+
+@lru_cache(maxsize=1)
+def get_critic_agent() -> "CriticAgent1":
+    from app.services.core.agents import CriticAgent1
+
+    return CriticAgent1(get_clova_llm())
+
+
+@lru_cache(maxsize=1)
+def get_context_integrator() -> "ContextIntegratorAgent":
+    from app.services.core.agents import ContextIntegratorAgent
+
+    return ContextIntegratorAgent(get_clova_llm())
+
+
+@lru_cache(maxsize=1)
+def get_report_generator() -> "ReportGeneratorAgent":
+    from app.services.core.agents import ReportGeneratorAgent
+
+    return ReportGeneratorAgent(get_clova_llm())
 
 
 # Request/Response 모델들
@@ -85,46 +212,99 @@ class InsightSearchRequest(BaseModel):
 
 
 @router.post("/chat", response_model=ChatResponse)
-async def enhanced_chat(request: ChatRequest):
+async def enhanced_chat(request: ChatRequest, background_tasks: BackgroundTasks):
     """지능적 Planning-based Graph RAG 채팅 API"""
     try:
-        # 1. 자연어에서 사용자 정보 추출 및 저장 (백그라운드)
-        await _extract_and_save_user_info(request.query, request.user_id)
+        async for event in _run_chat_pipeline(request, background_tasks):
+            if event["phase"] == "done":
+                return event["response"]
+
+    except Exception as e:
+        logger.error(f"채팅 처리 실패: {e}")
+        raise HTTPException(
+            status_code=500, detail=f"채팅 처리 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
+@router.post("/chat/stream")
+async def enhanced_chat_stream(request: ChatRequest, background_tasks: BackgroundTasks):
+    """지능적 Planning-based Graph RAG 채팅 API (SSE 스트리밍)"""
+
+    async def generate_events():
+        try:
+            async for event in _run_chat_pipeline(request, background_tasks):
+                if event["phase"] == "done":
+                    # 리포트 본문은 report_chunk 이벤트로 이미 전송됨
+                    event = {
+                        "phase": "done",
+                        "data": event["response"].model_dump(exclude={"response"}),
+                    }
+                yield ServerSentEvent(data=orjson.dumps(event, default=str).decode())
+
+        except Exception as e:
+            logger.error(f"채팅 스트리밍 처리 실패: {e}")
+            yield ServerSentEvent(
+                data=orjson.dumps({"phase": "error", "error": str(e)}).decode()
+            )
+
+    return EventSourceResponse(generate_events(), ping=15)
 
-        # 2. 사용자 컨텍스트 수집
-        user_context = await user_memory.get_user_context(request.user_id)
 
-        # 3. Simple Query 체크 (빠른 응답 가능한 질문)
-        is_simple = await simple_agent.is_simple_query(request.query)
+async def _run_chat_pipeline(request: ChatRequest, background_tasks: BackgroundTasks):
+    """채팅 처리 파이프라인 (단계별 이벤트 yield, 마지막 done 이벤트에 최종 응답 포함)"""
+    # 1. Simple Query 체크 (빠른 응답 가능한 질문은 다른 단계를 모두 생략)
+    is_simple = await _is_simple_query(request.query)
 
-        if is_simple:
-            # Simple 응답 (외부 검색 불필요)
-            logger.info(f"Simple Query 감지: {request.query[:50]}...")
-            simple_response = await simple_agent.generate_simple_response(request.query)
+    if is_simple:
+        # Simple 응답 (외부 검색 불필요)
+        logger.info(f"Simple Query 감지: {request.query[:50]}...")
+        simple_response = await _generate_simple_response(request.query)
+        yield {"phase": "report_chunk", "text": simple_response}
 
-            return ChatResponse(
+        yield {
+            "phase": "done",
+            "response": ChatResponse(
                 response=simple_response,
                 response_type="simple",
                 generated_at=datetime.now().isoformat(),
-            )
+            ),
+        }
+        return
+
+    # 2. 자연어에서 사용자 정보 추출 및 저장 (백그라운드)
+    background_tasks.add_task(
+        _extract_and_save_user_info, request.query, request.user_id
+    )
 
+    # 3. 사용자 컨텍스트 수집 (통합 단계 전까지 Planning/검색과 병행)
+    user_context_task = asyncio.create_task(
+        get_user_memory().get_user_context(request.user_id)
+    )
+
+    # Planning/검색/평가 중 예외 또는 스트림 클라이언트 연결 종료 시 컨텍스트 태스크 정리
+    try:
         # 4. Complex Query - Planning Phase
         logger.info(f"Complex Query 감지: {request.query[:50]}...")
 
         # Planning: 지능적 쿼리 분해 및 도구 기반 계획 수립
-        query_plan = await planning_agent.plan(request.query)
+        query_plan = await get_planning_agent().plan(request.query)
         logger.info(
             f"Planning 결과: {len(query_plan)}개 쿼리, 도구: {[q['tool'] for q in query_plan]}"
         )
+        yield {"phase": "plan", "data": query_plan}
 
         # 5. Information Retrieval Phase (향상된 병렬 검색)
-        retrieved_results = await retriever_agent.retrieve(query_plan)
+        retrieved_results = await get_retriever_agent().retrieve(query_plan)
         logger.info(
             f"정보 검색 완료: 성공 {retrieved_results['metadata']['successful_queries']}, 실패 {retrieved_results['metadata']['failed_queries']}"
         )
+        yield {"phase": "retrieval", "data": retrieved_results["metadata"]}
 
         # 6. Critical Evaluation Phase
-        critic_result = await critic_agent.evaluate(retrieved_results, request.query)
+        critic_result = await get_critic_agent().evaluate(
+            retrieved_results, request.query
+        )
+        yield {"phase": "critic", "data": critic_result}
 
         # 7. Re-planning if needed (정보 부족 시)
         iteration_count = 0
@@ -137,118 +317,170 @@ async def enhanced_chat(request: ChatRequest):
             logger.info(f"정보 부족으로 재검색 시작 (반복 {iteration_count + 1})")
 
             # 추가 검색 계획 (피드백 반영)
-            additional_query_plan = await planning_agent.plan(
+            additional_query_plan = await get_planning_agent().plan(
                 request.query, critic_feedback=critic_result.get("feedback", "")
             )
 
             # 추가 정보 검색
-            additional_results = await retriever_agent.retrieve(additional_query_plan)
+            additional_results = await get_retriever_agent().retrieve(
+                additional_query_plan
+            )
 
             # 결과 병합
-            for key in ["financial_data", "news_data", "market_analysis", "graph_data"]:
-                retrieved_results[key].extend(additional_results.get(key, []))
-
-            retrieved_results["metadata"]["successful_queries"] += additional_results[
-                "metadata"
-            ]["successful_queries"]
-            retrieved_results["metadata"]["failed_queries"] += additional_results[
-                "metadata"
-            ]["failed_queries"]
+            _merge_retrieved_results(retrieved_results, additional_results)
 
             # 재평가
-            critic_result = await critic_agent.evaluate(
+            critic_result = await get_critic_agent().evaluate(
                 retrieved_results, request.query
             )
             iteration_count += 1
+            yield {"phase": "critic", "data": critic_result}
 
         # 8. Context Integration Phase
-        integrated_context = context_integrator.integrate(
-            retrieved_results, user_context
+        user_context = await user_context_task
+    finally:
+        if not user_context_task.done():
+            user_context_task.cancel()
+        elif not user_context_task.cancelled():
+            user_context_task.exception()  # 미회수 예외 경고 방지
+
+    integrated_context = get_context_integrator().integrate(
+        retrieved_results, user_context
+    )
+    logger.info("컨텍스트 통합 완료")
+
+    # 9. Final Report Generation Phase (청크 단위 전송)
+    report_chunks = []
+    async for chunk in get_report_generator().generate_iter(
+        integrated_context, user_context
+    ):
+        report_chunks.append(chunk)
+        yield {"phase": "report_chunk", "text": chunk}
+    final_report = "".join(report_chunks)
+    logger.info("최종 리포트 생성 완료")
+
+    # 엔티티는 한 번만 추출해 저장/응답에 공통 사용
+    graph_entities = _extract_entities_from_results(retrieved_results)
+
+    # 10. Insight Storage (백그라운드)
+    try:
+        insight_id = await get_insight_storage().store_insight(
+            insight_content=final_report,
+            user_query=request.query,
+            user_id=request.user_id,
+            entities=graph_entities,
+            metadata={
+                "planning_based": True,
+                "sub_queries_count": len(query_plan),
+                "iteration_count": iteration_count,
+                "tools_used": retrieved_results["metadata"]["tools_used"],
+                "sufficiency_score": (
+                    1.0 if critic_result.get("sufficiency", True) else 0.5
+                ),
+            },
         )
-        logger.info("컨텍스트 통합 완료")
+    except Exception as e:
+        logger.error(f"인사이트 저장 실패: {e}")
+        insight_id = None
 
-        # 9. Final Report Generation Phase
-        final_report = report_generator.generate(integrated_context, user_context)
-        logger.info("최종 리포트 생성 완료")
+    # 11. Response Construction
+    response = ChatResponse(
+        response=final_report,
+        insight_id=insight_id,
+        action_items=_extract_action_items_from_report(final_report),
+        graph_entities=graph_entities,
+        response_type="complex",
+        generated_at=datetime.now().isoformat(),
+    )
 
-        # 10. Insight Storage (백그라운드)
-        try:
-            insight_id = await insight_storage.store_insight(
-                insight_content=final_report,
-                user_query=request.query,
-                user_id=request.user_id,
-                entities=_extract_entities_from_results(retrieved_results),
-                metadata={
-                    "planning_based": True,
-                    "sub_queries_count": len(query_plan),
-                    "iteration_count": iteration_count,
-                    "tools_used": retrieved_results["metadata"]["tools_used"],
-                    "sufficiency_score": (
-                        1.0 if critic_result.get("sufficiency", True) else 0.5
-                    ),
-                },
-            )
-        except Exception as e:
-            logger.error(f"인사이트 저장 실패: {e}")
-            insight_id = None
-
-        # 11. Response Construction
-        response = ChatResponse(
-            response=final_report,
-            insight_id=insight_id,
-            action_items=_extract_action_items_from_report(final_report),
-            graph_entities=_extract_entities_from_results(retrieved_results),
-            response_type="complex",
-            generated_at=datetime.now().isoformat(),
-        )
+    logger.info(
+        f"Planning-based 채팅 완료: {request.user_id} (반복: {iteration_count})"
+    )
+    yield {"phase": "done", "response": response}
 
-        logger.info(
-            f"Planning-based 채팅 완료: {request.user_id} (반복: {iteration_count})"
-        )
-        return response
 
-    except Exception as e:
-        logger.error(f"채팅 처리 실패: {e}")
-        raise HTTPException(
-            status_code=500, detail=f"채팅 처리 중 오류가 발생했습니다: {str(e)}"
-        )
+def _merge_retrieved_results(target: Dict, additional: Dict) -> None:
+    """재검색 결과를 기존 검색 결과에 병합"""
+    for key in _MERGE_LIST_KEYS:
+        target[key] += additional.get(key, [])
+
+    metadata = target["metadata"]
+    additional_metadata = additional["metadata"]
+    for key in _MERGE_COUNTER_KEYS:
+        metadata[key] += additional_metadata[key]
+
+
+def _normalize_query(query: str) -> str:
+    """캐시 키용 쿼리 정규화"""
+    return query.strip().lower()
+
+
+async def _is_simple_query(query: str) -> bool:
+    """Simple Query 여부 판단 (동일 질문은 캐시된 결과 재사용)"""
+    key = _normalize_query(query)
+    cached = _simple_query_cache.get(key)
+    if cached is None:
+        cached = await get_simple_agent().is_simple_query(query)
+        _simple_query_cache[key] = cached
+    return cached
+
+
+async def _generate_simple_response(query: str) -> str:
+    """Simple 응답 생성 (동일 질문은 캐시된 응답 재사용)"""
+    key = _normalize_query(query)
+    cached = _simple_response_cache.get(key)
+    if cached is None:
+        cached = await get_simple_agent().generate_simple_response(query)
+        _simple_response_cache[key] = cached
+    return cached
 
 
 def _extract_entities_from_results(results: List[Dict]) -> List[str]:
     """검색 결과에서 엔티티 추출"""
-    entities = []
-    for result in results:
-        # 각 결과에서 엔티티 추출 로직
-        if "삼성전자" in str(result):
-            entities.append("삼성전자")
-        if "LG전자" in str(result):
-            entities.append("LG전자")
-        if "SK하이닉스" in str(result):
-            entities.append("SK하이닉스")
-        # 더 많은 엔티티 추출 로직 추가 가능
+    if not results:
+        return []
+
+    # 결과 전체를 orjson으로 한 번만 직렬화한 뒤 다중 패턴 정규식으로 한 번에 스캔
+    try:
+        text = orjson.dumps(
+            results, default=str, option=orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8", "ignore")
+    except TypeError:
+        # 직렬화 불가 구조(64비트 초과 정수, 과도한 중첩 등)는 str()로 대체
+        text = str(results)
 
-    return list(set(entities))
+    # 등장 순서를 유지하며 중복 제거
+    return list(
+        dict.fromkeys(match.group() for match in _ENTITY_PATTERN.finditer(text))
+    )
 
 
 def _extract_action_items_from_report(report: str) -> List[Dict]:
     """리포트에서 액션 아이템 추출"""
+    # 의미있는 액션 아이템을 담을 수 없는 짧은 리포트는 스캔 생략
+    if not report or len(report) < 20:
+        return []
+
     action_items = []
 
-    # 간단한 패턴 매칭으로 액션 아이템 추출
-    lines = report.split("\n")
-    for line in lines:
-        if any(
-            keyword in line.lower()
-            for keyword in ["권장", "제안", "고려", "추천", "검토"]
-        ):
-            if len(line.strip()) > 10:  # 의미있는 길이
-                action_items.append(
-                    {
-                        "action": line.strip(),
-                        "priority": "medium",
-                        "category": "investment_suggestion",
-                    }
-                )
+    # 키워드 첫 글자가 없는 줄은 정규식 검사 없이 건너뜀
+    for line in report.split("\n"):
+        if _ACTION_TRIGGER_CHARS.isdisjoint(line):
+            continue
+        if not _ACTION_KEYWORD_PATTERN.search(line):
+            continue
+
+        action = line.strip()
+        if len(action) > 10:  # 의미있는 길이
+            action_items.append(
+                {
+                    "action": action,
+                    "priority": "medium",
+                    "category": "investment_suggestion",
+                }
+            )
+            if len(action_items) == 5:
+                break
 
     return action_items[:5]  # 최대 5개
 
@@ -289,32 +521,30 @@ async def _extract_and_save_user_info(query: str, user_id: str):
 
 정보가 없으면 extracted: false로 응답하세요."""
 
-        if llm_client.is_available():
-            response = llm_client.chat_completion(
+        if get_llm_client().is_available():
+            response = get_llm_client().chat_completion(
                 messages=[{"role": "user", "content": extraction_prompt}],
                 temperature=0.1,
                 max_tokens=1000,
             )
 
             if response and response.get_content():
-                import json
-                import re
-
                 content = response.get_content()
 
-                # JSON 추출
-                json_pattern = r"\{.*?\}"
-                matches = re.search(json_pattern, content, re.DOTALL)
-
-                if matches:
-                    extracted_data = json.loads(matches.group())
+                # JSON 추출 (응답 전체가 JSON이면 바로 파싱, 아니면 객체 부분만 추출)
+                try:
+                    extracted_data = orjson.loads(content)
+                except orjson.JSONDecodeError:
+                    matches = _JSON_OBJECT_PATTERN.search(content.encode())
+                    extracted_data = orjson.loads(matches.group()) if matches else None
 
+                if isinstance(extracted_data, dict):
                     if extracted_data.get("extracted"):
                         # 개인 정보 저장
                         personal_info = extracted_data.get("personal_info", {})
                         if any(personal_info.values()):
                             # 기존 프로필과 병합
-                            existing_profile = await user_memory.get_user_profile(
+                            existing_profile = await get_user_memory().get_user_profile(
                                 user_id
                             )
 
@@ -358,10 +588,10 @@ async def _extract_and_save_user_info(query: str, user_id: str):
 
                             # 중복 제거
                             profile_data["investment_goals"] = list(
-                                set(profile_data["investment_goals"])
+                                dict.fromkeys(profile_data["investment_goals"])
                             )
 
-                            await user_memory.create_user_profile(profile_data)
+                            await get_user_memory().create_user_profile(profile_data)
                             logger.info(f"사용자 정보 자동 추출 및 저장: {user_id}")
 
                         # 보유 주식 저장
@@ -384,7 +614,9 @@ async def _extract_and_save_user_info(query: str, user_id: str):
                                     "sector": holding.get("sector"),
                                 }
 
-                                await user_memory.add_holding(user_id, holding_data)
+                                await get_user_memory().add_holding(
+                                    user_id, holding_data
+                                )
                                 logger.info(
                                     f"보유 주식 자동 추출 및 저장: {user_id} - {holding.get('stock_name')}"
                                 )
@@ -396,25 +628,15 @@ async def _extract_and_save_user_info(query: str, user_id: str):
 
 def _estimate_stock_code(stock_name: str) -> str:
     """주식명으로 종목코드 추정 (간단한 매핑)"""
-    stock_mapping = {
-        "삼성전자": "005930",
-        "SK하이닉스": "000660",
-        "LG화학": "051910",
-        "현대차": "005380",
-        "NAVER": "035420",
-        "카카오": "035720",
-        "셀트리온": "068270",
-        "현대중공업": "009540",
-        "포스코": "005490",
-        "LG전자": "066570",
-        "KT": "030200",
-        "아모레퍼시픽": "090430",
-    }
-
-    # 부분 매칭
-    for name, code in stock_mapping.items():
-        if name in stock_name or stock_name in name:
-            return code
+    # 입력이 종목명 전체 또는 일부인 경우 (예: "하이닉스") - 사전 조회
+    code = _STOCK_NAME_FRAGMENTS.get(stock_name)
+    if code:
+        return code
+
+    # 입력에 종목명이 포함된 경우 (예: "삼성전자우") - 정규식 한 번의 스캔
+    match = _ENTITY_PATTERN.search(stock_name)
+    if match:
+        return _STOCK_CODE_MAPPING[match.group()]
 
     return "000000"  # 기본값
 
@@ -432,7 +654,7 @@ async def create_user_profile(request: UserProfileRequest):
             "investment_goals": request.investment_goals,
         }
 
-        success = await user_memory.create_user_profile(user_data)
+        success = await get_user_memory().create_user_profile(user_data)
 
         if success:
             return {"message": "사용자 프로필이 성공적으로 생성/업데이트되었습니다."}
@@ -448,7 +670,7 @@ async def create_user_profile(request: UserProfileRequest):
 async def get_user_profile(user_id: str):
     """사용자 프로필 조회"""
     try:
-        profile = await user_memory.get_user_profile(user_id)
+        profile = await get_user_memory().get_user_profile(user_id)
 
         if profile:
             return profile
@@ -475,7 +697,7 @@ async def add_user_holding(request: StockHoldingRequest):
             "sector": request.sector,
         }
 
-        success = await user_memory.add_holding(request.user_id, holding_data)
+        success = await get_user_memory().add_holding(request.user_id, holding_data)
 
         if success:
             return {"message": f"{request.stock_name} 보유 정보가 추가되었습니다."}
@@ -493,7 +715,7 @@ async def add_user_holding(request: StockHoldingRequest):
 async def get_user_holdings(user_id: str):
     """사용자 보유 주식 조회"""
     try:
-        holdings = await user_memory.get_user_holdings(user_id)
+        holdings = await get_user_memory().get_user_holdings(user_id)
         return {"holdings": holdings, "count": len(holdings)}
 
     except Exception as e:
@@ -505,7 +727,7 @@ async def get_user_holdings(user_id: str):
 async def get_user_context(user_id: str, session_id: Optional[str] = None):
     """사용자 전체 컨텍스트 조회"""
     try:
-        context = await user_memory.get_user_context(user_id, session_id)
+        context = await get_user_memory().get_user_context(user_id, session_id)
         return context
 
     except Exception as e:
@@ -517,7 +739,7 @@ async def get_user_context(user_id: str, session_id: Optional[str] = None):
 async def search_insights(request: InsightSearchRequest):
     """인사이트 검색"""
     try:
-        results = await insight_storage.search_insights(
+        results = await get_insight_storage().search_insights(
             query=request.query,
             user_id=request.user_id,
             entities=request.entities,
@@ -536,7 +758,7 @@ async def search_insights(request: InsightSearchRequest):
 async def get_insight(insight_id: str):
     """특정 인사이트 조회"""
     try:
-        insight = await insight_storage.get_insight_by_id(insight_id)
+        insight = await get_insight_storage().get_insight_by_id(insight_id)
 
         if insight:
             return insight
@@ -552,7 +774,7 @@ async def get_insight(insight_id: str):
 async def get_user_insights(user_id: str, limit: int = 20):
     """사용자별 인사이트 목록"""
     try:
-        insights = await insight_storage.get_user_insights(user_id, limit)
+        insights = await get_insight_storage().get_user_insights(user_id, limit)
         return {"insights": insights, "count": len(insights)}
 
     except Exception as e:
@@ -566,7 +788,7 @@ async def get_conversation_history(
 ):
     """대화 이력 조회"""
     try:
-        conversations = await user_memory.get_conversation_history(
+        conversations = await get_user_memory().get_conversation_history(
             user_id, session_id, limit
         )
         return {"conversations": conversations, "count": len(conversations)}
@@ -595,7 +817,7 @@ async def _generate_daily_insight_background(user_id: str):
     try:
         query = f"오늘의 시장 상황과 내 포트폴리오 분석 - {datetime.now().strftime('%Y-%m-%d')}"
 
-        result = await insight_generator.generate_daily_insight(
+        result = await get_insight_generator().generate_daily_insight(
             user_id=user_id, query=query
         )
 
@@ -610,12 +832,18 @@ async def health_check():
     """시스템 상태 확인"""
     try:
         # 각 시스템 상태 확인
+        # 아직 생성되지 않은 서비스는 강제로 초기화하지 않음
+        def _service_status(accessor) -> str:
+            return (
+                "operational" if accessor.cache_info().currsize else "not_initialized"
+            )
+
         status = {
             "timestamp": datetime.now().isoformat(),
             "services": {
-                "insight_generator": "operational",
-                "insight_storage": "operational",
-                "user_memory": "operational",
+                "insight_generator": _service_status(get_insight_generator),
+                "insight_storage": _service_status(get_insight_storage),
+                "user_memory": _service_status(get_user_memory),
                 "graph_rag": "operational",
             },
         }
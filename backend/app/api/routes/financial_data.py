@@ -1,65 +1,130 @@
 # app/api/routes/financial_data.py
-from fastapi import APIRouter, HTTPException, Query
+import asyncio
+import operator
+import msgspec
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from typing import List, Optional
+from cachetools import TTLCache
+from pydantic import BaseModel
 from app.services.storage.enhanced_data_collector import EnhancedDataCollector
-from app.models.responses import NewsItem, DisclosureItem
+from app.deps import get_data_collector
+from app.api.http_cache import etag_response, get_or_fetch
+from app.models.responses import NewsItem, DisclosureItem, NewsOut, DisclosureOut
 from app.models.user_models import StockPrice
 
-router = APIRouter()
-data_collector = EnhancedDataCollector()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
-@router.get("/news", response_model=List[dict])
+def _row_struct(name: str, model: type[BaseModel]) -> type[msgspec.Struct]:
+    """pydantic 응답 모델과 같은 필드(순서/타입)의 msgspec Struct 생성 (직접 직렬화용)"""
+    fields = [(field, info.annotation) for field, info in model.model_fields.items()]
+    return msgspec.defstruct(name, fields, module=__name__)
+
+
+# 응답 모델 필드가 바뀌면 행 구조도 자동으로 따라감
+NewsRow = _row_struct("NewsRow", NewsOut)
+DisclosureRow = _row_struct("DisclosureRow", DisclosureOut)
+StockRow = _row_struct("StockRow", StockPrice)
+
+
+_get_news_fields = operator.attrgetter(*NewsRow.__struct_fields__)
+_get_disclosure_fields = operator.attrgetter(*DisclosureRow.__struct_fields__)
+_get_stock_fields = operator.attrgetter(*StockRow.__struct_fields__)
+
+
+def _news_row(news: NewsItem) -> NewsRow:
+    return NewsRow(*_get_news_fields(news))
+
+
+def _disclosure_row(disclosure: DisclosureItem) -> DisclosureRow:
+    return DisclosureRow(*_get_disclosure_fields(disclosure))
+
+
+def _stock_row(stock: StockPrice) -> StockRow:
+    return StockRow(*_get_stock_fields(stock))
+
+
+_ndjson_encoder = msgspec.json.Encoder()
+
+# 라우트별 응답 캐시 (쿼리 파라미터 기준)
+news_cache = TTLCache(maxsize=32, ttl=60)
+disc_cache = TTLCache(maxsize=32, ttl=120)
+stock_cache = TTLCache(maxsize=64, ttl=15)
+all_cache = TTLCache(maxsize=32, ttl=60)
+
+
+@router.get("/news", response_model=List[NewsOut])
 async def get_financial_news(
+    request: Request,
     limit: int = Query(default=10, ge=1, le=50, description="뉴스 개수 (1-50)"),
     use_playwright: bool = Query(default=True, description="Playwright 사용 여부"),
+    refresh_cache: bool = Query(default=False, description="캐시 새로고침 여부"),
+    data_collector: EnhancedDataCollector = Depends(get_data_collector),
 ):
     """실시간 금융 뉴스 수집"""
     try:
-        news_data = data_collector.collect_comprehensive_news(
-            limit=limit, use_playwright=use_playwright
+        payload = await get_or_fetch(
+            news_cache,
+            (limit, use_playwright),
+            lambda: _fetch_news(data_collector, limit, use_playwright),
+            refresh=refresh_cache,
         )
-
-        return [
-            {
-                "title": news.title,
-                "summary": news.summary,
-                "source": news.source,
-                "published_at": news.published_at,
-                "entities": news.entities,
-                "importance_score": news.importance_score,
-            }
-            for news in news_data
-        ]
+        return etag_response(request, payload, max_age=int(news_cache.ttl))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"뉴스 수집 실패: {str(e)}")
 
 
-@router.get("/disclosures", response_model=List[dict])
+async def _fetch_news(
+    data_collector: EnhancedDataCollector, limit: int, use_playwright: bool
+) -> List[NewsRow]:
+    """뉴스 수집 후 응답 형태로 변환"""
+    news_data = await data_collector.collect_comprehensive_news_async(
+        limit=limit,
+        use_playwright=use_playwright,
+    )
+
+    return [_news_row(news) for news in news_data]
+
+
+@router.get("/disclosures", response_model=List[DisclosureOut])
 async def get_disclosures(
-    limit: int = Query(default=20, ge=1, le=100, description="공시 개수 (1-100)")
+    request: Request,
+    limit: int = Query(default=20, ge=1, le=100, description="공시 개수 (1-100)"),
+    refresh_cache: bool = Query(default=False, description="캐시 새로고침 여부"),
+    data_collector: EnhancedDataCollector = Depends(get_data_collector),
 ):
     """DART 공시 정보 수집"""
     try:
-        disclosures = data_collector.collect_comprehensive_disclosures(limit=limit)
-
-        return [
-            {
-                "company": disclosure.company,
-                "title": disclosure.title,
-                "date": disclosure.date,
-                "type": disclosure.type,
-                "importance_score": disclosure.importance_score,
-            }
-            for disclosure in disclosures
-        ]
+        payload = await get_or_fetch(
+            disc_cache,
+            limit,
+            lambda: _fetch_disclosures(data_collector, limit),
+            refresh=refresh_cache,
+        )
+        return etag_response(request, payload, max_age=int(disc_cache.ttl))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"공시 수집 실패: {str(e)}")
 
 
-@router.get("/stocks", response_model=List[dict])
+async def _fetch_disclosures(
+    data_collector: EnhancedDataCollector, limit: int
+) -> List[DisclosureRow]:
+    """공시 수집 후 응답 형태로 변환"""
+    disclosures = await asyncio.to_thread(
+        data_collector.collect_comprehensive_disclosures, limit=limit
+    )
+
+    return [_disclosure_row(d) for d in disclosures]
+
+
+@router.get("/stocks", response_model=List[StockPrice])
 async def get_stock_data(
-    symbols: Optional[str] = Query(default=None, description="종목 코드 (쉼표로 구분)")
+    request: Request,
+    symbols: Optional[str] = Query(default=None, description="종목 코드 (쉼표로 구분)"),
+    refresh_cache: bool = Query(default=False, description="캐시 새로고침 여부"),
+    data_collector: EnhancedDataCollector = Depends(get_data_collector),
 ):
     """주식 시세 데이터 수집"""
     try:
@@ -67,96 +132,177 @@ async def get_stock_data(
         if symbols:
             symbol_list = [s.strip() for s in symbols.split(",")]
 
-        stock_data = data_collector.collect_comprehensive_stock_data(symbol_list)
-
-        return [
-            {
-                "symbol": stock.symbol,
-                "company_name": stock.company_name,
-                "price": stock.price,
-                "change_amount": stock.change_amount,
-                "change_percent": stock.change_percent,
-                "volume": stock.volume,
-                "market_cap": stock.market_cap,
-                "date": stock.date,
-            }
-            for stock in stock_data
-        ]
+        payload = await get_or_fetch(
+            stock_cache,
+            tuple(symbol_list) if symbol_list else None,
+            lambda: _fetch_stocks(data_collector, symbol_list),
+            refresh=refresh_cache,
+        )
+        return etag_response(request, payload, max_age=int(stock_cache.ttl))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"주식 데이터 수집 실패: {str(e)}")
 
 
+async def _fetch_stocks(
+    data_collector: EnhancedDataCollector, symbol_list: Optional[List[str]]
+) -> List[StockRow]:
+    """주식 시세 수집 후 응답 형태로 변환"""
+    stock_data = await data_collector.collect_comprehensive_stock_data_async(
+        symbol_list
+    )
+
+    return [_stock_row(stock) for stock in stock_data]
+
+
 @router.get("/all")
 async def get_all_financial_data(
+    request: Request,
     user_id: Optional[str] = Query(default=None, description="사용자 ID (개인화용)"),
     refresh_cache: bool = Query(default=False, description="캐시 새로고침 여부"),
     use_playwright: bool = Query(default=True, description="Playwright 사용 여부"),
+    data_collector: EnhancedDataCollector = Depends(get_data_collector),
 ):
     """전체 금융 데이터 수집 (뉴스 + 공시 + 주식)"""
     try:
-        all_data = data_collector.collect_all_data(
-            user_id=user_id, refresh_cache=refresh_cache, use_playwright=use_playwright
+        payload = await get_or_fetch(
+            all_cache,
+            (user_id, use_playwright),
+            lambda: _fetch_all(data_collector, user_id, refresh_cache, use_playwright),
+            refresh=refresh_cache,
         )
+        return etag_response(request, payload, max_age=int(all_cache.ttl))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"전체 데이터 수집 실패: {str(e)}")
 
-        # 응답 데이터 변환
-        response_data = {
-            "news": [
-                {
-                    "title": news.title,
-                    "summary": news.summary,
-                    "source": news.source,
-                    "published_at": news.published_at,
-                    "entities": news.entities,
-                    "importance_score": news.importance_score,
-                }
-                for news in all_data.get("news", [])
-            ],
-            "disclosures": [
-                {
-                    "company": disclosure.company,
-                    "title": disclosure.title,
-                    "date": disclosure.date,
-                    "type": disclosure.type,
-                    "importance_score": disclosure.importance_score,
-                }
-                for disclosure in all_data.get("disclosures", [])
-            ],
-            "stock_data": [
-                {
-                    "symbol": stock.symbol,
-                    "company_name": stock.company_name,
-                    "price": stock.price,
-                    "change_amount": stock.change_amount,
-                    "change_percent": stock.change_percent,
-                    "volume": stock.volume,
-                    "market_cap": stock.market_cap,
-                    "date": stock.date,
-                }
-                for stock in all_data.get("stock_data", [])
-            ],
-            "personalized": all_data.get("personalized", {}),
-            "collected_at": all_data.get("collected_at"),
-            "data_sources": all_data.get("data_sources", {}),
-        }
 
-        return response_data
+async def _fetch_all(
+    data_collector: EnhancedDataCollector,
+    user_id: Optional[str],
+    refresh_cache: bool,
+    use_playwright: bool,
+) -> dict:
+    """전체 데이터 수집 후 응답 형태로 변환"""
+    all_data = await data_collector.collect_all_data_async(
+        user_id=user_id,
+        refresh_cache=refresh_cache,
+        use_playwright=use_playwright,
+    )
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"전체 데이터 수집 실패: {str(e)}")
+    # 응답 데이터 변환
+    response_data = {
+        "news": [_news_row(news) for news in all_data.get("news", [])],
+        "disclosures": [_disclosure_row(d) for d in all_data.get("disclosures", [])],
+        "stock_data": [_stock_row(stock) for stock in all_data.get("stock_data", [])],
+        "personalized": all_data.get("personalized", {}),
+        "collected_at": all_data.get("collected_at"),
+        "data_sources": all_data.get("data_sources", {}),
+    }
 
+    return response_data
 
-@router.get("/test")
-async def test_data_collection():
-    """데이터 수집 기능 테스트"""
+
+@router.get("/all/stream")
+async def stream_all_financial_data(
+    user_id: Optional[str] = Query(default=None, description="사용자 ID (개인화용)"),
+    refresh_cache: bool = Query(default=False, description="캐시 새로고침 여부"),
+    use_playwright: bool = Query(default=True, description="Playwright 사용 여부"),
+    data_collector: EnhancedDataCollector = Depends(get_data_collector),
+):
+    """전체 금융 데이터 NDJSON 스트리밍 (섹션별 수집이 끝나는 순서대로 전송)"""
+
+    def to_rows(section: str, items: List) -> List[dict]:
+        return [{"section": section, "item": item} for item in items]
+
+    async def news_rows():
+        news = await get_or_fetch(
+            news_cache,
+            (10, use_playwright),
+            lambda: _fetch_news(data_collector, 10, use_playwright),
+            refresh=refresh_cache,
+        )
+        return to_rows("news", news)
+
+    async def disclosure_rows():
+        disclosures = await get_or_fetch(
+            disc_cache,
+            10,
+            lambda: _fetch_disclosures(data_collector, 10),
+            refresh=refresh_cache,
+        )
+        return to_rows("disclosures", disclosures)
+
+    async def personalized_and_stock_rows():
+        # 주식 종목 리스트가 포트폴리오에 의존하므로 순차 실행
+        personalized_data = {}
+        if user_id:
+            personalized_data = await asyncio.to_thread(
+                data_collector.get_personalized_data, user_id
+            )
+        symbol_list = data_collector._build_stock_symbols(personalized_data)
+        stock_data = await get_or_fetch(
+            stock_cache,
+            tuple(symbol_list),
+            lambda: _fetch_stocks(data_collector, symbol_list),
+            refresh=refresh_cache,
+        )
+        return to_rows("personalized", [personalized_data]) + to_rows(
+            "stock_data", stock_data
+        )
+
+    async def guarded(section: str, rows_coro):
+        try:
+            return await rows_coro
+        except Exception as e:
+            return [{"section": section, "error": str(e)}]
+
+    async def ndjson_gen():
+        tasks = [
+            asyncio.create_task(guarded("news", news_rows())),
+            asyncio.create_task(guarded("disclosures", disclosure_rows())),
+            asyncio.create_task(guarded("stock_data", personalized_and_stock_rows())),
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                for row in await next_done:
+                    yield _ndjson_encoder.encode(row) + b"\n"
+
+            yield _ndjson_encoder.encode(
+                {"section": "done", "collected_at": datetime.now().isoformat()}
+            ) + b"\n"
+        finally:
+            # 클라이언트 연결이 끊기면 남은 수집 작업 취소
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(ndjson_gen(), media_type="application/x-ndjson")
+
+
+# 백그라운드 프로브 결과가 아직 없을 때의 응답
+PROBE_PENDING = {"status": "pending", "message": "헬스 프로브 대기 중"}
+
+
+async def probe_data_collection(data_collector: EnhancedDataCollector) -> dict:
+    """데이터 수집 헬스 프로브 (lifespan 백그라운드 작업에서 주기 실행)"""
     try:
-        # 간단한 테스트 데이터 수집
-        news = data_collector.collect_comprehensive_news(limit=3, use_playwright=False)
+        # 뉴스 목록 1페이지만 조회/파싱 (뉴스 DB·Graph DB는 변경하지 않음)
+        news = await data_collector.probe_news_source(limit=3)
 
         return {
             "status": "success",
             "message": "데이터 수집 테스트 완료",
             "news_count": len(news),
             "sample_news": news[0].title if news else "뉴스 없음",
+            "checked_at": datetime.now().isoformat(),
         }
     except Exception as e:
-        return {"status": "error", "message": f"테스트 실패: {str(e)}"}
+        return {
+            "status": "error",
+            "message": f"테스트 실패: {str(e)}",
+            "checked_at": datetime.now().isoformat(),
+        }
+
+
+@router.get("/test")
+async def test_data_collection(request: Request):
+    """데이터 수집 상태 (마지막 백그라운드 프로브 결과)"""
+    return getattr(request.app.state, "last_news_health", None) or PROBE_PENDING
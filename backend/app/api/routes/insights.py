@@ -1,26 +1,127 @@
 # app/api/routes/insights.py (개선된 버전)
-from fastapi import APIRouter, HTTPException, Query, Request
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from sse_starlette.sse import EventSourceResponse, ServerSentEvent
 import asyncio
-import json
+import hashlib
+import orjson
 import os
 import logging
-from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import Annotated, Optional, Dict, Any, Tuple
+from cachetools import TTLCache
+import msgspec
 from app.services.core.personalized_insight_generator import (
     PersonalizedInsightGenerator,
+    get_portfolio_symbols,
 )
 from app.services.core.enhanced_graph_rag import EnhancedGraphRAG
+from app.services.core.insight_batcher import InsightBatcher
 from app.services.storage.enhanced_data_collector import EnhancedDataCollector
 from app.services.external.aistudios_service import VideoGenerationService
+from app.deps import (
+    get_data_collector,
+    get_graph_rag,
+    get_insight_batcher,
+    get_insight_generator,
+)
+from app.api.http_cache import etag_response, get_or_fetch
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
-insight_generator = PersonalizedInsightGenerator()
-enhanced_graph_rag = EnhancedGraphRAG()
-data_collector = EnhancedDataCollector()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# 사용자별 금융 데이터 묶음 캐시 (분석 엔드포인트 연속 호출 시 재수집 방지)
+bundle_cache = TTLCache(maxsize=128, ttl=30)
+
+
+async def _load_financial_bundle(
+    data_collector: EnhancedDataCollector, user_id: Optional[str]
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """(financial_data, user_profile) 반환, user_id별 30초 캐시"""
+
+    async def fetch():
+        financial_data = await data_collector.collect_all_data_async(user_id=user_id)
+        # collect_all_data_async가 이미 조회한 개인화 데이터 재사용
+        return financial_data, financial_data.get("personalized", {})
+
+    return await get_or_fetch(bundle_cache, user_id, fetch)
+
+
+async def financial_bundle(
+    user_id: Optional[str] = None,
+    data_collector: EnhancedDataCollector = Depends(get_data_collector),
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """분석 엔드포인트 공용 금융 데이터 의존성"""
+    try:
+        return await _load_financial_bundle(data_collector, user_id)
+    except Exception as e:
+        logger.error(f"금융 데이터 수집 실패 (user_id={user_id}): {str(e)}")
+        raise HTTPException(status_code=500, detail=f"금융 데이터 수집 실패: {str(e)}")
+
+
+# Graph RAG 컨텍스트 캐시 (고정 질의 반복 호출, 5분)
+graph_context_cache = TTLCache(maxsize=128, ttl=300)
+
+
+async def _cached_graph_context(
+    enhanced_graph_rag: EnhancedGraphRAG, query: str, refresh: bool = False
+) -> Dict[str, Any]:
+    """질의별 Graph RAG 컨텍스트 조회 (DB 연결 불가 시의 제한 응답은 캐시하지 않음)"""
+    context = await get_or_fetch(
+        graph_context_cache,
+        query,
+        lambda: enhanced_graph_rag.get_real_time_graph_context(query),
+        refresh=refresh,
+    )
+    if not context or context.get("status") == "limited":
+        graph_context_cache.pop(query, None)
+    return context
+
+
+# 사용자별 생성 인사이트 캐시 (동시/연속 생성 요청 시 LLM 중복 호출 방지)
+insight_cache = TTLCache(maxsize=128, ttl=60)
+
+
+async def _generate_insight(
+    insight_batcher: InsightBatcher,
+    user_id: str,
+    refresh_data: bool,
+) -> Optional[Dict[str, Any]]:
+    """사용자별 인사이트 생성 (single-flight, 60초 캐시, refresh_data면 재생성)
+
+    다른 사용자 요청과는 InsightBatcher에서 묶여 공통 데이터 수집을 공유
+    """
+    insight_result = await get_or_fetch(
+        insight_cache,
+        user_id,
+        lambda: insight_batcher.submit(user_id, refresh_data),
+        refresh=refresh_data,
+    )
+    # 생성 실패 결과는 캐시하지 않음
+    if not insight_result:
+        insight_cache.pop(user_id, None)
+    return insight_result
+
+
+# 인사이트 결과에서 응답으로 내보내는 필드
+_INSIGHT_KEYS = (
+    "script",
+    "script_length",
+    "estimated_reading_time",
+    "analysis_method",
+    "portfolio_analysis",
+    "personalized_news",
+    "disclosure_insights",
+    "graph_analysis",
+    "token_usage",
+    "model_used",
+    "data_sources",
+)
+_SCRIPT_INFO_KEYS = ("script", "script_length", "estimated_reading_time")
+_INSIGHT_DATA_KEYS = ("analysis_method", "token_usage", "model_used", "data_sources")
+
 
 # 환경변수로 비디오 제공자 선택 (기본값: heygen)
 VIDEO_PROVIDER = os.getenv("VIDEO_PROVIDER", "heygen").lower()
@@ -36,7 +137,7 @@ def get_video_service():
     if _video_service_instance is None:
         try:
             _video_service_instance = VideoGenerationService(provider=VIDEO_PROVIDER)
-            logger.info(f"비디오 서비스 초기화 완료: {VIDEO_PROVIDER}")
+            logger.info("비디오 서비스 초기화 완료: %s", VIDEO_PROVIDER)
         except Exception as e:
             logger.error(f"비디오 서비스 초기화 실패: {str(e)}")
             raise HTTPException(
@@ -46,78 +147,132 @@ def get_video_service():
     return _video_service_instance
 
 
-class VideoGenerationRequest(BaseModel):
-    """비디오 생성 요청 모델 (개선된 버전)"""
+async def close_video_services():
+    """비디오 서비스 HTTP 클라이언트 종료 (lifespan 종료 시 호출)"""
+    services = [_video_service_instance, *_probe_services.values()]
+    for service in services:
+        if service is not None:
+            try:
+                await service.aclose()
+            except Exception as e:
+                logger.warning("비디오 서비스 종료 실패: %s", e)
+
+
+# 제공자 가용성 체크용 서비스 인스턴스 (제공자별 1개, 생성 성공 시에만 보관)
+_probe_services: Dict[str, Any] = {}
+
+
+def get_probe_service(name: str):
+    """가용성 체크용 서비스 인스턴스 (heygen: HeyGenService, aistudios: VideoGenerationService)"""
+    service = _probe_services.get(name)
+    if service is None:
+        if name == "heygen":
+            from app.services.external.heygen_service import HeyGenService
+
+            service = HeyGenService()
+        else:
+            service = VideoGenerationService(name)
+        service = _probe_services.setdefault(name, service)
+    return service
+
+
+# 제공자별 create_video 파라미터 (VideoGenerationRequest 필드명)
+HEYGEN_VIDEO_KEYS = ("avatar_id", "voice_id", "background")
+AISTUDIOS_VIDEO_KEYS = ("model_id", "cloth_id", "background_color", "language")
+
+
+class VideoGenerationRequest(msgspec.Struct, kw_only=True):
+    """비디오 생성 요청 모델 (msgspec 디코딩)"""
 
     # HeyGen 파라미터
-    avatar_id: Optional[str] = Field(default="default", description="HeyGen 아바타 ID")
-    voice_id: Optional[str] = Field(
-        default="f8c69e517f424cafaecde32dde57096b",
-        description="HeyGen 음성 ID (기본: Allison)",
-    )
-    background: Optional[str] = Field(
-        default="professional", description="HeyGen 배경 설정"
-    )
+    avatar_id: Annotated[
+        Optional[str], msgspec.Meta(description="HeyGen 아바타 ID")
+    ] = "default"
+    voice_id: Annotated[
+        Optional[str], msgspec.Meta(description="HeyGen 음성 ID (기본: Allison)")
+    ] = "f8c69e517f424cafaecde32dde57096b"
+    background: Annotated[
+        Optional[str], msgspec.Meta(description="HeyGen 배경 설정")
+    ] = "professional"
 
     # AIStudios 파라미터
-    model_id: Optional[str] = Field(default="default", description="AIStudios 모델 ID")
-    cloth_id: Optional[str] = Field(
-        default="BG00002320", description="AIStudios 의상 ID"
-    )
-    background_color: Optional[str] = Field(
-        default="#ffffff", description="AIStudios 배경색"
+    model_id: Annotated[
+        Optional[str], msgspec.Meta(description="AIStudios 모델 ID")
+    ] = "default"
+    cloth_id: Annotated[
+        Optional[str], msgspec.Meta(description="AIStudios 의상 ID")
+    ] = "BG00002320"
+    background_color: Annotated[
+        Optional[str], msgspec.Meta(description="AIStudios 배경색")
+    ] = "#ffffff"
+    language: Annotated[Optional[str], msgspec.Meta(description="AIStudios 언어")] = (
+        "ko"
     )
-    language: Optional[str] = Field(default="ko", description="AIStudios 언어")
 
-    class Config:
-        schema_extra = {
-            "example": {
-                "avatar_id": "default",
-                "voice_id": "f8c69e517f424cafaecde32dde57096b",
-                "background": "professional",
-                "model_id": "default",
-                "cloth_id": "BG00002320",
-                "background_color": "#ffffff",
-                "language": "ko",
+    def params_for(self, provider: str) -> Dict[str, Any]:
+        """제공자별 create_video 파라미터"""
+        keys = HEYGEN_VIDEO_KEYS if provider == "heygen" else AISTUDIOS_VIDEO_KEYS
+        return {key: getattr(self, key) for key in keys}
+
+
+_video_request_decoder = msgspec.json.Decoder(VideoGenerationRequest)
+
+# msgspec 스키마를 OpenAPI 요청 본문으로 노출
+_VIDEO_REQUEST_OPENAPI = {
+    "requestBody": {
+        "content": {
+            "application/json": {
+                "schema": msgspec.json.schema_components([VideoGenerationRequest])[1][
+                    "VideoGenerationRequest"
+                ],
+                "example": msgspec.to_builtins(VideoGenerationRequest()),
             }
-        }
+        },
+        "required": False,
+    }
+}
+
+
+async def video_request_body(request: Request) -> VideoGenerationRequest:
+    """요청 본문을 VideoGenerationRequest로 디코딩 (본문 없으면 기본값)"""
+    body = await request.body()
+    if not body:
+        return VideoGenerationRequest()
+    try:
+        return _video_request_decoder.decode(body)
+    except msgspec.ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=400, detail=f"잘못된 JSON 본문: {str(e)}")
+
+
+def _insight_payload(user_id: str, insight_result: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "user_id": user_id,
+        **{key: insight_result.get(key) for key in _INSIGHT_KEYS},
+    }
 
 
 @router.post("/generate/{user_id}")
 async def generate_personalized_insight(
     user_id: str,
     refresh_data: bool = Query(default=False, description="데이터 새로고침 여부"),
+    insight_batcher: InsightBatcher = Depends(get_insight_batcher),
 ) -> Dict[str, Any]:
-    """개인화된 AI 투자 인사이트 생성"""
+    """개인화된 AI 투자 인사이트 생성 (재조회는 GET /insight/{user_id})"""
     try:
         logger.info(
-            f"사용자 {user_id}의 인사이트 생성 시작 (refresh_data={refresh_data})"
+            "사용자 %s의 인사이트 생성 시작 (refresh_data=%s)", user_id, refresh_data
         )
 
-        insight_result = insight_generator.generate_comprehensive_insight(
-            user_id=user_id, refresh_data=refresh_data
-        )
+        insight_result = await _generate_insight(insight_batcher, user_id, refresh_data)
 
         if not insight_result:
-            logger.warning(f"사용자 {user_id}의 인사이트 생성 실패")
+            logger.warning("사용자 %s의 인사이트 생성 실패", user_id)
             raise HTTPException(status_code=404, detail="인사이트 생성 실패")
 
-        logger.info(f"사용자 {user_id}의 인사이트 생성 완료")
-
-        return {
-            "user_id": user_id,
-            "script": insight_result.get("script"),
-            "script_length": insight_result.get("script_length"),
-            "estimated_reading_time": insight_result.get("estimated_reading_time"),
-            "analysis_method": insight_result.get("analysis_method"),
-            "portfolio_analysis": insight_result.get("portfolio_analysis"),
-            "personalized_news": insight_result.get("personalized_news"),
-            "disclosure_insights": insight_result.get("disclosure_insights"),
-            "graph_analysis": insight_result.get("graph_analysis"),
-            "token_usage": insight_result.get("token_usage"),
-            "model_used": insight_result.get("model_used"),
-            "data_sources": insight_result.get("data_sources"),
-        }
+        logger.info("사용자 %s의 인사이트 생성 완료", user_id)
+        return _insight_payload(user_id, insight_result)
 
     except HTTPException:
         raise
@@ -126,60 +281,59 @@ async def generate_personalized_insight(
         raise HTTPException(status_code=500, detail=f"인사이트 생성 실패: {str(e)}")
 
 
-@router.post("/generate-video/{user_id}")
+@router.get("/insight/{user_id}")
+async def get_cached_insight(user_id: str, request: Request) -> Response:
+    """최근 생성된 인사이트 조회 (캐시에서만 읽음, If-None-Match 일치 시 304)"""
+    insight_result = insight_cache.get(user_id)
+    if not insight_result:
+        raise HTTPException(
+            status_code=404,
+            detail="생성된 인사이트가 없습니다. POST /generate/{user_id}로 생성하세요",
+        )
+    return etag_response(
+        request,
+        _insight_payload(user_id, insight_result),
+        max_age=int(insight_cache.ttl),
+    )
+
+
+@router.post("/generate-video/{user_id}", openapi_extra=_VIDEO_REQUEST_OPENAPI)
 async def generate_insight_video(
     user_id: str,
-    video_request: VideoGenerationRequest,
+    video_request: VideoGenerationRequest = Depends(video_request_body),
     refresh_data: bool = Query(default=False, description="데이터 새로고침 여부"),
+    insight_batcher: InsightBatcher = Depends(get_insight_batcher),
 ) -> Dict[str, Any]:
     """개인화된 AI 투자 인사이트 영상 생성 (HeyGen 또는 AIStudios)"""
     try:
-        logger.info(f"사용자 {user_id}의 인사이트 영상 생성 시작")
+        logger.info("사용자 %s의 인사이트 영상 생성 시작", user_id)
 
         # 1. 먼저 인사이트 스크립트 생성
-        insight_result = insight_generator.generate_comprehensive_insight(
-            user_id=user_id, refresh_data=refresh_data
-        )
+        insight_result = await _generate_insight(insight_batcher, user_id, refresh_data)
 
         if not insight_result or not insight_result.get("script"):
             logger.error(f"사용자 {user_id}의 인사이트 스크립트 생성 실패")
             raise HTTPException(status_code=404, detail="인사이트 스크립트 생성 실패")
 
         script = insight_result.get("script")
-        logger.info(f"스크립트 생성 완료 (길이: {len(script)}자)")
+        logger.info("스크립트 생성 완료 (길이: %s자)", len(script))
 
         # 2. 비디오 생성 서비스 초기화
         video_service = get_video_service()
+        provider = video_service.get_provider()
 
         if not video_service.is_available():
-            logger.error(f"{video_service.get_provider()} 서비스 사용 불가")
+            logger.error(f"{provider} 서비스 사용 불가")
             raise HTTPException(
                 status_code=503,
-                detail=f"{video_service.get_provider()} 서비스를 사용할 수 없습니다. API 키를 확인하세요.",
+                detail=f"{provider} 서비스를 사용할 수 없습니다. API 키를 확인하세요.",
             )
 
-        logger.info(f"비디오 생성 제공자: {video_service.get_provider()}")
+        logger.info("비디오 생성 제공자: %s", provider)
 
         # 3. 제공자별 파라미터 준비
-        if video_service.get_provider() == "heygen":
-            video_params = {
-                "avatar_id": video_request.avatar_id,
-                "voice_id": video_request.voice_id,
-                "background": video_request.background,
-            }
-            logger.info(
-                f"HeyGen 파라미터: avatar={video_request.avatar_id}, voice={video_request.voice_id}, bg={video_request.background}"
-            )
-        else:  # aistudios
-            video_params = {
-                "model_id": video_request.model_id,
-                "cloth_id": video_request.cloth_id,
-                "background_color": video_request.background_color,
-                "language": video_request.language,
-            }
-            logger.info(
-                f"AIStudios 파라미터: model={video_request.model_id}, cloth={video_request.cloth_id}"
-            )
+        video_params = video_request.params_for(provider)
+        logger.info("%s 파라미터: %s", provider, video_params)
 
         # 4. 영상 생성
         video_result = await video_service.create_video(script=script, **video_params)
@@ -187,30 +341,19 @@ async def generate_insight_video(
         if not video_result.get("success"):
             error_details = video_result.get("details", "")
             error_msg = video_result.get("error", "알 수 없는 오류")
-            logger.error(f"{video_service.get_provider()} 영상 생성 실패: {error_msg}")
+            logger.error(f"{provider} 영상 생성 실패: {error_msg}")
             raise HTTPException(
                 status_code=502,
-                detail=f"{video_service.get_provider()} 영상 생성 실패: {error_msg}\n상세: {error_details}",
+                detail=f"{provider} 영상 생성 실패: {error_msg}\n상세: {error_details}",
             )
 
         # 5. 제공자별 응답 형식 통일
-        if video_service.get_provider() == "heygen":
-            video_id = video_result.get("video_id")
-            response_data = {
-                "used_avatar_id": video_params["avatar_id"],
-                "used_voice_id": video_params["voice_id"],
-                "used_background": video_params["background"],
-            }
-        else:  # aistudios
-            video_id = video_result.get("project_id")
-            response_data = {
-                "used_model_id": video_params["model_id"],
-                "used_cloth_id": video_params["cloth_id"],
-                "used_background_color": video_params["background_color"],
-                "used_language": video_params["language"],
-            }
+        video_id = video_result.get(
+            "video_id" if provider == "heygen" else "project_id"
+        )
+        response_data = {f"used_{key}": value for key, value in video_params.items()}
 
-        logger.info(f"영상 생성 요청 완료: video_id={video_id}")
+        logger.info("영상 생성 요청 완료: video_id=%s", video_id)
 
         return {
             "user_id": user_id,
@@ -218,19 +361,12 @@ async def generate_insight_video(
                 "video_id": video_id,
                 "video_url": video_result.get("video_url"),
                 "status": video_result.get("status"),
-                "provider": video_service.get_provider(),
+                "provider": provider,
                 **response_data,
             },
-            "script_info": {
-                "script": script,
-                "script_length": insight_result.get("script_length"),
-                "estimated_reading_time": insight_result.get("estimated_reading_time"),
-            },
+            "script_info": {key: insight_result.get(key) for key in _SCRIPT_INFO_KEYS},
             "insight_data": {
-                "analysis_method": insight_result.get("analysis_method"),
-                "token_usage": insight_result.get("token_usage"),
-                "model_used": insight_result.get("model_used"),
-                "data_sources": insight_result.get("data_sources"),
+                key: insight_result.get(key) for key in _INSIGHT_DATA_KEYS
             },
         }
 
@@ -276,39 +412,29 @@ async def get_video_status(video_id: str) -> Dict[str, Any]:
         raise HTTPException(status_code=500, detail=f"상태 확인 실패: {str(e)}")
 
 
-@router.post("/script-to-video")
+@router.post("/script-to-video", openapi_extra=_VIDEO_REQUEST_OPENAPI)
 async def convert_script_to_video(
-    script: str, video_request: VideoGenerationRequest
+    script: str,
+    video_request: VideoGenerationRequest = Depends(video_request_body),
 ) -> Dict[str, Any]:
     """기존 스크립트를 영상으로 변환"""
     try:
         if not script or len(script.strip()) == 0:
             raise HTTPException(status_code=400, detail="스크립트가 비어있습니다")
 
-        logger.info(f"스크립트→영상 변환 시작 (길이: {len(script)}자)")
+        logger.info("스크립트→영상 변환 시작 (길이: %s자)", len(script))
 
         video_service = get_video_service()
+        provider = video_service.get_provider()
 
         if not video_service.is_available():
             raise HTTPException(
                 status_code=503,
-                detail=f"{video_service.get_provider()} 서비스를 사용할 수 없습니다.",
+                detail=f"{provider} 서비스를 사용할 수 없습니다.",
             )
 
         # 제공자별 파라미터 준비
-        if video_service.get_provider() == "heygen":
-            video_params = {
-                "avatar_id": video_request.avatar_id,
-                "voice_id": video_request.voice_id,
-                "background": video_request.background,
-            }
-        else:  # aistudios
-            video_params = {
-                "model_id": video_request.model_id,
-                "cloth_id": video_request.cloth_id,
-                "background_color": video_request.background_color,
-                "language": video_request.language,
-            }
+        video_params = video_request.params_for(provider)
 
         video_result = await video_service.create_video(script=script, **video_params)
 
@@ -321,12 +447,11 @@ async def convert_script_to_video(
             )
 
         # 제공자별 비디오 ID 처리
-        if video_service.get_provider() == "heygen":
-            video_id = video_result.get("video_id")
-        else:  # aistudios
-            video_id = video_result.get("project_id")
+        video_id = video_result.get(
+            "video_id" if provider == "heygen" else "project_id"
+        )
 
-        logger.info(f"스크립트→영상 변환 완료: video_id={video_id}")
+        logger.info("스크립트→영상 변환 완료: video_id=%s", video_id)
 
         return {
             "script": script,
@@ -334,7 +459,7 @@ async def convert_script_to_video(
                 "video_id": video_id,
                 "video_url": video_result.get("video_url"),
                 "status": video_result.get("status"),
-                "provider": video_service.get_provider(),
+                "provider": provider,
             },
         }
 
@@ -345,66 +470,176 @@ async def convert_script_to_video(
         raise HTTPException(status_code=500, detail=f"영상 생성 실패: {str(e)}")
 
 
-@router.get("/video-progress/{video_id}")
-async def stream_video_progress(video_id: str):
-    """실시간 영상 생성 진행상황 스트리밍 (제공자별 처리)"""
+# 영상 진행상황 폴링 설정 (지수 백오프, 전체 대기 시간 상한)
+VIDEO_PROGRESS_MAX_WAIT = 600  # 최대 10분
+VIDEO_POLL_MIN_DELAY = 2
+VIDEO_POLL_MAX_DELAY = 30
+VIDEO_EWMA_ALPHA = 0.3
 
-    async def generate_progress():
-        video_service = get_video_service()
-        provider = video_service.get_provider()
+# 제공자별 영상 상태 문자열 분류 (소문자 기준)
+_VIDEO_TERMINAL_OK = frozenset({"completed", "complete", "success", "succeeded"})
+_VIDEO_TERMINAL_ERR = frozenset({"failed", "fail", "error"})
+_VIDEO_IN_PROGRESS = frozenset({"processing", "waiting", "pending"})
 
-        max_attempts = 120  # 최대 10분 (5초 간격)
-        attempt = 0
+# 웹훅 수신 시 진행상황 스트림을 즉시 깨우는 이벤트 (video_id별)
+_video_done_events = TTLCache(maxsize=256, ttl=VIDEO_PROGRESS_MAX_WAIT * 2)
 
-        logger.info(
-            f"영상 진행상황 스트리밍 시작: video_id={video_id}, provider={provider}"
-        )
+# 웹훅으로 받은 최종 상태 (get_video_status 응답 형식, 스트림이 조회 대신 사용)
+_video_webhook_states = TTLCache(maxsize=256, ttl=VIDEO_PROGRESS_MAX_WAIT * 2)
+
+# 최근 영상 생성 완료 소요 시간 이동평균 (초)
+_video_completion_ewma: Optional[float] = None
+
+
+def _video_done_event(video_id: str) -> asyncio.Event:
+    event = _video_done_events.get(video_id)
+    if event is None:
+        event = _video_done_events[video_id] = asyncio.Event()
+    return event
+
+
+def _notify_video_webhook(video_id: str, state: Dict[str, Any]) -> None:
+    """웹훅 상태 저장 후 대기 중인 진행상황 스트림 깨우기"""
+    if not video_id:
+        return
+    _video_webhook_states[video_id] = {"success": True, **state}
+    _video_done_event(video_id).set()
+
+
+def _record_video_completion(elapsed: float) -> None:
+    global _video_completion_ewma
+    if _video_completion_ewma is None:
+        _video_completion_ewma = elapsed
+    else:
+        _video_completion_ewma += VIDEO_EWMA_ALPHA * (elapsed - _video_completion_ewma)
+
+
+def _sse_event(data: Dict[str, Any]) -> ServerSentEvent:
+    """SSE 이벤트 생성 (orjson 직렬화, 프레이밍/ping은 EventSourceResponse가 처리)"""
+    return ServerSentEvent(data=orjson.dumps(data).decode())
+
+
+def _video_poll_delay(attempt: int) -> float:
+    """2초에서 시작해 1.5배씩 늘어나는 폴링 간격 (최대 30초)"""
+    return min(VIDEO_POLL_MAX_DELAY, VIDEO_POLL_MIN_DELAY * (1.5 ** min(attempt, 8)))
+
+
+async def _wait_video_event(event: asyncio.Event, timeout: float) -> None:
+    """웹훅 이벤트 또는 timeout 중 먼저 오는 쪽까지 대기"""
+    try:
+        await asyncio.wait_for(event.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        pass
+
+
+# SSE 응답 공통 헤더 (프록시 버퍼링 비활성화)
+_SSE_HEADERS = {
+    "X-Accel-Buffering": "no",
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Headers": "*",
+}
+
+
+async def _video_progress_events(video_service, video_id: str, request: Request):
+    """영상 생성 진행상황 SSE 이벤트 (완료/실패/타임아웃/연결 종료 시 끝)"""
+    provider = video_service.get_provider()
+
+    loop = asyncio.get_running_loop()
+    started_at = loop.time()
+    deadline = started_at + VIDEO_PROGRESS_MAX_WAIT
+    done_event = _video_done_event(video_id)
+    attempt = 0
+    finished = False
+    last_sent = None  # 마지막으로 전송한 (status, progress)
+
+    logger.info(
+        "영상 진행상황 스트리밍 시작: video_id=%s, provider=%s", video_id, provider
+    )
+
+    # 연결 종료로 generator가 닫혀도(GeneratorExit/취소) video_id별 상태는 반드시 정리
+    try:
+        # 평소 완료 시간의 절반 전에는 완료 가능성이 낮으므로 첫 조회를 미룸
+        if _video_completion_ewma:
+            await _wait_video_event(
+                done_event,
+                min(0.5 * _video_completion_ewma, VIDEO_PROGRESS_MAX_WAIT / 2),
+            )
+
+        while loop.time() < deadline:
+            # 클라이언트가 떠났으면 제공자 조회 중단
+            if await request.is_disconnected():
+                logger.info(
+                    "진행상황 스트림 클라이언트 연결 종료: video_id=%s", video_id
+                )
+                finished = True
+                break
 
-        while attempt < max_attempts:
             try:
                 attempt += 1
-                status_result = await video_service.get_video_status(video_id)
+                # 조회 도중 도착한 웹훅만 다음 대기를 깨우도록 초기화
+                done_event.clear()
+                # 웹훅이 이미 최종 상태를 알려줬으면 제공자 조회 생략
+                status_result = _video_webhook_states.pop(
+                    video_id, None
+                ) or await video_service.get_video_status(video_id)
+                elapsed = loop.time() - started_at
 
                 if status_result.get("success"):
                     status = status_result.get("status", "unknown")
                     progress = status_result.get("progress", 0)
 
+                    status_key = status.lower()
+
+                    if _video_completion_ewma and status_key in _VIDEO_IN_PROGRESS:
+                        remaining = max(0, int(_video_completion_ewma - elapsed))
+                        estimated_completion = f"약 {remaining}초 남음"
+                    elif status_key in _VIDEO_IN_PROGRESS:
+                        estimated_completion = "계산 중"
+                    else:
+                        estimated_completion = "완료"
+
                     # 클라이언트에게 진행상황 전송
                     progress_data = {
                         "video_id": video_id,
                         "status": status,
                         "progress": progress,
                         "attempt": attempt,
-                        "max_attempts": max_attempts,
+                        "elapsed_seconds": int(elapsed),
+                        "max_wait_seconds": VIDEO_PROGRESS_MAX_WAIT,
                         "provider": provider,
-                        "estimated_completion": (
-                            f"{max_attempts - attempt}분 남음"
-                            if status in ["processing", "waiting", "pending"]
-                            else "완료"
-                        ),
+                        "estimated_completion": estimated_completion,
                     }
 
-                    if status.lower() in ["completed", "complete"]:
+                    if status_key in _VIDEO_TERMINAL_OK:
                         progress_data["video_url"] = status_result.get("video_url")
-                        logger.info(f"영상 생성 완료: video_id={video_id}")
-                        yield f"data: {json.dumps(progress_data, ensure_ascii=False)}\n\n"
+                        _record_video_completion(elapsed)
+                        logger.info("영상 생성 완료: video_id=%s", video_id)
+                        yield _sse_event(progress_data)
+                        finished = True
                         break
-                    elif status.lower() in ["failed", "fail", "error"]:
+                    elif status_key in _VIDEO_TERMINAL_ERR:
                         progress_data["error"] = status_result.get(
                             "error", "영상 생성 실패"
                         )
                         logger.error(
                             f"영상 생성 실패: video_id={video_id}, error={progress_data['error']}"
                         )
-                        yield f"data: {json.dumps(progress_data, ensure_ascii=False)}\n\n"
+                        yield _sse_event(progress_data)
+                        finished = True
                         break
                     else:
                         # 진행 중
-                        if attempt % 10 == 0:  # 50초마다 로그
+                        if attempt % 5 == 0 and logger.isEnabledFor(logging.INFO):
                             logger.info(
-                                f"영상 생성 진행 중: video_id={video_id}, status={status}, progress={progress}%"
+                                "영상 생성 진행 중: video_id=%s, status=%s, progress=%s%%",
+                                video_id,
+                                status,
+                                progress,
                             )
-                        yield f"data: {json.dumps(progress_data, ensure_ascii=False)}\n\n"
+                        # 직전과 같은 상태면 전송 생략 (연결 유지는 ping이 담당)
+                        if (status, progress) != last_sent:
+                            yield _sse_event(progress_data)
+                            last_sent = (status, progress)
                 else:
                     error_data = {
                         "video_id": video_id,
@@ -416,10 +651,15 @@ async def stream_video_progress(video_id: str):
                     logger.error(
                         f"상태 확인 실패: video_id={video_id}, error={error_data['error']}"
                     )
-                    yield f"data: {json.dumps(error_data, ensure_ascii=False)}\n\n"
+                    yield _sse_event(error_data)
+                    finished = True
                     break
 
-                await asyncio.sleep(5)  # 5초 대기
+                # 웹훅이 오면 즉시 재조회, 아니면 백오프 간격만큼 대기
+                await _wait_video_event(
+                    done_event,
+                    min(_video_poll_delay(attempt), max(0, deadline - loop.time())),
+                )
 
             except Exception as e:
                 error_data = {
@@ -432,54 +672,84 @@ async def stream_video_progress(video_id: str):
                 logger.error(
                     f"진행상황 스트리밍 중 오류: video_id={video_id}, error={str(e)}"
                 )
-                yield f"data: {json.dumps(error_data, ensure_ascii=False)}\n\n"
+                yield _sse_event(error_data)
+                finished = True
                 break
+    finally:
+        _video_done_events.pop(video_id, None)
+        _video_webhook_states.pop(video_id, None)
 
-        # 최대 시도 횟수 초과
-        if attempt >= max_attempts:
-            timeout_data = {
-                "video_id": video_id,
-                "status": "timeout",
-                "error": "최대 대기 시간을 초과했습니다",
-                "provider": provider,
-            }
-            logger.warning(f"영상 생성 타임아웃: video_id={video_id}")
-            yield f"data: {json.dumps(timeout_data, ensure_ascii=False)}\n\n"
-
-    return StreamingResponse(
-        generate_progress(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Headers": "*",
-        },
+    # 최대 대기 시간 초과
+    if not finished:
+        timeout_data = {
+            "video_id": video_id,
+            "status": "timeout",
+            "error": "최대 대기 시간을 초과했습니다",
+            "provider": provider,
+        }
+        logger.warning("영상 생성 타임아웃: video_id=%s", video_id)
+        yield _sse_event(timeout_data)
+
+
+@router.get("/video-progress/{video_id}")
+async def stream_video_progress(video_id: str, request: Request):
+    """실시간 영상 생성 진행상황 스트리밍 (제공자별 처리)"""
+    # 서비스 초기화 실패는 스트림 시작(200 응답) 전에 503으로 반환
+    video_service = get_video_service()
+    # 연결 해제 시 generator 취소, keep-alive ping은 EventSourceResponse가 전송
+    return EventSourceResponse(
+        _video_progress_events(video_service, video_id, request),
+        ping=15,
+        headers=_SSE_HEADERS,
     )
 
 
+# 비디오 제공자 메타데이터 캐시 (아바타/음성 목록은 거의 바뀌지 않음)
+video_providers_cache = TTLCache(maxsize=4, ttl=60)
+video_catalog_cache = TTLCache(maxsize=16, ttl=600)
+
+
+async def _cached_video_catalog(key, fetch, result_field: str, refresh: bool):
+    """제공자별 목록 캐시 조회, 실패하거나 비어 있는 결과는 캐시에서 제외"""
+    result = await get_or_fetch(video_catalog_cache, key, fetch, refresh=refresh)
+    if "error" in result or not result.get(result_field):
+        video_catalog_cache.pop(key, None)
+    return result
+
+
 @router.get("/video-providers")
-async def get_video_providers() -> Dict[str, Any]:
+async def get_video_providers(
+    refresh: bool = Query(default=False, description="캐시 새로고침 여부"),
+) -> Dict[str, Any]:
     """사용 가능한 비디오 제공자 목록"""
-    heygen_available = False
-    aistudios_available = False
+    return await get_or_fetch(
+        video_providers_cache, VIDEO_PROVIDER, _fetch_video_providers, refresh=refresh
+    )
 
-    try:
-        # HeyGen 서비스 체크 (import 경로 수정)
-        from app.services.external.heygen_service import HeyGenService
 
-        heygen_service = HeyGenService()
-        heygen_available = heygen_service.is_available()
+def _check_heygen() -> bool:
+    try:
+        return get_probe_service("heygen").is_available()
     except ImportError:
         logger.warning("HeyGen 서비스를 import할 수 없습니다")
     except Exception as e:
         logger.error(f"HeyGen 서비스 체크 실패: {str(e)}")
+    return False
 
+
+def _check_aistudios() -> bool:
     try:
-        aistudios_service = VideoGenerationService("aistudios")
-        aistudios_available = aistudios_service.is_available()
+        return get_probe_service("aistudios").is_available()
     except Exception as e:
         logger.error(f"AIStudios 서비스 체크 실패: {str(e)}")
+    return False
+
+
+async def _fetch_video_providers() -> Dict[str, Any]:
+    # 제공자별 체크는 서로 독립적이므로 동시에 실행
+    heygen_available, aistudios_available = await asyncio.gather(
+        asyncio.to_thread(_check_heygen), asyncio.to_thread(_check_aistudios)
+    )
 
     return {
         "current_provider": VIDEO_PROVIDER,
@@ -499,103 +769,125 @@ async def get_video_providers() -> Dict[str, Any]:
 
 
 @router.get("/video-models")
-async def get_video_models() -> Dict[str, Any]:
+async def get_video_models(
+    refresh: bool = Query(default=False, description="캐시 새로고침 여부"),
+) -> Dict[str, Any]:
     """현재 제공자의 사용 가능한 모델/아바타 목록"""
     try:
         video_service = get_video_service()
         provider = video_service.get_provider()
 
-        if provider == "heygen":
-            # HeyGen 아바타 목록
-            try:
-                avatars = await video_service.service.get_avatars()
-                return {
-                    "provider": provider,
-                    "models": (
-                        avatars.get("avatars", []) if avatars.get("success") else []
-                    ),
-                    "type": "avatars",
-                }
-            except Exception as e:
-                logger.error(f"HeyGen 아바타 목록 조회 실패: {str(e)}")
-                return {
-                    "provider": provider,
-                    "models": [],
-                    "error": "아바타 목록을 가져올 수 없습니다",
-                }
-
-        elif provider == "aistudios":
-            # AIStudios 모델 목록
-            try:
-                models = await video_service.service.get_models()
-                return {
-                    "provider": provider,
-                    "models": models.get("models", []) if models.get("success") else [],
-                    "type": "models",
-                }
-            except Exception as e:
-                logger.error(f"AIStudios 모델 목록 조회 실패: {str(e)}")
-                return {
-                    "provider": provider,
-                    "models": [],
-                    "error": "모델 목록을 가져올 수 없습니다",
-                }
+        return await _cached_video_catalog(
+            (provider, "models"),
+            lambda: _fetch_video_models(video_service, provider),
+            "models",
+            refresh,
+        )
 
     except Exception as e:
         logger.error(f"모델 목록 조회 중 오류: {str(e)}")
         return {"error": f"모델 목록 조회 실패: {str(e)}"}
 
 
+async def _fetch_video_models(video_service, provider: str) -> Dict[str, Any]:
+    if provider == "heygen":
+        # HeyGen 아바타 목록
+        try:
+            avatars = await video_service.service.get_avatars()
+            return {
+                "provider": provider,
+                "models": avatars.get("avatars", []) if avatars.get("success") else [],
+                "type": "avatars",
+            }
+        except Exception as e:
+            logger.error(f"HeyGen 아바타 목록 조회 실패: {str(e)}")
+            return {
+                "provider": provider,
+                "models": [],
+                "error": "아바타 목록을 가져올 수 없습니다",
+            }
+
+    elif provider == "aistudios":
+        # AIStudios 모델 목록
+        try:
+            models = await video_service.service.get_models()
+            return {
+                "provider": provider,
+                "models": models.get("models", []) if models.get("success") else [],
+                "type": "models",
+            }
+        except Exception as e:
+            logger.error(f"AIStudios 모델 목록 조회 실패: {str(e)}")
+            return {
+                "provider": provider,
+                "models": [],
+                "error": "모델 목록을 가져올 수 없습니다",
+            }
+
+    return {"provider": provider, "models": []}
+
+
 @router.get("/video-voices")
-async def get_video_voices() -> Dict[str, Any]:
+async def get_video_voices(
+    refresh: bool = Query(default=False, description="캐시 새로고침 여부"),
+) -> Dict[str, Any]:
     """현재 제공자의 사용 가능한 음성 목록"""
     try:
         video_service = get_video_service()
         provider = video_service.get_provider()
 
-        if provider == "heygen":
-            # HeyGen 음성 목록
-            try:
-                voices = await video_service.service.get_voices()
-                return {
-                    "provider": provider,
-                    "voices": voices.get("voices", []) if voices.get("success") else [],
-                    "type": "voices",
-                }
-            except Exception as e:
-                logger.error(f"HeyGen 음성 목록 조회 실패: {str(e)}")
-                return {
-                    "provider": provider,
-                    "voices": [],
-                    "error": "음성 목록을 가져올 수 없습니다",
-                }
-
-        elif provider == "aistudios":
-            # AIStudios 언어 목록
-            try:
-                languages = await video_service.service.get_languages()
-                return {
-                    "provider": provider,
-                    "voices": (
-                        languages.get("languages", {})
-                        if languages.get("success")
-                        else {}
-                    ),
-                    "type": "languages",
-                }
-            except Exception as e:
-                logger.error(f"AIStudios 언어 목록 조회 실패: {str(e)}")
-                return {
-                    "provider": provider,
-                    "voices": {},
-                    "error": "언어 목록을 가져올 수 없습니다",
-                }
+        return await _cached_video_catalog(
+            (provider, "voices"),
+            lambda: _fetch_video_voices(video_service, provider),
+            "voices",
+            refresh,
+        )
 
     except Exception as e:
         logger.error(f"음성 목록 조회 중 오류: {str(e)}")
         return {"error": f"음성 목록 조회 실패: {str(e)}"}
 
 
+async def _fetch_video_voices(video_service, provider: str) -> Dict[str, Any]:
+    if provider == "heygen":
+        # HeyGen 음성 목록
+        try:
+            voices = await video_service.service.get_voices()
+            return {
+                "provider": provider,
+                "voices": voices.get("voices", []) if voices.get("success") else [],
+                "type": "voices",
+            }
+        except Exception as e:
+            logger.error(f"HeyGen 음성 목록 조회 실패: {str(e)}")
+            return {
+                "provider": provider,
+                "voices": [],
+                "error": "음성 목록을 가져올 수 없습니다",
+            }
+
+    elif provider == "aistudios":
+        # AIStudios 언어 목록
+        try:
+            languages = await video_service.service.get_languages()
+            return {
+                "provider": provider,
+                "voices": (
+                    languages.get("languages", {}) if languages.get("success") else {}
+                ),
+                "type": "languages",
+            }
+        except Exception as e:
+            logger.error(f"AIStudios 언어 목록 조회 실패: {str(e)}")
+            return {
+                "provider": provider,
+                "voices": {},
+                "error": "언어 목록을 가져올 수 없습니다",
+            }
+
+    return {"provider": provider, "voices": []}
+
+
 @router.post("/test-video-service")
 async def test_video_service() -> Dict[str, Any]:
     """현재 비디오 서비스 연결 테스트"""
@@ -634,10 +926,10 @@ async def test_video_service() -> Dict[str, Any]:
 async def video_webhook(request: Request) -> Dict[str, str]:
     """비디오 제공자 웹훅 수신 엔드포인트"""
     try:
-        webhook_data = await request.json()
+        webhook_data = orjson.loads(await request.body())
         provider = webhook_data.get("provider", VIDEO_PROVIDER)
 
-        logger.info(f"비디오 웹훅 수신 ({provider}): {webhook_data}")
+        logger.info("비디오 웹훅 수신 (%s): %s", provider, webhook_data)
 
         if provider == "heygen":
             # HeyGen 웹훅 처리
@@ -647,11 +939,17 @@ async def video_webhook(request: Request) -> Dict[str, str]:
             if event_type == "avatar_video.success":
                 video_id = event_data.get("video_id")
                 video_url = event_data.get("url")
-                logger.info(f"HeyGen 영상 생성 성공: {video_id}, URL: {video_url}")
+                logger.info("HeyGen 영상 생성 성공: %s, URL: %s", video_id, video_url)
+                _notify_video_webhook(
+                    video_id, {"status": "completed", "video_url": video_url}
+                )
             elif event_type == "avatar_video.fail":
                 video_id = event_data.get("video_id")
                 error_msg = event_data.get("msg")
                 logger.error(f"HeyGen 영상 생성 실패: {video_id}, 오류: {error_msg}")
+                _notify_video_webhook(
+                    video_id, {"status": "failed", "error": error_msg}
+                )
 
         elif provider == "aistudios":
             # AIStudios 웹훅 처리
@@ -660,12 +958,20 @@ async def video_webhook(request: Request) -> Dict[str, str]:
 
             if status == "complete":
                 video_url = webhook_data.get("video_url")
-                logger.info(f"AIStudios 영상 생성 성공: {project_id}, URL: {video_url}")
+                logger.info(
+                    "AIStudios 영상 생성 성공: %s, URL: %s", project_id, video_url
+                )
+                _notify_video_webhook(
+                    project_id, {"status": "complete", "video_url": video_url}
+                )
             elif status == "fail":
                 error_msg = webhook_data.get("error")
                 logger.error(
                     f"AIStudios 영상 생성 실패: {project_id}, 오류: {error_msg}"
                 )
+                _notify_video_webhook(
+                    project_id, {"status": "fail", "error": error_msg}
+                )
 
         return {"status": "success", "message": "웹훅 수신 완료"}
 
@@ -676,19 +982,22 @@ async def video_webhook(request: Request) -> Dict[str, str]:
 
 # 기존 라우트들 (포트폴리오, 그래프 분석 등) - 로깅 개선
 @router.get("/portfolio-analysis/{user_id}")
-async def get_portfolio_analysis(user_id: str) -> Dict[str, Any]:
+async def get_portfolio_analysis(
+    user_id: str,
+    bundle: Tuple[dict, dict] = Depends(financial_bundle),
+    insight_generator: PersonalizedInsightGenerator = Depends(get_insight_generator),
+) -> Dict[str, Any]:
     """사용자 포트폴리오 분석"""
     try:
-        logger.info(f"포트폴리오 분석 시작: user_id={user_id}")
+        logger.info("포트폴리오 분석 시작: user_id=%s", user_id)
 
-        financial_data = data_collector.collect_all_data(user_id=user_id)
-        user_profile = data_collector.get_personalized_data(user_id)
+        financial_data, user_profile = bundle
 
         portfolio_analysis = insight_generator._analyze_portfolio_performance(
             user_profile, financial_data
         )
 
-        logger.info(f"포트폴리오 분석 완료: user_id={user_id}")
+        logger.info("포트폴리오 분석 완료: user_id=%s", user_id)
 
         return {
             "user_id": user_id,
@@ -703,18 +1012,24 @@ async def get_portfolio_analysis(user_id: str) -> Dict[str, Any]:
 
 @router.get("/graph-analysis")
 async def get_graph_rag_analysis(
-    user_id: Optional[str] = Query(default=None, description="사용자 ID (선택사항)")
+    user_id: Optional[str] = Query(default=None, description="사용자 ID (선택사항)"),
+    refresh: bool = Query(default=False, description="캐시 새로고침 여부"),
+    data_collector: EnhancedDataCollector = Depends(get_data_collector),
+    enhanced_graph_rag: EnhancedGraphRAG = Depends(get_graph_rag),
 ) -> Dict[str, Any]:
     """Graph RAG 시장 분석"""
     try:
-        logger.info(f"Graph RAG 시장 분석 시작: user_id={user_id}")
-
-        financial_data = data_collector.collect_all_data(user_id=user_id)
-        market_narrative = await enhanced_graph_rag.get_real_time_graph_context(
-            f"시장 전반 분석 및 투자 인사이트"
+        logger.info("Graph RAG 시장 분석 시작: user_id=%s", user_id)
+
+        # 데이터 수집과 그래프 컨텍스트 조회는 서로 독립적이므로 동시에 실행
+        (financial_data, _), market_narrative = await asyncio.gather(
+            _load_financial_bundle(data_collector, user_id),
+            _cached_graph_context(
+                enhanced_graph_rag, "시장 전반 분석 및 투자 인사이트", refresh
+            ),
         )
 
-        logger.info(f"Graph RAG 시장 분석 완료: user_id={user_id}")
+        logger.info("Graph RAG 시장 분석 완료: user_id=%s", user_id)
 
         return {
             "market_analysis": market_narrative,
@@ -729,23 +1044,27 @@ async def get_graph_rag_analysis(
 
 @router.get("/news-insights")
 async def get_personalized_news_insights(
-    user_id: str, limit: int = Query(default=10, ge=1, le=50, description="뉴스 개수")
+    user_id: str,
+    limit: int = Query(default=10, ge=1, le=50, description="뉴스 개수"),
+    bundle: Tuple[dict, dict] = Depends(financial_bundle),
+    insight_generator: PersonalizedInsightGenerator = Depends(get_insight_generator),
 ) -> Dict[str, Any]:
     """개인화된 뉴스 인사이트"""
     try:
         logger.info(
-            f"개인화된 뉴스 인사이트 생성 시작: user_id={user_id}, limit={limit}"
+            "개인화된 뉴스 인사이트 생성 시작: user_id=%s, limit=%s", user_id, limit
         )
 
-        financial_data = data_collector.collect_all_data(user_id=user_id)
-        user_profile = data_collector.get_personalized_data(user_id)
+        financial_data, user_profile = bundle
 
         personalized_news = insight_generator._filter_personalized_news(
             financial_data, user_profile
         )
 
         logger.info(
-            f"개인화된 뉴스 인사이트 생성 완료: user_id={user_id}, 필터링된 뉴스 수={len(personalized_news)}"
+            "개인화된 뉴스 인사이트 생성 완료: user_id=%s, 필터링된 뉴스 수=%s",
+            user_id,
+            len(personalized_news),
         )
 
         return {
@@ -763,17 +1082,18 @@ async def get_personalized_news_insights(
 
 
 @router.get("/disclosure-analysis/{user_id}")
-async def get_disclosure_analysis(user_id: str) -> Dict[str, Any]:
+async def get_disclosure_analysis(
+    user_id: str,
+    bundle: Tuple[dict, dict] = Depends(financial_bundle),
+    insight_generator: PersonalizedInsightGenerator = Depends(get_insight_generator),
+) -> Dict[str, Any]:
     """사용자 맞춤 공시 분석"""
     try:
-        logger.info(f"공시 분석 시작: user_id={user_id}")
+        logger.info("공시 분석 시작: user_id=%s", user_id)
 
-        financial_data = data_collector.collect_all_data(user_id=user_id)
-        user_profile = data_collector.get_personalized_data(user_id)
+        financial_data, user_profile = bundle
 
-        portfolio_symbols = set()
-        if user_profile.get("portfolio"):
-            portfolio_symbols = {holding[0] for holding in user_profile["portfolio"]}
+        portfolio_symbols = get_portfolio_symbols(user_profile.get("portfolio", []))
 
         disclosure_analysis = insight_generator._analyze_disclosure_for_portfolio(
             financial_data.get("disclosures", []), portfolio_symbols
@@ -784,14 +1104,16 @@ async def get_disclosure_analysis(user_id: str) -> Dict[str, Any]:
         )
 
         logger.info(
-            f"공시 분석 완료: user_id={user_id}, 포트폴리오 종목 수={len(portfolio_symbols)}"
+            "공시 분석 완료: user_id=%s, 포트폴리오 종목 수=%s",
+            user_id,
+            len(portfolio_symbols),
         )
 
         return {
             "user_id": user_id,
             "disclosure_analysis": disclosure_analysis,
             "cross_analysis": cross_analysis,
-            "portfolio_symbols": list(portfolio_symbols),
+            "portfolio_symbols": sorted(portfolio_symbols),
             "total_disclosures": len(financial_data.get("disclosures", [])),
         }
 
@@ -812,114 +1134,234 @@ async def debug_environment() -> Dict[str, Any]:
     }
 
 
-@router.get("/test")
-async def test_insight_generation() -> Dict[str, Any]:
-    """인사이트 생성 기능 테스트"""
+async def probe_insight_generation(
+    enhanced_graph_rag: EnhancedGraphRAG,
+) -> Dict[str, Any]:
+    """인사이트 생성 헬스 프로브 (lifespan 백그라운드 작업에서 주기 실행)"""
     try:
-        logger.info("인사이트 생성 기능 테스트 시작")
-
-        test_data = {
-            "news": [],
-            "disclosures": [],
-            "stock_data": [],
-            "personalized": {"portfolio": [], "preferences": {}},
-        }
-
         narrative = await enhanced_graph_rag.get_real_time_graph_context(
             "테스트 시장 분석"
         )
 
-        logger.info("인사이트 생성 기능 테스트 완료")
-
         return {
             "status": "success",
             "message": "인사이트 생성 테스트 완료",
             "graph_rag_result": narrative.get("analysis", "") if narrative else None,
+            "checked_at": datetime.now().isoformat(),
         }
 
     except Exception as e:
         logger.error(f"인사이트 생성 테스트 실패: {str(e)}")
-        return {"status": "error", "message": f"테스트 실패: {str(e)}"}
+        return {
+            "status": "error",
+            "message": f"테스트 실패: {str(e)}",
+            "checked_at": datetime.now().isoformat(),
+        }
+
+
+@router.get("/test")
+async def test_insight_generation(request: Request) -> Dict[str, Any]:
+    """인사이트 생성 상태 (마지막 백그라운드 프로브 결과)"""
+    return getattr(request.app.state, "last_insight_health", None) or {
+        "status": "pending",
+        "message": "헬스 프로브 대기 중",
+    }
 
 
 # === 추가된 편의 엔드포인트들 ===
 
 
+# HeyGen 배경 분류 (고정값)
+_BACKGROUND_CATEGORIES = {
+    "basic": ["white", "black", "gray", "dark_gray"],
+    "colorful": [
+        "blue",
+        "navy",
+        "green",
+        "purple",
+        "red",
+        "orange",
+        "yellow",
+        "pink",
+    ],
+    "gradient": [
+        "gradient_blue",
+        "gradient_purple",
+        "gradient_green",
+        "gradient_orange",
+    ],
+    "business": ["office", "corporate", "professional", "meeting"],
+    "special": [
+        "greenscreen",
+        "bluescreen",
+        "studio",
+        "minimal",
+        "warm",
+        "cool",
+        "elegant",
+    ],
+}
+
+# 제공자별 배경 목록 응답 캐시
+video_backgrounds_cache = TTLCache(maxsize=4, ttl=600)
+
+
+def _build_video_backgrounds(video_service) -> Dict[str, Any]:
+    provider = video_service.get_provider()
+    if provider != "heygen":
+        return {
+            "provider": provider,
+            "message": f"{provider}는 배경 옵션이 제한적입니다",
+        }
+
+    # HeyGen 서비스에서 배경 목록 가져오기
+    if hasattr(video_service.service, "get_available_backgrounds"):
+        return {
+            "provider": "heygen",
+            "backgrounds": video_service.service.get_available_backgrounds(),
+            "categories": _BACKGROUND_CATEGORIES,
+        }
+    return {
+        "provider": "heygen",
+        "backgrounds": ["white", "professional", "office", "greenscreen"],
+        "message": "기본 배경 목록",
+    }
+
+
 @router.get("/video-backgrounds")
 async def get_video_backgrounds() -> Dict[str, Any]:
-    """HeyGen에서 사용 가능한 배경 옵션들"""
+    """HeyGen에서 사용 가능한 배경 옵션들 (제공자별 10분 캐시)"""
     try:
         video_service = get_video_service()
+        provider = video_service.get_provider()
 
-        if video_service.get_provider() == "heygen":
-            # HeyGen 서비스에서 배경 목록 가져오기
-            if hasattr(video_service.service, "get_available_backgrounds"):
-                backgrounds = video_service.service.get_available_backgrounds()
-                return {
-                    "provider": "heygen",
-                    "backgrounds": backgrounds,
-                    "categories": {
-                        "basic": ["white", "black", "gray", "dark_gray"],
-                        "colorful": [
-                            "blue",
-                            "navy",
-                            "green",
-                            "purple",
-                            "red",
-                            "orange",
-                            "yellow",
-                            "pink",
-                        ],
-                        "gradient": [
-                            "gradient_blue",
-                            "gradient_purple",
-                            "gradient_green",
-                            "gradient_orange",
-                        ],
-                        "business": ["office", "corporate", "professional", "meeting"],
-                        "special": [
-                            "greenscreen",
-                            "bluescreen",
-                            "studio",
-                            "minimal",
-                            "warm",
-                            "cool",
-                            "elegant",
-                        ],
-                    },
-                }
-            else:
-                return {
-                    "provider": "heygen",
-                    "backgrounds": ["white", "professional", "office", "greenscreen"],
-                    "message": "기본 배경 목록",
-                }
-        else:
-            return {
-                "provider": video_service.get_provider(),
-                "message": f"{video_service.get_provider()}는 배경 옵션이 제한적입니다",
-            }
+        backgrounds = video_backgrounds_cache.get(provider)
+        if backgrounds is None:
+            backgrounds = _build_video_backgrounds(video_service)
+            video_backgrounds_cache[provider] = backgrounds
+        return backgrounds
 
     except Exception as e:
         logger.error(f"배경 목록 조회 실패: {str(e)}")
         return {"error": f"배경 목록 조회 실패: {str(e)}"}
 
 
+# 동일 파라미터 영상 생성 요청 병합 (진행 중인 동시 중복 요청만 첫 요청 결과 공유)
+_video_create_inflight: Dict[str, asyncio.Future] = {}
+
+
+async def _create_video_coalesced(video_service, script: str, **params) -> Dict:
+    """(제공자, 파라미터, 스크립트)가 같은 생성 요청이 진행 중이면 그 결과를 공유"""
+    fingerprint = orjson.dumps(
+        [video_service.get_provider(), params, script], option=orjson.OPT_SORT_KEYS
+    )
+    key = hashlib.blake2b(fingerprint, digest_size=16).hexdigest()
+    job = _video_create_inflight.get(key)
+    if job is None:
+        job = asyncio.ensure_future(video_service.create_video(script=script, **params))
+        _video_create_inflight[key] = job
+        # 성공/실패와 무관하게 완료 즉시 제거 (이후 요청은 새 영상 생성)
+        job.add_done_callback(lambda _: _video_create_inflight.pop(key, None))
+    # 한 요청이 취소돼도 같은 작업을 기다리는 다른 요청에는 영향 없음
+    return await asyncio.shield(job)
+
+
+async def _video_creation_events(
+    request: Request,
+    video_service,
+    script: str,
+    video_params: Dict[str, Any],
+    extra: Dict[str, Any],
+):
+    """queued → created 이벤트 후 진행상황 스트림으로 이어지는 SSE 이벤트"""
+    provider = video_service.get_provider()
+    yield _sse_event({"status": "queued", "provider": provider})
+
+    create_task = asyncio.create_task(
+        _create_video_coalesced(video_service, script, **video_params)
+    )
+    try:
+        # 생성 요청 대기 중 클라이언트가 떠나면 요청 취소
+        while not create_task.done():
+            if await request.is_disconnected():
+                logger.info("영상 생성 스트림 클라이언트 연결 종료, 생성 요청 취소")
+                return
+            await asyncio.wait({create_task}, timeout=1)
+        video_result = create_task.result()
+    except Exception as e:
+        yield _sse_event({"status": "error", "error": str(e), "provider": provider})
+        return
+    finally:
+        if not create_task.done():
+            create_task.cancel()
+
+    if not video_result.get("success"):
+        error_msg = video_result.get("error", "알 수 없는 오류")
+        yield _sse_event(
+            {
+                "status": "error",
+                "error": f"영상 생성 실패: {error_msg}",
+                "provider": provider,
+            }
+        )
+        return
+
+    video_id = video_result.get("video_id") or video_result.get("project_id")
+    logger.info("영상 생성 요청 완료 (스트리밍): video_id=%s", video_id)
+    yield _sse_event(
+        {
+            "status": "created",
+            "video_id": video_id,
+            "video_url": video_result.get("video_url"),
+            "provider": provider,
+            **extra,
+        }
+    )
+
+    async for event in _video_progress_events(video_service, video_id, request):
+        yield event
+
+
+def _video_creation_response(
+    request: Request,
+    video_service,
+    script: str,
+    video_params: Dict[str, Any],
+    extra: Dict[str, Any],
+) -> EventSourceResponse:
+    return EventSourceResponse(
+        _video_creation_events(request, video_service, script, video_params, extra),
+        ping=15,
+        headers=_SSE_HEADERS,
+    )
+
+
+# 빠른 영상 생성용 음성 타입 → HeyGen voice_id
+_QUICK_VOICE_IDS = {
+    "allison": "f8c69e517f424cafaecde32dde57096b",  # Allison
+    "korean": "bef4755ca1f442359c2fe6420690c8f7",  # InJoon
+}
+
+
 @router.post("/quick-video")
 async def create_quick_video(
+    request: Request,
     script: str = Query(..., description="영상 스크립트"),
     background: str = Query(default="professional", description="배경 설정"),
     voice_type: str = Query(
         default="allison", description="음성 타입 (allison/korean)"
     ),
-) -> Dict[str, Any]:
-    """빠른 영상 생성 (기본 설정 사용)"""
+    stream: bool = Query(
+        default=False, description="SSE로 생성/진행상황 스트리밍 여부"
+    ),
+):
+    """빠른 영상 생성 (기본 설정 사용, stream=true면 SSE로 완료까지 전송)"""
     try:
         if not script or len(script.strip()) == 0:
             raise HTTPException(status_code=400, detail="스크립트가 비어있습니다")
 
         logger.info(
-            f"빠른 영상 생성 시작: voice_type={voice_type}, background={background}"
+            "빠른 영상 생성 시작: voice_type=%s, background=%s", voice_type, background
         )
 
         video_service = get_video_service()
@@ -930,47 +1372,55 @@ async def create_quick_video(
                 detail=f"{video_service.get_provider()} 서비스를 사용할 수 없습니다.",
             )
 
-        # 음성 타입에 따른 voice_id 선택
-        if voice_type.lower() == "allison":
-            voice_id = "f8c69e517f424cafaecde32dde57096b"  # Allison
-        elif voice_type.lower() == "korean":
-            voice_id = "bef4755ca1f442359c2fe6420690c8f7"  # InJoon
-        else:
-            voice_id = "f8c69e517f424cafaecde32dde57096b"  # 기본값: Allison
+        # 음성 타입에 따른 voice_id 선택 (기본값: Allison)
+        voice_key = voice_type.lower()
+        voice_id = _QUICK_VOICE_IDS.get(voice_key, _QUICK_VOICE_IDS["allison"])
 
         if video_service.get_provider() == "heygen":
-            video_result = await video_service.create_video(
-                script=script,
-                avatar_id="default",
-                voice_id=voice_id,
-                background=background,
-            )
+            video_params = {
+                "avatar_id": "default",
+                "voice_id": voice_id,
+                "background": background,
+            }
         else:
             # AIStudios는 기본 설정으로
-            video_result = await video_service.create_video(
-                script=script,
-                model_id="default",
-                language="ko" if voice_type.lower() == "korean" else "en",
+            video_params = {
+                "model_id": "default",
+                "language": "ko" if voice_key == "korean" else "en",
+            }
+
+        settings_used = {
+            "voice_type": voice_type,
+            "background": background,
+            "script_length": len(script),
+        }
+        if stream:
+            return _video_creation_response(
+                request,
+                video_service,
+                script,
+                video_params,
+                {"settings_used": settings_used},
             )
 
+        video_result = await _create_video_coalesced(
+            video_service, script, **video_params
+        )
+
         if not video_result.get("success"):
             error_msg = video_result.get("error", "알 수 없는 오류")
             raise HTTPException(status_code=500, detail=f"영상 생성 실패: {error_msg}")
 
         video_id = video_result.get("video_id") or video_result.get("project_id")
 
-        logger.info(f"빠른 영상 생성 완료: video_id={video_id}")
+        logger.info("빠른 영상 생성 완료: video_id=%s", video_id)
 
         return {
             "video_id": video_id,
             "video_url": video_result.get("video_url"),
             "status": video_result.get("status"),
             "provider": video_service.get_provider(),
-            "settings_used": {
-                "voice_type": voice_type,
-                "background": background,
-                "script_length": len(script),
-            },
+            "settings_used": settings_used,
         }
 
     except HTTPException:
@@ -980,73 +1430,76 @@ async def create_quick_video(
         raise HTTPException(status_code=500, detail=f"빠른 영상 생성 실패: {str(e)}")
 
 
+# 미리 정의된 영상 생성 프리셋 (GET 응답은 직렬화된 바이트를 재사용)
+_VIDEO_PRESETS: Dict[str, Dict[str, str]] = {
+    "professional_presentation": {
+        "name": "전문적인 프레젠테이션",
+        "avatar_id": "default",
+        "voice_id": "f8c69e517f424cafaecde32dde57096b",  # Allison
+        "background": "professional",
+        "description": "비즈니스 프레젠테이션에 적합",
+    },
+    "korean_news": {
+        "name": "한국어 뉴스 스타일",
+        "avatar_id": "default",
+        "voice_id": "bef4755ca1f442359c2fe6420690c8f7",  # InJoon
+        "background": "corporate",
+        "description": "한국어 뉴스 브리핑 스타일",
+    },
+    "colorful_marketing": {
+        "name": "컬러풀 마케팅",
+        "avatar_id": "default",
+        "voice_id": "f8c69e517f424cafaecde32dde57096b",  # Allison
+        "background": "gradient_blue",
+        "description": "활발한 마케팅 영상",
+    },
+    "minimal_education": {
+        "name": "미니멀 교육",
+        "avatar_id": "default",
+        "voice_id": "f8c69e517f424cafaecde32dde57096b",  # Allison
+        "background": "minimal",
+        "description": "깔끔한 교육 콘텐츠",
+    },
+    "greenscreen_custom": {
+        "name": "그린스크린 (커스텀 배경용)",
+        "avatar_id": "default",
+        "voice_id": "f8c69e517f424cafaecde32dde57096b",  # Allison
+        "background": "greenscreen",
+        "description": "후편집으로 배경 교체 가능",
+    },
+}
+_VIDEO_PRESETS_BODY = orjson.dumps({"presets": _VIDEO_PRESETS})
+
+
 @router.get("/video-presets")
-async def get_video_presets() -> Dict[str, Any]:
+async def get_video_presets() -> Response:
     """미리 정의된 영상 생성 프리셋들"""
-    return {
-        "presets": {
-            "professional_presentation": {
-                "name": "전문적인 프레젠테이션",
-                "avatar_id": "default",
-                "voice_id": "f8c69e517f424cafaecde32dde57096b",  # Allison
-                "background": "professional",
-                "description": "비즈니스 프레젠테이션에 적합",
-            },
-            "korean_news": {
-                "name": "한국어 뉴스 스타일",
-                "avatar_id": "default",
-                "voice_id": "bef4755ca1f442359c2fe6420690c8f7",  # InJoon
-                "background": "corporate",
-                "description": "한국어 뉴스 브리핑 스타일",
-            },
-            "colorful_marketing": {
-                "name": "컬러풀 마케팅",
-                "avatar_id": "default",
-                "voice_id": "f8c69e517f424cafaecde32dde57096b",  # Allison
-                "background": "gradient_blue",
-                "description": "활발한 마케팅 영상",
-            },
-            "minimal_education": {
-                "name": "미니멀 교육",
-                "avatar_id": "default",
-                "voice_id": "f8c69e517f424cafaecde32dde57096b",  # Allison
-                "background": "minimal",
-                "description": "깔끔한 교육 콘텐츠",
-            },
-            "greenscreen_custom": {
-                "name": "그린스크린 (커스텀 배경용)",
-                "avatar_id": "default",
-                "voice_id": "f8c69e517f424cafaecde32dde57096b",  # Allison
-                "background": "greenscreen",
-                "description": "후편집으로 배경 교체 가능",
-            },
-        }
-    }
+    return Response(content=_VIDEO_PRESETS_BODY, media_type="application/json")
 
 
 @router.post("/video-from-preset")
 async def create_video_from_preset(
+    request: Request,
     script: str,
     preset_name: str = Query(..., description="프리셋 이름"),
-) -> Dict[str, Any]:
-    """프리셋을 사용한 영상 생성"""
+    stream: bool = Query(
+        default=False, description="SSE로 생성/진행상황 스트리밍 여부"
+    ),
+):
+    """프리셋을 사용한 영상 생성 (stream=true면 SSE로 완료까지 전송)"""
     try:
         if not script or len(script.strip()) == 0:
             raise HTTPException(status_code=400, detail="스크립트가 비어있습니다")
 
-        # 프리셋 정보 가져오기
-        presets_response = await get_video_presets()
-        presets = presets_response.get("presets", {})
-
-        if preset_name not in presets:
-            available_presets = list(presets.keys())
+        preset = _VIDEO_PRESETS.get(preset_name)
+        if preset is None:
+            available_presets = list(_VIDEO_PRESETS)
             raise HTTPException(
                 status_code=400,
                 detail=f"존재하지 않는 프리셋: {preset_name}. 사용 가능한 프리셋: {available_presets}",
             )
 
-        preset = presets[preset_name]
-        logger.info(f"프리셋 영상 생성 시작: preset={preset_name}")
+        logger.info("프리셋 영상 생성 시작: preset=%s", preset_name)
 
         video_service = get_video_service()
 
@@ -1058,38 +1511,52 @@ async def create_video_from_preset(
 
         # 프리셋 설정으로 영상 생성
         if video_service.get_provider() == "heygen":
-            video_result = await video_service.create_video(
-                script=script,
-                avatar_id=preset["avatar_id"],
-                voice_id=preset["voice_id"],
-                background=preset["background"],
-            )
+            video_params = {
+                "avatar_id": preset["avatar_id"],
+                "voice_id": preset["voice_id"],
+                "background": preset["background"],
+            }
         else:
             # AIStudios는 기본 설정으로
-            video_result = await video_service.create_video(
-                script=script,
-                model_id="default",
-                language="ko" if "korean" in preset_name.lower() else "en",
+            video_params = {
+                "model_id": "default",
+                "language": "ko" if "korean" in preset_name.lower() else "en",
+            }
+
+        preset_used = {
+            "name": preset_name,
+            "description": preset["description"],
+            **preset,
+        }
+        if stream:
+            return _video_creation_response(
+                request,
+                video_service,
+                script,
+                video_params,
+                {"preset_used": preset_used},
             )
 
+        video_result = await _create_video_coalesced(
+            video_service, script, **video_params
+        )
+
         if not video_result.get("success"):
             error_msg = video_result.get("error", "알 수 없는 오류")
             raise HTTPException(status_code=500, detail=f"영상 생성 실패: {error_msg}")
 
         video_id = video_result.get("video_id") or video_result.get("project_id")
 
-        logger.info(f"프리셋 영상 생성 완료: preset={preset_name}, video_id={video_id}")
+        logger.info(
+            "프리셋 영상 생성 완료: preset=%s, video_id=%s", preset_name, video_id
+        )
 
         return {
             "video_id": video_id,
             "video_url": video_result.get("video_url"),
             "status": video_result.get("status"),
             "provider": video_service.get_provider(),
-            "preset_used": {
-                "name": preset_name,
-                "description": preset["description"],
-                **preset,
-            },
+            "preset_used": preset_used,
         }
 
     except HTTPException:
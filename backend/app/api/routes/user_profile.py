@@ -1,15 +1,22 @@
 # app/api/routes/user_profile.py
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
+import asyncio
 import sqlite3
 import logging
+import orjson
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
 from app.config import settings
+from app.api.profile_cache import invalidate_profile
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 class UserProfileCreate(BaseModel):
     user_id: str
@@ -52,123 +59,146 @@ def get_db_path():
     """데이터베이스 경로 가져오기"""
     return getattr(settings, 'DB_PATH', 'data/financial_data.db')
 
+def _connect():
+    """프로세스 공유 연결 (autocommit + WAL)"""
+    conn = sqlite3.connect(get_db_path(), check_same_thread=False, isolation_level=None)
+    # 컬럼명으로 dict 변환 가능한 행 (인덱스 접근도 그대로 지원)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    return conn
+
+# 요청마다 열고 닫지 않고 하나의 연결을 공유, 접근은 lock으로 직렬화
+# (import 시 I/O 없이 첫 사용 시점에 연결, 보통 lifespan의 init_user_tables)
+_conn: Optional[sqlite3.Connection] = None
+_db_lock = threading.Lock()
+
+def _shared_conn() -> sqlite3.Connection:
+    """공유 연결 반환 (_db_lock 보유 상태에서 호출)"""
+    global _conn
+    if _conn is None:
+        _conn = _connect()
+    return _conn
+
+@contextmanager
+def _transaction():
+    """여러 쓰기를 한 트랜잭션으로 묶어 커밋 1회로 처리 (시작 시 쓰기 lock 확보)"""
+    with _db_lock:
+        conn = _shared_conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+_tables_initialized = False
+
 def init_user_tables():
-    """사용자 관련 테이블 초기화"""
-    conn = sqlite3.connect(get_db_path())
-    cursor = conn.cursor()
-    
-    # 사용자 프로필 테이블
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS user_profiles (
-            user_id TEXT PRIMARY KEY,
-            name TEXT,
-            age INTEGER,
-            investment_experience TEXT NOT NULL,
-            risk_tolerance TEXT NOT NULL,
-            investment_goals TEXT NOT NULL,  -- JSON 문자열로 저장
-            investment_style TEXT,
-            preferred_sectors TEXT NOT NULL,  -- JSON 문자열로 저장
-            investment_amount_range TEXT,
-            news_keywords TEXT DEFAULT '[]',  -- JSON 문자열로 저장
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
+    """사용자 관련 테이블 초기화 (프로세스당 1회, lifespan에서 호출)"""
+    global _tables_initialized
+    with _db_lock:
+        if _tables_initialized:
+            return
+        
+        cursor = _shared_conn().cursor()
     
-    # 기존 테이블에 새 컬럼이 없다면 추가
-    try:
-        cursor.execute("ALTER TABLE user_profiles ADD COLUMN name TEXT")
-    except sqlite3.OperationalError:
-        pass  # 컬럼이 이미 존재함
+        # 사용자 프로필 테이블
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS user_profiles (
+                user_id TEXT PRIMARY KEY,
+                name TEXT,
+                age INTEGER,
+                investment_experience TEXT NOT NULL,
+                risk_tolerance TEXT NOT NULL,
+                investment_goals TEXT NOT NULL,  -- JSON 문자열로 저장
+                investment_style TEXT,
+                preferred_sectors TEXT NOT NULL,  -- JSON 문자열로 저장
+                investment_amount_range TEXT,
+                news_keywords TEXT DEFAULT '[]',  -- JSON 문자열로 저장
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
     
-    try:
-        cursor.execute("ALTER TABLE user_profiles ADD COLUMN age INTEGER")
-    except sqlite3.OperationalError:
-        pass  # 컬럼이 이미 존재함
+        # 기존 테이블에 새 컬럼이 없다면 추가
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(user_profiles)")}
+        if "name" not in columns:
+            cursor.execute("ALTER TABLE user_profiles ADD COLUMN name TEXT")
+        if "age" not in columns:
+            cursor.execute("ALTER TABLE user_profiles ADD COLUMN age INTEGER")
     
-    # 사용자 포트폴리오 테이블 (기존 테이블이 있다면 업데이트)
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS user_portfolios (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id TEXT NOT NULL,
-            symbol TEXT NOT NULL,
-            company_name TEXT NOT NULL,
-            shares INTEGER NOT NULL,
-            avg_price REAL NOT NULL,
-            sector TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            UNIQUE(user_id, symbol)
-        )
-    ''')
+        # 사용자 포트폴리오 테이블 (기존 테이블이 있다면 업데이트)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS user_portfolios (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id TEXT NOT NULL,
+                symbol TEXT NOT NULL,
+                company_name TEXT NOT NULL,
+                shares INTEGER NOT NULL,
+                avg_price REAL NOT NULL,
+                sector TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE(user_id, symbol)
+            )
+        ''')
     
-    conn.commit()
-    conn.close()
+        # 사용자별 조회 + company_name 정렬을 인덱스로 처리
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_portfolio_user_name ON user_portfolios(user_id, company_name)")
+        cursor.execute("ANALYZE user_portfolios")
+        
+        _tables_initialized = True
 
-# 서버 시작시 테이블 초기화
-init_user_tables()
+def _save_profile(user_id: str, values: tuple) -> str:
+    """프로필 저장 후 "created" / "updated" 반환"""
+    with _transaction() as conn:
+        # 없으면 생성 (이미 있으면 무시되어 rowcount 0)
+        cursor = conn.execute('''
+            INSERT INTO user_profiles 
+            (name, age, investment_experience, risk_tolerance, investment_goals,
+             investment_style, preferred_sectors, investment_amount_range, news_keywords, user_id)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(user_id) DO NOTHING
+        ''', values + (user_id,))
+        
+        if cursor.rowcount:
+            return "created"
+        
+        # 기존 프로필 업데이트
+        conn.execute('''
+            UPDATE user_profiles 
+            SET name = ?, age = ?, investment_experience = ?, risk_tolerance = ?, investment_goals = ?,
+                investment_style = ?, preferred_sectors = ?, investment_amount_range = ?,
+                news_keywords = ?, updated_at = CURRENT_TIMESTAMP
+            WHERE user_id = ?
+        ''', values + (user_id,))
+        return "updated"
 
 @router.post("/profile", response_model=Dict[str, Any])
 async def create_user_profile(profile: UserProfileCreate):
     """사용자 프로필 생성/업데이트"""
     try:
-        conn = sqlite3.connect(get_db_path())
-        cursor = conn.cursor()
-        
-        # JSON 문자열로 변환
-        import json
-        investment_goals_json = json.dumps(profile.investment_goals, ensure_ascii=False)
-        preferred_sectors_json = json.dumps(profile.preferred_sectors, ensure_ascii=False)
-        news_keywords_json = json.dumps(profile.news_keywords, ensure_ascii=False)
-        
-        # 기존 프로필이 있는지 확인
-        cursor.execute("SELECT user_id FROM user_profiles WHERE user_id = ?", (profile.user_id,))
-        existing_profile = cursor.fetchone()
-        
-        if existing_profile:
-            # 업데이트
-            cursor.execute('''
-                UPDATE user_profiles 
-                SET name = ?, age = ?, investment_experience = ?, risk_tolerance = ?, investment_goals = ?,
-                    investment_style = ?, preferred_sectors = ?, investment_amount_range = ?,
-                    news_keywords = ?, updated_at = CURRENT_TIMESTAMP
-                WHERE user_id = ?
-            ''', (
-                profile.name,
-                profile.age,
-                profile.investment_experience,
-                profile.risk_tolerance,
-                investment_goals_json,
-                profile.investment_style,
-                preferred_sectors_json,
-                profile.investment_amount_range,
-                news_keywords_json,
-                profile.user_id
-            ))
-            action = "updated"
-        else:
-            # 새로 생성
-            cursor.execute('''
-                INSERT INTO user_profiles 
-                (user_id, name, age, investment_experience, risk_tolerance, investment_goals,
-                 investment_style, preferred_sectors, investment_amount_range, news_keywords)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                profile.user_id,
-                profile.name,
-                profile.age,
-                profile.investment_experience,
-                profile.risk_tolerance,
-                investment_goals_json,
-                profile.investment_style,
-                preferred_sectors_json,
-                profile.investment_amount_range,
-                news_keywords_json
-            ))
-            action = "created"
+        # JSON 문자열로 변환 (orjson은 UTF-8 그대로 출력)
+        investment_goals_json = orjson.dumps(profile.investment_goals).decode()
+        preferred_sectors_json = orjson.dumps(profile.preferred_sectors).decode()
+        news_keywords_json = orjson.dumps(profile.news_keywords).decode()
+        
+        values = (
+            profile.name,
+            profile.age,
+            profile.investment_experience,
+            profile.risk_tolerance,
+            investment_goals_json,
+            profile.investment_style,
+            preferred_sectors_json,
+            profile.investment_amount_range,
+            news_keywords_json
+        )
         
-        conn.commit()
-        conn.close()
+        action = await asyncio.to_thread(_save_profile, profile.user_id, values)
         
         logger.info(f"사용자 프로필 {action}: {profile.user_id}")
         
@@ -183,36 +213,39 @@ async def create_user_profile(profile: UserProfileCreate):
         logger.error(f"사용자 프로필 저장 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=f"프로필 저장 중 오류가 발생했습니다: {str(e)}")
 
+def _read_profile(user_id: str):
+    """프로필 + 포트폴리오 개수 한 번에 조회"""
+    with _db_lock:
+        return _shared_conn().execute('''
+            SELECT name, age, investment_experience, risk_tolerance, investment_goals,
+                   investment_style, preferred_sectors, investment_amount_range, news_keywords,
+                   (SELECT COUNT(*) FROM user_portfolios WHERE user_id = p.user_id)
+            FROM user_profiles p WHERE user_id = ?
+        ''', (user_id,)).fetchone()
+
+@lru_cache(maxsize=1024)
+def _parse_profile_lists(goals_json, sectors_json, keywords_json) -> tuple:
+    """프로필 JSON 배열 컬럼 파싱 (저장값이 바뀌면 키도 바뀌어 자동 갱신)"""
+    return tuple(
+        tuple(orjson.loads(blob)) if blob else ()
+        for blob in (goals_json, sectors_json, keywords_json)
+    )
+
 @router.get("/profile/{user_id}", response_model=UserProfileResponse)
 async def get_user_profile(user_id: str):
     """사용자 프로필 조회"""
     try:
-        conn = sqlite3.connect(get_db_path())
-        cursor = conn.cursor()
-        
-        # 프로필 조회
-        cursor.execute('''
-            SELECT name, age, investment_experience, risk_tolerance, investment_goals,
-                   investment_style, preferred_sectors, investment_amount_range, news_keywords
-            FROM user_profiles WHERE user_id = ?
-        ''', (user_id,))
-        
-        profile_data = cursor.fetchone()
+        profile_data = await asyncio.to_thread(_read_profile, user_id)
         
         if not profile_data:
             raise HTTPException(status_code=404, detail="사용자 프로필을 찾을 수 없습니다")
         
-        # 포트폴리오 개수 조회
-        cursor.execute("SELECT COUNT(*) FROM user_portfolios WHERE user_id = ?", (user_id,))
-        portfolio_count = cursor.fetchone()[0]
-        
-        conn.close()
+        portfolio_count = profile_data[9]
         
-        # JSON 문자열 파싱
-        import json
-        investment_goals = json.loads(profile_data[4]) if profile_data[4] else []
-        preferred_sectors = json.loads(profile_data[6]) if profile_data[6] else []
-        news_keywords = json.loads(profile_data[8]) if profile_data[8] else []
+        # JSON 문자열 파싱 (같은 저장값이면 캐시 재사용)
+        investment_goals, preferred_sectors, news_keywords = _parse_profile_lists(
+            profile_data[4], profile_data[6], profile_data[8]
+        )
         
         return UserProfileResponse(
             user_id=user_id,
@@ -235,33 +268,33 @@ async def get_user_profile(user_id: str):
         logger.error(f"사용자 프로필 조회 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=f"프로필 조회 중 오류가 발생했습니다: {str(e)}")
 
+def _replace_portfolio(user_id: str, rows: List[tuple]):
+    """기존 포트폴리오 삭제 후 새 종목 일괄 입력"""
+    with _transaction() as conn:
+        conn.execute("DELETE FROM user_portfolios WHERE user_id = ?", (user_id,))
+        conn.executemany('''
+            INSERT INTO user_portfolios 
+            (user_id, symbol, company_name, shares, avg_price, sector)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', rows)
+
 @router.post("/portfolio", response_model=Dict[str, Any])
 async def create_user_portfolio(portfolio: UserPortfolioCreate):
     """사용자 포트폴리오 생성/업데이트"""
     try:
-        conn = sqlite3.connect(get_db_path())
-        cursor = conn.cursor()
-        
-        # 기존 포트폴리오 삭제
-        cursor.execute("DELETE FROM user_portfolios WHERE user_id = ?", (portfolio.user_id,))
-        
-        # 새 포트폴리오 입력
-        for holding in portfolio.holdings:
-            cursor.execute('''
-                INSERT INTO user_portfolios 
-                (user_id, symbol, company_name, shares, avg_price, sector)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (
+        rows = [
+            (
                 portfolio.user_id,
                 holding.symbol,
                 holding.company_name,
                 holding.shares,
                 holding.avg_price,
                 holding.sector
-            ))
-        
-        conn.commit()
-        conn.close()
+            )
+            for holding in portfolio.holdings
+        ]
+        await asyncio.to_thread(_replace_portfolio, portfolio.user_id, rows)
+        invalidate_profile(portfolio.user_id)
         
         logger.info(f"사용자 포트폴리오 저장: {portfolio.user_id}, {len(portfolio.holdings)}개 종목")
         
@@ -276,31 +309,22 @@ async def create_user_portfolio(portfolio: UserPortfolioCreate):
         logger.error(f"포트폴리오 저장 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=f"포트폴리오 저장 중 오류가 발생했습니다: {str(e)}")
 
+def _read_portfolio(user_id: str) -> List[sqlite3.Row]:
+    """보유 종목 조회 (company_name 순)"""
+    with _db_lock:
+        return _shared_conn().execute('''
+            SELECT symbol, company_name, shares, avg_price, sector
+            FROM user_portfolios WHERE user_id = ?
+            ORDER BY company_name
+        ''', (user_id,)).fetchall()
+
 @router.get("/portfolio/{user_id}")
 async def get_user_portfolio(user_id: str):
     """사용자 포트폴리오 조회"""
     try:
-        conn = sqlite3.connect(get_db_path())
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT symbol, company_name, shares, avg_price, sector
-            FROM user_portfolios WHERE user_id = ?
-            ORDER BY company_name
-        ''', (user_id,))
-        
-        holdings = cursor.fetchall()
-        conn.close()
+        holdings = await asyncio.to_thread(_read_portfolio, user_id)
         
-        portfolio_list = []
-        for holding in holdings:
-            portfolio_list.append({
-                "symbol": holding[0],
-                "company_name": holding[1],
-                "shares": holding[2],
-                "avg_price": holding[3],
-                "sector": holding[4]
-            })
+        portfolio_list = [dict(holding) for holding in holdings]
         
         return {
             "user_id": user_id,
@@ -312,19 +336,18 @@ async def get_user_portfolio(user_id: str):
         logger.error(f"포트폴리오 조회 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=f"포트폴리오 조회 중 오류가 발생했습니다: {str(e)}")
 
+def _delete_user(user_id: str):
+    """프로필과 포트폴리오 모두 삭제"""
+    with _transaction() as conn:
+        conn.execute("DELETE FROM user_profiles WHERE user_id = ?", (user_id,))
+        conn.execute("DELETE FROM user_portfolios WHERE user_id = ?", (user_id,))
+
 @router.delete("/profile/{user_id}")
 async def delete_user_profile(user_id: str):
     """사용자 프로필 삭제"""
     try:
-        conn = sqlite3.connect(get_db_path())
-        cursor = conn.cursor()
-        
-        # 프로필과 포트폴리오 모두 삭제
-        cursor.execute("DELETE FROM user_profiles WHERE user_id = ?", (user_id,))
-        cursor.execute("DELETE FROM user_portfolios WHERE user_id = ?", (user_id,))
-        
-        conn.commit()
-        conn.close()
+        await asyncio.to_thread(_delete_user, user_id)
+        invalidate_profile(user_id)
         
         return {"success": True, "message": "사용자 데이터가 삭제되었습니다"}
         
@@ -332,22 +355,20 @@ async def delete_user_profile(user_id: str):
         logger.error(f"사용자 데이터 삭제 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=f"데이터 삭제 중 오류가 발생했습니다: {str(e)}")
 
+def _read_setup(user_id: str) -> tuple:
+    """프로필 존재 여부 + 포트폴리오 개수 한 번에 조회"""
+    with _db_lock:
+        return _shared_conn().execute('''
+            SELECT EXISTS(SELECT 1 FROM user_profiles WHERE user_id = ?),
+                   (SELECT COUNT(*) FROM user_portfolios WHERE user_id = ?)
+        ''', (user_id, user_id)).fetchone()
+
 @router.get("/check/{user_id}")
 async def check_user_setup(user_id: str):
     """사용자 설정 완료 여부 확인"""
     try:
-        conn = sqlite3.connect(get_db_path())
-        cursor = conn.cursor()
-        
-        # 프로필 존재 여부 확인
-        cursor.execute("SELECT user_id FROM user_profiles WHERE user_id = ?", (user_id,))
-        has_profile = cursor.fetchone() is not None
-        
-        # 포트폴리오 존재 여부 확인
-        cursor.execute("SELECT COUNT(*) FROM user_portfolios WHERE user_id = ?", (user_id,))
-        portfolio_count = cursor.fetchone()[0]
-        
-        conn.close()
+        has_profile, portfolio_count = await asyncio.to_thread(_read_setup, user_id)
+        has_profile = bool(has_profile)
         
         return {
             "user_id": user_id,
@@ -1,11 +1,19 @@
 # app/api/routes/users.py
-from fastapi import APIRouter, HTTPException
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException
 from typing import List, Dict
 from pydantic import BaseModel
 from app.services.core.personalized_insight_generator import PersonalizedInsightGenerator
+from app.services.storage.enhanced_data_collector import EnhancedDataCollector
+from app.deps import get_data_collector, get_insight_generator
+from app.config import get_conn
+from app.api.http_cache import get_or_fetch
+from app.api.profile_cache import invalidate_profile, profile_cache, profile_cache_key
 
 router = APIRouter()
-insight_generator = PersonalizedInsightGenerator()
+
+# user_portfolios 조회 결과 컬럼 순서
+HOLDING_FIELDS = ("symbol", "company_name", "shares", "avg_price", "sector")
 
 
 # Pydantic 모델 정의
@@ -25,11 +33,18 @@ class UserPreferences(BaseModel):
 
 
 @router.post("/portfolio/{user_id}")
-async def save_user_portfolio(user_id: str, portfolio: List[StockHolding]):
+async def save_user_portfolio(
+    user_id: str,
+    portfolio: List[StockHolding],
+    insight_generator: PersonalizedInsightGenerator = Depends(get_insight_generator),
+):
     """사용자 포트폴리오 저장"""
     try:
-        portfolio_data = [holding.dict() for holding in portfolio]
-        insight_generator.save_user_portfolio(user_id, portfolio_data)
+        portfolio_data = [holding.model_dump() for holding in portfolio]
+        await asyncio.to_thread(
+            insight_generator.save_user_portfolio, user_id, portfolio_data
+        )
+        invalidate_profile(user_id)
 
         return {
             "message": "포트폴리오가 성공적으로 저장되었습니다",
@@ -42,15 +57,23 @@ async def save_user_portfolio(user_id: str, portfolio: List[StockHolding]):
 
 
 @router.post("/preferences/{user_id}")
-async def save_user_preferences(user_id: str, preferences: UserPreferences):
+async def save_user_preferences(
+    user_id: str,
+    preferences: UserPreferences,
+    insight_generator: PersonalizedInsightGenerator = Depends(get_insight_generator),
+):
     """사용자 투자 선호도 저장"""
     try:
-        insight_generator.save_user_preferences(user_id, preferences.dict())
+        preferences_data = preferences.model_dump(mode="json")
+        await asyncio.to_thread(
+            insight_generator.save_user_preferences, user_id, preferences_data
+        )
+        invalidate_profile(user_id)
 
         return {
             "message": "투자 선호도가 성공적으로 저장되었습니다",
             "user_id": user_id,
-            "preferences": preferences.dict(),
+            "preferences": preferences_data,
         }
 
     except Exception as e:
@@ -58,27 +81,23 @@ async def save_user_preferences(user_id: str, preferences: UserPreferences):
 
 
 @router.get("/profile/{user_id}")
-async def get_user_profile(user_id: str):
+async def get_user_profile(
+    user_id: str,
+    data_collector: EnhancedDataCollector = Depends(get_data_collector),
+):
     """사용자 프로필 조회 (포트폴리오 + 선호도)"""
     try:
-        from app.services.storage.enhanced_data_collector import EnhancedDataCollector
-
-        data_collector = EnhancedDataCollector()
-
-        personalized_data = data_collector.get_personalized_data(user_id)
+        personalized_data = await get_or_fetch(
+            profile_cache,
+            profile_cache_key(user_id),
+            lambda: asyncio.to_thread(data_collector.get_personalized_data, user_id),
+        )
 
-        # 포트폴리오 데이터 포맷팅
-        portfolio = []
-        for holding in personalized_data.get("portfolio", []):
-            portfolio.append(
-                {
-                    "symbol": holding[0],
-                    "company_name": holding[1],
-                    "shares": holding[2],
-                    "avg_price": holding[3],
-                    "sector": holding[4] if len(holding) > 4 else None,
-                }
-            )
+        # 포트폴리오 데이터 포맷팅 (SELECT 컬럼 순서 = HOLDING_FIELDS)
+        portfolio = [
+            dict(zip(HOLDING_FIELDS, holding))
+            for holding in personalized_data.get("portfolio", [])
+        ]
 
         return {
             "user_id": user_id,
@@ -94,7 +113,10 @@ async def get_user_profile(user_id: str):
 
 
 @router.post("/demo-data/{user_id}")
-async def create_demo_user_data(user_id: str):
+async def create_demo_user_data(
+    user_id: str,
+    insight_generator: PersonalizedInsightGenerator = Depends(get_insight_generator),
+):
     """데모용 사용자 데이터 생성"""
     try:
         # 데모 포트폴리오
@@ -130,9 +152,14 @@ async def create_demo_user_data(user_id: str):
             "news_keywords": ["AI", "인공지능", "ChatGPT", "NVIDIA", "반도체"],
         }
 
-        # 데이터 저장
-        insight_generator.save_user_portfolio(user_id, demo_portfolio)
-        insight_generator.save_user_preferences(user_id, demo_preferences)
+        # 데이터 저장 (한 트랜잭션)
+        await asyncio.to_thread(
+            insight_generator.save_user_data,
+            user_id,
+            demo_portfolio,
+            demo_preferences,
+        )
+        invalidate_profile(user_id)
 
         return {
             "message": "데모 사용자 데이터가 생성되었습니다",
@@ -145,23 +172,31 @@ async def create_demo_user_data(user_id: str):
         raise HTTPException(status_code=500, detail=f"데모 데이터 생성 실패: {str(e)}")
 
 
+def _delete_user_records(user_id: str) -> int:
+    """포트폴리오 및 선호도 삭제 (블로킹 SQLite 작업)"""
+    conn = get_conn()
+
+    # 두 DELETE를 한 트랜잭션으로 묶어 커밋(fsync) 1회
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        portfolio_deleted = conn.execute(
+            "DELETE FROM user_portfolios WHERE user_id = ?", (user_id,)
+        ).rowcount
+        conn.execute("DELETE FROM user_preferences WHERE user_id = ?", (user_id,))
+        conn.execute("COMMIT")
+    except Exception:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        raise
+    return portfolio_deleted
+
+
 @router.delete("/profile/{user_id}")
 async def delete_user_profile(user_id: str):
     """사용자 프로필 삭제"""
     try:
-        import sqlite3
-        from app.config import settings
-
-        conn = sqlite3.connect(settings.DB_PATH)
-        cursor = conn.cursor()
-
-        # 포트폴리오 및 선호도 삭제
-        cursor.execute("DELETE FROM user_portfolios WHERE user_id = ?", (user_id,))
-        cursor.execute("DELETE FROM user_preferences WHERE user_id = ?", (user_id,))
-
-        portfolio_deleted = cursor.rowcount
-        conn.commit()
-        conn.close()
+        portfolio_deleted = await asyncio.to_thread(_delete_user_records, user_id)
+        invalidate_profile(user_id)
 
         return {
             "message": "사용자 프로필이 삭제되었습니다",
@@ -174,7 +209,9 @@ async def delete_user_profile(user_id: str):
 
 
 @router.get("/test")
-async def test_user_management():
+async def test_user_management(
+    insight_generator: PersonalizedInsightGenerator = Depends(get_insight_generator),
+):
     """사용자 관리 기능 테스트"""
     try:
         # 테스트용 사용자 ID
@@ -191,7 +228,10 @@ async def test_user_management():
             }
         ]
 
-        insight_generator.save_user_portfolio(test_user_id, demo_portfolio)
+        await asyncio.to_thread(
+            insight_generator.save_user_portfolio, test_user_id, demo_portfolio
+        )
+        invalidate_profile(test_user_id)
 
         return {
             "status": "success",
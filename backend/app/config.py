@@ -1,6 +1,8 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import Optional, List
+from typing import Optional, List, Dict
 import os
+import sqlite3
+import threading
 
 
 class Settings(BaseSettings):
@@ -45,6 +47,7 @@ class Settings(BaseSettings):
     log_level: str = "INFO"
     api_host: str = "0.0.0.0"
     api_port: int = 8000
+    max_worker_threads: int = 64  # 블로킹 수집/분석 작업용 스레드 수
 
     # --- 데이터 수집 설정 ---
     max_news_count: int = 20
@@ -52,6 +55,7 @@ class Settings(BaseSettings):
     cache_duration_minutes: int = 30
     request_timeout: int = 10
     request_delay: float = 1.0
+    healthcheck_interval_seconds: int = 60  # /test 상태 갱신 주기
 
     # --- Pydantic v2 문법으로 설정 클래스 구성 ---
     model_config = SettingsConfigDict(
@@ -71,6 +75,33 @@ if db_dir:
 
 os.makedirs(settings.CACHE_DIR, exist_ok=True)
 
+# 연결 생성 시 1회 적용하는 SQLite 설정
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-64000",  # 64MB 페이지 캐시
+    "PRAGMA mmap_size=268435456",  # 256MB
+    "PRAGMA temp_store=MEMORY",
+)
+
+# 워커 스레드별 DB 경로 → 연결
+_thread_local = threading.local()
+
+
+def get_conn(db_path: Optional[str] = None) -> sqlite3.Connection:
+    """스레드마다 재사용하는 SQLite 연결 (autocommit, 트랜잭션은 호출 측에서 BEGIN)"""
+    db_path = db_path or settings.DB_PATH
+    conns: Dict[str, sqlite3.Connection] = _thread_local.__dict__.setdefault(
+        "conns", {}
+    )
+    conn = conns.get(db_path)
+    if conn is None:
+        conn = sqlite3.connect(db_path, isolation_level=None)
+        for pragma in _SQLITE_PRAGMAS:
+            conn.execute(pragma)
+        conns[db_path] = conn
+    return conn
+
 
 # 설정 확인 함수
 def check_api_settings():
@@ -1,8 +1,14 @@
 import os
-import json
-import requests
+import gzip
 import time
-from tqdm import tqdm
+import asyncio
+import hashlib
+import httpx
+import orjson
+import zipfile
+from io import BytesIO
+from lxml import etree
+from tqdm.asyncio import tqdm_asyncio
 from datetime import datetime, timedelta
 import logging
 from pathlib import Path
@@ -20,22 +26,88 @@ BASE_URL = "https://opendart.fss.or.kr/api"
 DATA_DIR = "/app/data/crawled/dart_api"
 Path(DATA_DIR).mkdir(parents=True, exist_ok=True)
 
+MAX_CONCURRENCY = 8  # DART 초당 요청 제한 내 동시 요청 수
+MAX_RETRIES = 5  # 429/5xx 응답 재시도 횟수
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# 응답 디스크 캐시 (재실행 시 네트워크 생략)
+CACHE_DIR = os.path.join(os.getenv("CACHE_DIR", "/app/data/cache"), "dart")
+CACHE_TTL_MINUTES = int(os.getenv("CACHE_DURATION_MINUTES", "30"))
+CACHEABLE_STATUSES = {"000", "013"}  # 정상, 조회된 데이터 없음
+
+# 공용 HTTP 클라이언트 (전 엔드포인트에서 커넥션/TLS 재사용)
+def create_client():
+    """DART API용 AsyncClient 생성"""
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=3,  # 연결 실패 재시도
+        limits=httpx.Limits(
+            max_connections=MAX_CONCURRENCY,
+            max_keepalive_connections=MAX_CONCURRENCY,
+        ),
+    )
+    return httpx.AsyncClient(base_url=BASE_URL, timeout=30.0, transport=transport)
+
+# 캐시 파일 경로 (인증키를 제외한 엔드포인트+파라미터 해시)
+def cache_path(endpoint, params):
+    key_params = {k: v for k, v in params.items() if k != "crtfc_key"}
+    raw = orjson.dumps({"ep": endpoint, "p": key_params}, option=orjson.OPT_SORT_KEYS)
+    key = hashlib.sha1(raw).hexdigest()
+    return Path(CACHE_DIR) / key[:2] / f"{key}.json.gz"
+
+def read_cache(path):
+    """TTL 내 캐시 파일이 있으면 반환, 없거나 만료되면 None"""
+    try:
+        if time.time() - path.stat().st_mtime > CACHE_TTL_MINUTES * 60:
+            return None
+        with gzip.open(path, "rb") as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+def write_cache(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    with gzip.open(tmp_path, "wb") as f:
+        f.write(orjson.dumps(data))
+    tmp_path.replace(path)
+
 # API 요청 함수
-def api_request(endpoint, params, sleep_time=1.0):
-    """DART API 요청 공통 함수"""
-    url = f"{BASE_URL}/{endpoint}"
+async def api_request(client, endpoint, params, sleep_time=1.0):
+    """DART API 요청 공통 함수 (디스크 캐시 우선, 429/5xx 응답 시에만 백오프 후 재시도)"""
+    path = cache_path(endpoint, params)
+    cached = await asyncio.to_thread(read_cache, path)
+    if cached is not None:
+        return cached
+
     try:
-        response = requests.get(url, params=params)
+        for attempt in range(MAX_RETRIES + 1):
+            response = await client.get(endpoint, params=params)
+            if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                break
+            await asyncio.sleep(sleep_time * 2**attempt)  # API 서버 부하 방지
         response.raise_for_status()
-        data = response.json()
-        time.sleep(sleep_time)  # API 서버 부하 방지
+        data = orjson.loads(response.content)
+        if data.get("status") in CACHEABLE_STATUSES:
+            await asyncio.to_thread(write_cache, path, data)
         return data
     except Exception as e:
         logger.error(f"API 요청 실패 ({endpoint}): {str(e)}")
         return {"status": "error", "message": str(e)}
 
+async def gather_by_corp(fetch_one, corp_codes):
+    """기업별 요청을 동시 실행 (세마포어로 동시 요청 수 제한), corp_code 순서 유지"""
+    sem = asyncio.Semaphore(MAX_CONCURRENCY)
+
+    async def run(corp_code):
+        async with sem:
+            return await fetch_one(corp_code)
+
+    results = await tqdm_asyncio.gather(*[run(code) for code in corp_codes])
+    return dict(zip(corp_codes, results))
+
 # 1. 공시정보 수집 함수
-def fetch_disclosure_list(api_key, start_date, end_date, corp_code=None, max_count=1000):
+async def fetch_disclosure_list(client, api_key, start_date, end_date, corp_code=None, max_count=1000):
     """
     공시목록 API를 통해 공시 리스트 수집
     - start_date, end_date: 'YYYYMMDD' 형식
@@ -54,60 +126,61 @@ def fetch_disclosure_list(api_key, start_date, end_date, corp_code=None, max_cou
     if corp_code:
         params["corp_code"] = corp_code
 
-
-    if corp_code:
-        params["corp_code"] = corp_code
-
+    # 첫 페이지로 total_page 확인
     all_reports = []
-    while len(all_reports) < max_count:
-        data = api_request("list.json", params)
-
-        if data.get("status") == "000":
-            reports = data.get("list", [])
-            all_reports.extend(reports)
-
-            if len(reports) < 100:
-                break
-
-            params["page_no"] += 1
+    data = await api_request(client, "list.json", params)
+    if data.get("status") != "000":
+        logger.error(f"공시목록 API 응답 오류: {data}")
+        data = {}
+    all_reports.extend(data.get("list", []))
+
+    # 나머지 페이지는 동시 요청 (max_count 까지만)
+    max_pages = -(-max_count // params["page_count"])
+    last_page = min(int(data.get("total_page") or 1), max_pages)
+    sem = asyncio.Semaphore(MAX_CONCURRENCY)
+
+    async def fetch_page(page_no):
+        async with sem:
+            return await api_request(client, "list.json", {**params, "page_no": page_no})
+
+    pages = await asyncio.gather(*[fetch_page(page_no) for page_no in range(2, last_page + 1)])
+    for page in pages:  # gather 결과는 page_no 순서
+        if page.get("status") == "000":
+            all_reports.extend(page.get("list", []))
         else:
-            logger.error(f"공시목록 API 응답 오류: {data}")
-            break
+            logger.error(f"공시목록 API 응답 오류: {page}")
 
     save_path = f"{DATA_DIR}/disclosure_list_{start_date}_{end_date}.json"
-    with open(save_path, "w", encoding="utf-8") as f:
-        json.dump(all_reports, f, ensure_ascii=False, indent=2)
+    Path(save_path).write_bytes(orjson.dumps(all_reports, option=orjson.OPT_INDENT_2))
 
     logger.info(f"공시목록 {len(all_reports)}건 수집 완료: {save_path}")
     return all_reports
 
 # 2. 기업개황 정보 수집 함수
-def fetch_company_info(api_key, corp_codes):
+async def fetch_company_info(client, api_key, corp_codes):
     """
     기업개황 정보 수집
     - corp_codes: 기업 고유번호 리스트
     """
     logger.info(f"기업개황 정보 수집 중... {len(corp_codes)}개 기업")
 
-    results = {}
-    for corp_code in tqdm(corp_codes):
+    async def fetch_one(corp_code):
         params = {
             "crtfc_key": api_key,
             "corp_code": corp_code,
         }
+        return await api_request(client, "company.json", params)
 
-        data = api_request("company.json", params)
-        results[corp_code] = data
+    results = await gather_by_corp(fetch_one, corp_codes)
 
     save_path = f"{DATA_DIR}/company_info.json"
-    with open(save_path, "w", encoding="utf-8") as f:
-        json.dump(results, f, ensure_ascii=False, indent=2)
+    Path(save_path).write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
 
     logger.info(f"기업개황 정보 {len(results)}건 수집 완료: {save_path}")
     return results
 
 # 3. 재무정보 수집 함수
-def fetch_financial_data(api_key, corp_codes, bsns_year, reprt_code="11011"):
+async def fetch_financial_data(client, api_key, corp_codes, bsns_year, reprt_code="11011"):
     """
     재무정보 수집
     - corp_codes: 기업 고유번호 리스트
@@ -116,10 +189,8 @@ def fetch_financial_data(api_key, corp_codes, bsns_year, reprt_code="11011"):
     """
     logger.info(f"재무정보 수집 중... {len(corp_codes)}개 기업, {bsns_year}년")
 
-    results = {"full": {}, "key": {}}
-    for corp_code in tqdm(corp_codes):
-        # 1. 전체 재무제표
-        full_params = {
+    async def fetch_one(corp_code):
+        params = {
             "crtfc_key": api_key,
             "corp_code": corp_code,
             "bsns_year": bsns_year,
@@ -127,30 +198,26 @@ def fetch_financial_data(api_key, corp_codes, bsns_year, reprt_code="11011"):
             "fs_div": "CFS",  # 연결재무제표
         }
 
-        full_data = api_request("fnlttSinglAcntAll.json", full_params, sleep_time=1.5)
-        results["full"][corp_code] = full_data
-
+        # 1. 전체 재무제표
+        full_data = await api_request(client, "fnlttSinglAcntAll.json", params, sleep_time=1.5)
         # 2. 주요계정 재무제표
-        key_params = {
-            "crtfc_key": api_key,
-            "corp_code": corp_code,
-            "bsns_year": bsns_year,
-            "reprt_code": reprt_code,
-            "fs_div": "CFS",  # 연결재무제표
-        }
+        key_data = await api_request(client, "fnlttSinglAcnt.json", params, sleep_time=1.5)
+        return full_data, key_data
 
-        key_data = api_request("fnlttSinglAcnt.json", key_params, sleep_time=1.5)
-        results["key"][corp_code] = key_data
+    fetched = await gather_by_corp(fetch_one, corp_codes)
+    results = {
+        "full": {code: full for code, (full, _) in fetched.items()},
+        "key": {code: key for code, (_, key) in fetched.items()},
+    }
 
     save_path = f"{DATA_DIR}/financial_data_{bsns_year}_{reprt_code}.json"
-    with open(save_path, "w", encoding="utf-8") as f:
-        json.dump(results, f, ensure_ascii=False, indent=2)
+    Path(save_path).write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
 
     logger.info(f"재무정보 {len(corp_codes)}개 기업 수집 완료: {save_path}")
     return results
 
 # 4. 배당정보 수집 함수
-def fetch_dividend_data(api_key, corp_codes, bsns_year):
+async def fetch_dividend_data(client, api_key, corp_codes, bsns_year):
     """
     배당정보 수집
     - corp_codes: 기업 고유번호 리스트
@@ -158,26 +225,24 @@ def fetch_dividend_data(api_key, corp_codes, bsns_year):
     """
     logger.info(f"배당정보 수집 중... {len(corp_codes)}개 기업, {bsns_year}년")
 
-    results = {}
-    for corp_code in tqdm(corp_codes):
+    async def fetch_one(corp_code):
         params = {
             "crtfc_key": api_key,
             "corp_code": corp_code,
             "bsns_year": bsns_year,
         }
+        return await api_request(client, "alotMatter.json", params)
 
-        data = api_request("alotMatter.json", params)
-        results[corp_code] = data
+    results = await gather_by_corp(fetch_one, corp_codes)
 
     save_path = f"{DATA_DIR}/dividend_data_{bsns_year}.json"
-    with open(save_path, "w", encoding="utf-8") as f:
-        json.dump(results, f, ensure_ascii=False, indent=2)
+    Path(save_path).write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
 
     logger.info(f"배당정보 {len(results)}건 수집 완료: {save_path}")
     return results
 
 # 5. 최대주주 현황 수집 함수
-def fetch_major_shareholders(api_key, corp_codes, bsns_year):
+async def fetch_major_shareholders(client, api_key, corp_codes, bsns_year):
     """
     최대주주 현황 수집
     - corp_codes: 기업 고유번호 리스트
@@ -185,26 +250,24 @@ def fetch_major_shareholders(api_key, corp_codes, bsns_year):
     """
     logger.info(f"최대주주 현황 수집 중... {len(corp_codes)}개 기업, {bsns_year}년")
 
-    results = {}
-    for corp_code in tqdm(corp_codes):
+    async def fetch_one(corp_code):
         params = {
             "crtfc_key": api_key,
             "corp_code": corp_code,
             "bsns_year": bsns_year,
         }
+        return await api_request(client, "hyslr.json", params)
 
-        data = api_request("hyslr.json", params)
-        results[corp_code] = data
+    results = await gather_by_corp(fetch_one, corp_codes)
 
     save_path = f"{DATA_DIR}/major_shareholders_{bsns_year}.json"
-    with open(save_path, "w", encoding="utf-8") as f:
-        json.dump(results, f, ensure_ascii=False, indent=2)
+    Path(save_path).write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
 
     logger.info(f"최대주주 현황 {len(results)}건 수집 완료: {save_path}")
     return results
 
 # 6. 임원 현황 수집 함수
-def fetch_executives(api_key, corp_codes, bsns_year):
+async def fetch_executives(client, api_key, corp_codes, bsns_year):
     """
     임원 현황 수집
     - corp_codes: 기업 고유번호 리스트
@@ -212,59 +275,56 @@ def fetch_executives(api_key, corp_codes, bsns_year):
     """
     logger.info(f"임원 현황 수집 중... {len(corp_codes)}개 기업, {bsns_year}년")
 
-    results = {}
-    for corp_code in tqdm(corp_codes):
+    async def fetch_one(corp_code):
         params = {
             "crtfc_key": api_key,
             "corp_code": corp_code,
             "bsns_year": bsns_year,
         }
+        return await api_request(client, "ofcr.json", params)
 
-        data = api_request("ofcr.json", params)
-        results[corp_code] = data
+    results = await gather_by_corp(fetch_one, corp_codes)
 
     save_path = f"{DATA_DIR}/executives_{bsns_year}.json"
-    with open(save_path, "w", encoding="utf-8") as f:
-        json.dump(results, f, ensure_ascii=False, indent=2)
+    Path(save_path).write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
 
     logger.info(f"임원 현황 {len(results)}건 수집 완료: {save_path}")
     return results
 
 # 7. 고유번호 목록 가져오기
-def fetch_corp_codes(api_key):
+def parse_corp_codes(zip_content):
+    """CORPCODE.xml을 <list> 단위로 스트리밍 파싱 (처리한 요소는 바로 해제)"""
+    corps = []
+    # ZIP 파일 열기
+    with zipfile.ZipFile(BytesIO(zip_content)) as z:
+        with z.open('CORPCODE.xml') as f:
+            for _, company in etree.iterparse(f, events=("end",), tag="list"):
+                stock_code = company.findtext('stock_code')
+
+                if stock_code and stock_code.strip():  # 상장기업만 수집
+                    corps.append({
+                        'corp_code': company.findtext('corp_code'),
+                        'corp_name': company.findtext('corp_name'),
+                        'stock_code': stock_code,
+                    })
+
+                company.clear()
+                while company.getprevious() is not None:
+                    del company.getparent()[0]
+    return corps
+
+async def fetch_corp_codes(client, api_key):
     """고유번호 목록 가져오기 (zip 파일로 제공)"""
-    import zipfile
-    import xml.etree.ElementTree as ET
-    from io import BytesIO
-
-    url = f"{BASE_URL}/corpCode.xml"
     params = {"crtfc_key": api_key}
 
     try:
-        response = requests.get(url, params=params)
+        response = await client.get("corpCode.xml", params=params)
         response.raise_for_status()
 
-        # ZIP 파일 열기
-        with zipfile.ZipFile(BytesIO(response.content)) as z:
-            with z.open('CORPCODE.xml') as f:
-                root = ET.parse(f).getroot()
-
-                corps = []
-                for company in root.findall('list'):
-                    corp_code = company.findtext('corp_code')
-                    corp_name = company.findtext('corp_name')
-                    stock_code = company.findtext('stock_code')
-
-                    if stock_code and stock_code.strip():  # 상장기업만 수집
-                        corps.append({
-                            'corp_code': corp_code,
-                            'corp_name': corp_name,
-                            'stock_code': stock_code,
-                        })
+        corps = await asyncio.to_thread(parse_corp_codes, response.content)
 
         save_path = f"{DATA_DIR}/corp_codes.json"
-        with open(save_path, "w", encoding="utf-8") as f:
-            json.dump(corps, f, ensure_ascii=False, indent=2)
+        Path(save_path).write_bytes(orjson.dumps(corps, option=orjson.OPT_INDENT_2))
 
         logger.info(f"고유번호 목록 {len(corps)}개 저장 완료: {save_path}")
         return corps
@@ -274,7 +334,7 @@ def fetch_corp_codes(api_key):
         return []
 
 # 전체 데이터 수집 파이프라인
-def collect_all_data(api_key, years=None, top_n=100, reprt_codes=None):
+async def collect_all_data(api_key, years=None, top_n=100, reprt_codes=None):
     """
     전체 데이터 수집 파이프라인
     - years: 수집할 연도 목록 (기본값: 작년과 올해)
@@ -289,35 +349,36 @@ def collect_all_data(api_key, years=None, top_n=100, reprt_codes=None):
     if reprt_codes is None:
         reprt_codes = ["11011"]  # 사업보고서만
 
-    # 1. 고유번호 목록 가져오기
-    corps = fetch_corp_codes(api_key)
-    corp_codes = [corp["corp_code"] for corp in corps[:top_n]]
+    async with create_client() as client:
+        # 1. 고유번호 목록 가져오기
+        corps = await fetch_corp_codes(client, api_key)
+        corp_codes = [corp["corp_code"] for corp in corps[:top_n]]
 
-    # 2. 공시목록 수집
-    for year in years:
-        start_date = f"{year}0101"
-        end_date = f"{year}1231"
-        fetch_disclosure_list(api_key, start_date, end_date)
+        # 2. 공시목록 수집
+        for year in years:
+            start_date = f"{year}0101"
+            end_date = f"{year}1231"
+            await fetch_disclosure_list(client, api_key, start_date, end_date)
 
-    # 3. 기업개황 정보 수집
-    fetch_company_info(api_key, corp_codes)
+        # 3. 기업개황 정보 수집
+        await fetch_company_info(client, api_key, corp_codes)
 
-    # 4. 재무정보 수집
-    for year in years:
-        for reprt_code in reprt_codes:
-            fetch_financial_data(api_key, corp_codes, year, reprt_code)
+        # 4. 재무정보 수집
+        for year in years:
+            for reprt_code in reprt_codes:
+                await fetch_financial_data(client, api_key, corp_codes, year, reprt_code)
 
-    # 5. 배당정보 수집
-    for year in years:
-        fetch_dividend_data(api_key, corp_codes, year)
+        # 5. 배당정보 수집
+        for year in years:
+            await fetch_dividend_data(client, api_key, corp_codes, year)
 
-    # 6. 최대주주 현황 수집
-    for year in years:
-        fetch_major_shareholders(api_key, corp_codes, year)
+        # 6. 최대주주 현황 수집
+        for year in years:
+            await fetch_major_shareholders(client, api_key, corp_codes, year)
 
-    # 7. 임원 현황 수집
-    for year in years:
-        fetch_executives(api_key, corp_codes, year)
+        # 7. 임원 현황 수집
+        for year in years:
+            await fetch_executives(client, api_key, corp_codes, year)
 
     logger.info("모든 데이터 수집 완료")
 
@@ -329,9 +390,9 @@ if __name__ == "__main__":
         exit(1)
 
     # 전체 데이터 수집 파이프라인 실행
-    collect_all_data(
+    asyncio.run(collect_all_data(
         api_key,
         years=["2024", "2023"],  # 2023년, 2024년 데이터
         top_n=100,  # 시가총액 상위 100개 기업
         reprt_codes=["11011"]  # 사업보고서만
-    )
+    ))
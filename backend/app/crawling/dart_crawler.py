@@ -1,7 +1,27 @@
 import os
 import requests
-import json
+import orjson
+from pathlib import Path
 from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+REQUEST_TIMEOUT = 10
+
+# 페이지 요청 간 keep-alive 세션 (TLS 연결 재사용, 429/5xx 백오프 재시도)
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    ),
+)
 
 
 def crawl_dart_reports(
@@ -26,8 +46,8 @@ def crawl_dart_reports(
     }
     all_reports = []
     while len(all_reports) < max_count:
-        resp = requests.get(url, params=params)
-        data = resp.json()
+        resp = _SESSION.get(url, params=params, timeout=REQUEST_TIMEOUT)
+        data = orjson.loads(resp.content)
         if data.get("status") != "013" and data.get("list"):
             all_reports.extend(data["list"])
             if len(data["list"]) < 100:
@@ -36,8 +56,7 @@ def crawl_dart_reports(
         else:
             break
     if save_path:
-        with open(save_path, "w", encoding="utf-8") as f:
-            json.dump(all_reports, f, ensure_ascii=False, indent=2)
+        Path(save_path).write_bytes(orjson.dumps(all_reports, option=orjson.OPT_INDENT_2))
     return all_reports
 
 
@@ -0,0 +1,45 @@
+# app/deps.py
+"""라우터 공용 서비스 의존성 (프로세스당 1개 인스턴스 공유)"""
+
+from functools import lru_cache
+
+from app.services.core.enhanced_graph_rag import EnhancedGraphRAG
+from app.services.core.insight_batcher import InsightBatcher
+from app.services.core.personalized_insight_generator import (
+    PersonalizedInsightGenerator,
+)
+from app.services.external.hyperclova_client import HyperClovaXClient
+from app.services.storage.enhanced_data_collector import EnhancedDataCollector
+
+
+@lru_cache
+def get_data_collector() -> EnhancedDataCollector:
+    """금융 데이터 수집기"""
+    return EnhancedDataCollector()
+
+
+@lru_cache
+def get_graph_rag() -> EnhancedGraphRAG:
+    """Graph RAG 분석기"""
+    return EnhancedGraphRAG()
+
+
+@lru_cache
+def get_hyperclova_client() -> HyperClovaXClient:
+    """HyperCLOVA X 클라이언트"""
+    return HyperClovaXClient()
+
+
+@lru_cache
+def get_insight_generator() -> PersonalizedInsightGenerator:
+    """개인화 인사이트 생성기 (수집기/Graph RAG 인스턴스 공유)"""
+    return PersonalizedInsightGenerator(
+        data_collector=get_data_collector(),
+        enhanced_graph_rag=get_graph_rag(),
+    )
+
+
+@lru_cache
+def get_insight_batcher() -> InsightBatcher:
+    """인사이트 생성 마이크로 배처 (lifespan에서 워커 시작)"""
+    return InsightBatcher(get_insight_generator())
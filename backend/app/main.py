@@ -1,5 +1,7 @@
 # app/main.py
+import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 # .env 파일 로드 (맨 위에 추가)
@@ -11,14 +13,71 @@ from contextlib import asynccontextmanager
 import uvicorn
 from app.api.routes import financial_data, insights, users, chat_router, user_profile, profile_extraction
 from .config import settings
+from .deps import (
+    get_data_collector,
+    get_graph_rag,
+    get_insight_batcher,
+    get_insight_generator,
+)
+from app.api.routes.chat import warm_up_workflow
+
+
+async def _periodic_healthcheck(app: FastAPI):
+    """/test 라우트가 읽어갈 프로브 결과를 주기적으로 갱신"""
+    while True:
+        app.state.last_news_health, app.state.last_insight_health = await asyncio.gather(
+            financial_data.probe_data_collection(get_data_collector()),
+            insights.probe_insight_generation(get_graph_rag()),
+        )
+        await asyncio.sleep(settings.healthcheck_interval_seconds)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # 애플리케이션 시작 시 실행
     print(">> FastAPI 서버 시작")
+
+    # asyncio.to_thread로 오프로딩되는 블로킹 작업용 기본 스레드 풀 확장
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(
+            max_workers=settings.max_worker_threads, thread_name_prefix="blocking-io"
+        )
+    )
+
+    # 사용자 프로필 테이블 준비 (import 시점이 아닌 프로세스 시작 시 1회)
+    await asyncio.to_thread(user_profile.init_user_tables)
+
+    # 공용 서비스 인스턴스 미리 생성 (첫 요청 지연 방지)
+    await asyncio.to_thread(get_insight_generator)
+
+    # 상주 브라우저 / HTTP 커넥션 풀 준비
+    await get_data_collector().startup()
+
+    # 동시 인사이트 생성 / 프로필 추출 요청 일괄 처리 워커
+    get_insight_batcher().start()
+    profile_extraction.profile_batcher.start()
+
+    # 비디오 서비스(HTTP 커넥션 풀) 미리 생성
+    try:
+        insights.get_video_service()
+    except HTTPException as e:
+        print(f">> 비디오 서비스 초기화 실패: {e.detail}")
+
+    # 채팅 워크플로우(LLM/임베딩 모델 로드)는 요청 수신을 막지 않도록 백그라운드로 준비
+    workflow_warmup = asyncio.create_task(warm_up_workflow())
+
+    # /test 프로브는 요청 경로가 아닌 백그라운드에서 주기 실행
+    healthcheck = asyncio.create_task(_periodic_healthcheck(app))
     yield
     # 애플리케이션 종료 시 실행
+    healthcheck.cancel()
+    workflow_warmup.cancel()
+    # 취소된 작업이 실제로 끝난 뒤 이들이 쓰는 클라이언트/워커 정리
+    await asyncio.gather(healthcheck, workflow_warmup, return_exceptions=True)
+    await get_insight_batcher().stop()
+    await profile_extraction.profile_batcher.stop()
+    await insights.close_video_services()
+    await get_data_collector().shutdown()
     print(">> FastAPI 서버 종료")
 
 
@@ -29,6 +29,23 @@ class DisclosureItem(BaseModel):
     link: Optional[str] = Field(None, description="공시 링크")
     importance_score: float = Field(0.0, description="중요도 점수")
 
+class NewsOut(BaseModel):
+    """뉴스 API 응답 아이템 (link 등 내부 필드 제외)"""
+    title: str = Field(..., description="뉴스 제목")
+    summary: Optional[str] = Field(None, description="요약")
+    source: str = Field(..., description="뉴스 소스")
+    published_at: Optional[str] = Field(None, description="발행 시간")
+    entities: List[str] = Field(default_factory=list, description="추출된 엔티티")
+    importance_score: float = Field(0.0, description="중요도 점수")
+
+class DisclosureOut(BaseModel):
+    """공시 API 응답 아이템 (link 제외)"""
+    company: str = Field(..., description="회사명")
+    title: str = Field(..., description="공시 제목")
+    date: str = Field(..., description="공시 날짜")
+    type: str = Field(..., description="공시 유형")
+    importance_score: float = Field(0.0, description="중요도 점수")
+
 class MarketData(BaseModel):
     """시장 데이터"""
     index_name: str = Field(..., description="지수명")
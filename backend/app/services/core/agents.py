@@ -1598,3 +1598,12 @@ class ReportGeneratorAgent:
 
 **권장 사항**: 시스템 복구 후 다시 시도하거나 관리자에게 문의하시기 바랍니다."""
 
+
+    async def generate_iter(self, context: str, user_context: Dict = None):
+        """리포트를 줄 단위 청크로 스트리밍
+
+        LLM 클라이언트가 스트리밍 응답을 지원하지 않으므로 스레드에서 리포트를 생성한 뒤 분할 전송
+        """
+        report = await asyncio.to_thread(self.generate, context, user_context)
+        for chunk in report.splitlines(keepends=True):
+            yield chunk
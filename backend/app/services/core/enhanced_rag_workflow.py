@@ -167,8 +167,8 @@ class EnhancedRAGWorkflow:
             frontend_context = state.get("user_context", {})
             
             # 3. RDB에서 사용자 프로필 가져오기 (PersonalizedInsightGenerator 활용)
-            from app.services.core.personalized_insight_generator import PersonalizedInsightGenerator
-            insight_generator = PersonalizedInsightGenerator()
+            from app.deps import get_insight_generator
+            insight_generator = get_insight_generator()
             rdb_profile = insight_generator.get_user_profile_from_db(state["user_id"])
             
             # 4. 통합된 사용자 컨텍스트 생성
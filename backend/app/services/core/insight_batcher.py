@@ -0,0 +1,46 @@
+# app/services/core/insight_batcher.py
+"""종합 인사이트 생성 요청 마이크로 배칭 (짧은 시간 내 요청을 모아 한 번에 처리)"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Tuple
+
+from app.services.core.micro_batcher import MicroBatcher
+from app.services.core.personalized_insight_generator import (
+    PersonalizedInsightGenerator,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class InsightBatcher(MicroBatcher):
+    """큐에 쌓인 인사이트 요청을 max_wait 동안 최대 max_batch개까지 모아 일괄 생성"""
+
+    def __init__(
+        self,
+        insight_generator: PersonalizedInsightGenerator,
+        max_batch: int = 8,
+        max_wait: float = 0.02,
+    ):
+        super().__init__(max_batch=max_batch, max_wait=max_wait)
+        self.insight_generator = insight_generator
+
+    async def submit(self, user_id: str, refresh_data: bool = False) -> Dict:
+        """인사이트 생성 요청 (워커 미실행 시 단건 처리)"""
+        return await self._submit((user_id, refresh_data))
+
+    async def _process_items(self, items: List[Tuple[str, bool]]) -> List[Any]:
+        if len(items) == 1:
+            user_id, refresh_data = items[0]
+            return [
+                await asyncio.to_thread(
+                    self.insight_generator.generate_comprehensive_insight,
+                    user_id=user_id,
+                    refresh_data=refresh_data,
+                )
+            ]
+        logger.info(f"인사이트 일괄 생성: {len(items)}건")
+        return await asyncio.to_thread(
+            self.insight_generator.generate_batch,
+            [user_id for user_id, _ in items],
+        )
@@ -0,0 +1,88 @@
+# app/services/core/micro_batcher.py
+"""요청 마이크로 배칭 공통 구현 (짧은 시간 내 요청을 모아 한 번에 처리)"""
+
+import asyncio
+from typing import Any, List, Optional
+
+
+class MicroBatcher:
+    """큐에 쌓인 요청을 max_wait 동안 최대 max_batch개까지 모아 _process_items로 일괄 처리
+
+    하위 클래스는 _process_items(items)에서 items와 같은 순서의 결과 리스트를 반환
+    (항목 결과가 Exception이면 해당 요청에만 예외 전파, 배치 전체 실패는 모든 요청에 전파)
+    """
+
+    def __init__(self, max_batch: int, max_wait: float):
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._batches: set = set()
+
+    def start(self):
+        """배치 워커 시작 (lifespan에서 호출)"""
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """배치 워커 종료, 처리 중인 배치는 완료까지 대기"""
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+        if self._batches:
+            await asyncio.gather(*self._batches, return_exceptions=True)
+
+    async def _process_items(self, items: List[Any]) -> List[Any]:
+        raise NotImplementedError
+
+    async def _submit(self, item: Any) -> Any:
+        """요청 1건 제출 (워커 미실행 시 단건 배치로 바로 처리)"""
+        if self._worker is None:
+            result = (await self._process_items([item]))[0]
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # 배치 처리 중에도 다음 요청을 계속 모으도록 별도 태스크로 실행
+            task = asyncio.create_task(self._process(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _process(self, batch: List[tuple]):
+        try:
+            results = await self._process_items([item for item, _ in batch])
+        except Exception as e:
+            results = [e] * len(batch)
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -1,13 +1,19 @@
 # app/services/personalized_insight_generator.py
 
 import asyncio
+import heapq
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 import json
 import sqlite3
 import logging
+from contextlib import contextmanager
 
-from app.config import settings
+from app.config import get_conn, settings
 from app.services.core.enhanced_graph_rag import EnhancedGraphRAG
 from app.services.storage.insight_storage import InsightStorage
 from app.services.storage.user_memory import UserMemorySystem
@@ -16,16 +22,57 @@ from app.services.external.hyperclova_client import HyperClovaXClient
 
 logger = logging.getLogger(__name__)
 
+# 종목 코드와 회사명 매핑
+SYMBOL_TO_NAME = {
+    "005930": "삼성전자",
+    "000660": "SK하이닉스",
+    "035420": "NAVER",
+    "005380": "현대차",
+    "051910": "LG화학",
+    "035720": "카카오",
+    "005490": "POSCO홀딩스",
+    "207940": "삼성바이오로직스",
+    "068270": "셀트리온",
+}
+
+
+def get_portfolio_symbols(portfolio: List) -> frozenset:
+    """포트폴리오 (symbol, company_name, ...) 행에서 보유 종목 코드 집합 추출
+
+    구성이 같으면 같은 frozenset 인스턴스를 돌려줘 하위 lru_cache 조회도 재사용
+    """
+    return _portfolio_symbols(tuple(map(tuple, portfolio)))
+
+
+@lru_cache(maxsize=256)
+def _portfolio_symbols(portfolio_rows: tuple) -> frozenset:
+    return frozenset(holding[0] for holding in portfolio_rows)
+
+
+@lru_cache(maxsize=256)
+def _portfolio_company_names(portfolio_symbols: frozenset) -> tuple:
+    """보유 종목 코드 → 회사명 (같은 포트폴리오 구성이면 캐시 재사용)"""
+    return tuple(
+        SYMBOL_TO_NAME[symbol]
+        for symbol in portfolio_symbols
+        if symbol in SYMBOL_TO_NAME
+    )
+
 
 class PersonalizedInsightGenerator:
     """개인화된 투자 인사이트 생성기 (Graph RAG + 메모리 강화)"""
 
-    def __init__(self):
-        self.enhanced_graph_rag = EnhancedGraphRAG()
+    def __init__(
+        self,
+        data_collector: Optional[EnhancedDataCollector] = None,
+        enhanced_graph_rag: Optional[EnhancedGraphRAG] = None,
+    ):
+        # 외부에서 주입된 인스턴스가 있으면 공유 (app.deps)
+        self.enhanced_graph_rag = enhanced_graph_rag or EnhancedGraphRAG()
         self.graph_rag = self.enhanced_graph_rag  # 하위 호환성을 위한 별칭
         self.insight_storage = InsightStorage()
         self.user_memory = UserMemorySystem()
-        self.data_collector = EnhancedDataCollector()
+        self.data_collector = data_collector or EnhancedDataCollector()
         self.llm_client = HyperClovaXClient()
 
         if self.llm_client.is_available():
@@ -396,14 +443,13 @@ Graph RAG 분석은 관계성 기반 인사이트를 제공하지만, 시장 변
 
         # 포트폴리오 정보
         portfolio_info = ""
-        portfolio_symbols = set()
+        portfolio_symbols = get_portfolio_symbols(portfolio)
         if portfolio:
             portfolio_info = "보유 종목:\n"
             for stock in portfolio:
                 portfolio_info += (
                     f"- {stock[1]}({stock[0]}): {stock[2]}주 (평균 {stock[3]:,}원)\n"
                 )
-                portfolio_symbols.add(stock[0])
 
         # 사용자 투자 정보 추가
         investment_profile = ""
@@ -513,51 +559,39 @@ Graph RAG 분석은 관계성 기반 인사이트를 제공하지만, 시장 변
         return prompt
 
     def _analyze_disclosure_for_portfolio(
-        self, disclosures: List, portfolio_symbols: set
+        self, disclosures: List, portfolio_symbols: frozenset
     ) -> str:
         """포트폴리오 종목 관련 공시 분석"""
         if not disclosures or not portfolio_symbols:
             return "현재 보유 종목과 관련된 최신 공시가 없습니다."
 
-        relevant_disclosures = []
-
-        # 종목 코드와 회사명 매핑
-        symbol_to_name = {
-            "005930": "삼성전자",
-            "000660": "SK하이닉스",
-            "035420": "NAVER",
-            "005380": "현대차",
-            "051910": "LG화학",
-            "035720": "카카오",
-            "005490": "POSCO홀딩스",
-            "207940": "삼성바이오로직스",
-            "068270": "셀트리온",
-        }
+        portfolio_company_names = _portfolio_company_names(
+            frozenset(portfolio_symbols)
+        )
 
-        portfolio_company_names = set()
-        for symbol in portfolio_symbols:
-            if symbol in symbol_to_name:
-                portfolio_company_names.add(symbol_to_name[symbol])
-
-        # 보유 종목 관련 공시 필터링
-        for disclosure in disclosures:
-            company_name = disclosure.company
-            for portfolio_company in portfolio_company_names:
-                if portfolio_company in company_name:
-                    relevant_disclosures.append(
-                        {
-                            "company": company_name,
-                            "title": disclosure.title,
-                            "date": disclosure.date,
-                            "importance": disclosure.importance_score,
-                        }
-                    )
+        # 보유 종목 관련 공시 필터링 (출력에 쓰는 상위 5건만 수집)
+        relevant_disclosures = list(
+            islice(
+                (
+                    {
+                        "company": disclosure.company,
+                        "title": disclosure.title,
+                        "date": disclosure.date,
+                        "importance": disclosure.importance_score,
+                    }
+                    for disclosure in disclosures
+                    for portfolio_company in portfolio_company_names
+                    if portfolio_company in disclosure.company
+                ),
+                5,
+            )
+        )
 
         if not relevant_disclosures:
             return "보유 종목들의 최근 공시는 대부분 정기 보고서로, 특별한 변화는 없어 보입니다. 안정적인 경영 상태를 유지하고 있는 것으로 판단됩니다."
 
         analysis = ">> 보유 종목 공시 분석:\n"
-        for disclosure in relevant_disclosures[:5]:
+        for disclosure in relevant_disclosures:
             analysis += f"- {disclosure['company']}: {disclosure['title']} ({disclosure['date']})\n"
 
             title_lower = disclosure["title"].lower()
@@ -581,45 +615,16 @@ Graph RAG 분석은 관계성 기반 인사이트를 제공하지만, 시장 변
         if not disclosures or not news:
             return "공시와 뉴스 간 특별한 연관성이 발견되지 않았습니다."
 
-        correlations = []
-
-        for disclosure in disclosures[:10]:
-            disclosure_keywords = set(disclosure.title.split())
-            disclosure_company = disclosure.company
-
-            for news_item in news[:10]:
-                news_title = news_item.title
-                news_keywords = set(news_title.split())
-
-                if disclosure_company in news_title:
-                    correlations.append(
-                        {
-                            "type": "기업명 매칭",
-                            "company": disclosure_company,
-                            "disclosure": disclosure.title,
-                            "news": news_title,
-                            "correlation_strength": "높음",
-                        }
-                    )
-
-                common_keywords = disclosure_keywords.intersection(news_keywords)
-                if len(common_keywords) >= 2:
-                    correlations.append(
-                        {
-                            "type": "키워드 연관",
-                            "company": disclosure_company,
-                            "disclosure": disclosure.title,
-                            "news": news_title,
-                            "keywords": list(common_keywords),
-                            "correlation_strength": "중간",
-                        }
-                    )
+        # 출력에 쓰는 상위 3건만 찾으면 중단
+        correlations = list(
+            islice(self._iter_disclosure_news_correlations(disclosures, news), 3)
+        )
 
         if not correlations:
             return "현재 공시 정보와 뉴스 사이에 직접적인 연관성은 발견되지 않았으나, 이는 시장이 아직 공시 내용을 완전히 반영하지 못했을 가능성을 시사합니다."
 
         analysis = ">> 공시-뉴스 교차 분석:\n"
-        for corr in correlations[:3]:
+        for corr in correlations:
             analysis += f"- {corr['company']}: 공시와 뉴스가 동시 부각\n"
             analysis += f"  공시: {corr['disclosure'][:50]}...\n"
             analysis += f"  뉴스: {corr['news'][:50]}...\n"
@@ -627,6 +632,38 @@ Graph RAG 분석은 관계성 기반 인사이트를 제공하지만, 시장 변
 
         return analysis
 
+    def _iter_disclosure_news_correlations(self, disclosures: List, news: List):
+        """공시-뉴스 연관 쌍을 순서대로 생성"""
+        # 뉴스 제목 키워드는 한 번만 분리
+        news_keyword_sets = [
+            (news_item.title, set(news_item.title.split())) for news_item in news[:10]
+        ]
+
+        for disclosure in disclosures[:10]:
+            disclosure_keywords = set(disclosure.title.split())
+            disclosure_company = disclosure.company
+
+            for news_title, news_keywords in news_keyword_sets:
+                if disclosure_company in news_title:
+                    yield {
+                        "type": "기업명 매칭",
+                        "company": disclosure_company,
+                        "disclosure": disclosure.title,
+                        "news": news_title,
+                        "correlation_strength": "높음",
+                    }
+
+                common_keywords = disclosure_keywords.intersection(news_keywords)
+                if len(common_keywords) >= 2:
+                    yield {
+                        "type": "키워드 연관",
+                        "company": disclosure_company,
+                        "disclosure": disclosure.title,
+                        "news": news_title,
+                        "keywords": list(common_keywords),
+                        "correlation_strength": "중간",
+                    }
+
     def generate_personalized_insight(
         self, financial_data: Dict, user_id: str
     ) -> Optional[Dict]:
@@ -690,7 +727,7 @@ Graph RAG 분석은 관계성 기반 인사이트를 제공하지만, 시장 변
                 ),
                 "disclosure_insights": self._analyze_disclosure_for_portfolio(
                     financial_data.get("disclosures", []),
-                    set(holding[0] for holding in user_profile.get("portfolio", [])),
+                    get_portfolio_symbols(user_profile.get("portfolio", [])),
                 ),
                 "graph_analysis": self.graph_rag.create_market_narrative(
                     financial_data
@@ -732,9 +769,9 @@ Graph RAG 분석은 관계성 기반 인사이트를 제공하지만, 시장 변
                 "error": "포트폴리오 데이터가 없습니다.",
             }
 
-        stock_data_map = {}
-        for stock in financial_data.get("stock_data", []):
-            stock_data_map[stock.symbol] = stock
+        stock_data_map = {
+            stock.symbol: stock for stock in financial_data.get("stock_data", [])
+        }
 
         total_value = 0
         total_cost = 0
@@ -878,15 +915,18 @@ Graph RAG 분석은 관계성 기반 인사이트를 제공하지만, 시장 변
         news_items = financial_data.get("news", [])
         disclosures = financial_data.get("disclosures", [])
 
+        # 공시 회사명별 건수 (뉴스마다 공시 전체를 다시 순회하지 않도록)
+        disclosure_company_counts = Counter(d.company for d in disclosures)
+
         enhanced_news = []
 
         for news in news_items:
-            relevance_score = news.importance_score
-
             # 공시와 연관성 체크
-            for disclosure in disclosures:
-                if disclosure.company in news.title:
-                    relevance_score += 1.0
+            disclosure_matches = sum(
+                count
+                for company, count in disclosure_company_counts.items()
+                if company in news.title
+            )
 
             enhanced_news.append(
                 {
@@ -894,15 +934,12 @@ Graph RAG 분석은 관계성 기반 인사이트를 제공하지만, 시장 변
                     "summary": news.summary,
                     "entities": news.entities,
                     "importance_score": news.importance_score,
-                    "relevance_score": relevance_score,
-                    "has_disclosure_link": any(
-                        d.company in news.title for d in disclosures
-                    ),
+                    "relevance_score": news.importance_score + disclosure_matches,
+                    "has_disclosure_link": disclosure_matches > 0,
                 }
             )
 
-        enhanced_news.sort(key=lambda x: x["relevance_score"], reverse=True)
-        return enhanced_news[:5]
+        return heapq.nlargest(5, enhanced_news, key=lambda x: x["relevance_score"])
 
     def generate_mock_personalized_insight(
         self, financial_data: Dict, user_profile: Dict
@@ -981,12 +1018,22 @@ Graph RAG 분석은 관계성 기반 인사이트를 제공하지만, 시장 변
             "model_used": "Mock-HyperCLOVA-X",
         }
 
-    def save_user_portfolio(self, user_id: str, portfolio_data: List[Dict]):
-        """사용자 포트폴리오 저장"""
-        conn = sqlite3.connect(self.data_collector.db_path)
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM user_portfolios WHERE user_id = ?", (user_id,))
-        cursor.executemany(
+    @contextmanager
+    def _user_data_transaction(self):
+        """쓰기 여러 건을 BEGIN IMMEDIATE ~ COMMIT 한 번으로 묶음 (스레드별 연결 재사용)"""
+        conn = get_conn(self.data_collector.db_path)
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    @staticmethod
+    def _write_portfolio(conn, user_id: str, portfolio_data: List[Dict]):
+        conn.execute("DELETE FROM user_portfolios WHERE user_id = ?", (user_id,))
+        conn.executemany(
             "INSERT INTO user_portfolios (user_id, symbol, company_name, shares, avg_price, sector) VALUES (?, ?, ?, ?, ?, ?)",
             [
                 (
@@ -1000,14 +1047,10 @@ Graph RAG 분석은 관계성 기반 인사이트를 제공하지만, 시장 변
                 for h in portfolio_data
             ],
         )
-        conn.commit()
-        conn.close()
 
-    def save_user_preferences(self, user_id: str, preferences: Dict):
-        """사용자 투자 선호도 저장"""
-        conn = sqlite3.connect(self.data_collector.db_path)
-        cursor = conn.cursor()
-        cursor.execute(
+    @staticmethod
+    def _write_preferences(conn, user_id: str, preferences: Dict):
+        conn.execute(
             "INSERT OR REPLACE INTO user_preferences (user_id, preferred_sectors, risk_level, investment_style, news_keywords) VALUES (?, ?, ?, ?, ?)",
             (
                 user_id,
@@ -1017,8 +1060,24 @@ Graph RAG 분석은 관계성 기반 인사이트를 제공하지만, 시장 변
                 ",".join(preferences.get("news_keywords", [])),
             ),
         )
-        conn.commit()
-        conn.close()
+
+    def save_user_portfolio(self, user_id: str, portfolio_data: List[Dict]):
+        """사용자 포트폴리오 저장"""
+        with self._user_data_transaction() as conn:
+            self._write_portfolio(conn, user_id, portfolio_data)
+
+    def save_user_preferences(self, user_id: str, preferences: Dict):
+        """사용자 투자 선호도 저장"""
+        with self._user_data_transaction() as conn:
+            self._write_preferences(conn, user_id, preferences)
+
+    def save_user_data(
+        self, user_id: str, portfolio_data: List[Dict], preferences: Dict
+    ):
+        """포트폴리오 + 선호도를 한 트랜잭션으로 저장"""
+        with self._user_data_transaction() as conn:
+            self._write_portfolio(conn, user_id, portfolio_data)
+            self._write_preferences(conn, user_id, preferences)
 
     # === 핵심 수정: 메서드명 변경으로 중복 해결 ===
 
@@ -1052,7 +1111,7 @@ Graph RAG 분석은 관계성 기반 인사이트를 제공하지만, 시장 변
 
             disclosure_insights = self._analyze_disclosure_for_portfolio(
                 financial_data.get("disclosures", []),
-                set(holding[0] for holding in user_profile.get("portfolio", [])),
+                get_portfolio_symbols(user_profile.get("portfolio", [])),
             )
 
             graph_analysis = self.graph_rag.create_market_narrative(financial_data)
@@ -1091,49 +1150,79 @@ Graph RAG 분석은 관계성 기반 인사이트를 제공하지만, 시장 변
                 user_id=user_id, refresh_cache=refresh_data, use_playwright=True
             )
 
-            # 기존 인사이트 생성 로직 재사용
-            comprehensive_script = self._generate_comprehensive_script(
-                financial_data=financial_data, user_id=user_id
-            )
+            result = self._build_comprehensive_insight(financial_data, user_id)
 
-            # 나머지 분석들
-            user_profile = financial_data.get("personalized", {})
+            print(f">> 동기 인사이트 생성 완료: {result['script_length']}자")
+            return result
 
-            portfolio_analysis = self._analyze_portfolio_performance(
-                user_profile, financial_data
-            )
+        except Exception as e:
+            print(f">> 동기 인사이트 생성 실패: {str(e)}")
+            raise e
 
-            personalized_news = self._filter_personalized_news(
-                financial_data, user_profile
-            )
+    def generate_batch(self, user_ids: List[str]) -> List[Any]:
+        """여러 사용자 인사이트 일괄 생성 (공통 시장 데이터는 한 번만 수집)
 
-            disclosure_insights = self._analyze_disclosure_for_portfolio(
-                financial_data.get("disclosures", []),
-                set(holding[0] for holding in user_profile.get("portfolio", [])),
-            )
+        결과는 user_ids 순서대로, 사용자별 실패는 예외 객체로 반환
+        """
+        print(f">> {len(user_ids)}명 사용자 종합 인사이트 일괄 생성 시작")
 
-            graph_analysis = self.graph_rag.create_market_narrative(financial_data)
+        financial_data_by_user = self.data_collector.collect_all_data_batch(
+            list(dict.fromkeys(user_ids)), use_playwright=True
+        )
 
-            result = {
-                "script": comprehensive_script,
-                "script_length": len(comprehensive_script),
-                "estimated_reading_time": f"약 {max(1, len(comprehensive_script) // 200)}분",
-                "analysis_method": "Graph RAG + 실시간 데이터 + 개인화 분석 (동기)",
-                "portfolio_analysis": portfolio_analysis,
-                "personalized_news": personalized_news,
-                "disclosure_insights": disclosure_insights,
-                "graph_analysis": graph_analysis,
-                "token_usage": getattr(self, "_last_token_usage", 0),
-                "model_used": getattr(self, "_current_model", "HyperCLOVA-X"),
-                "data_sources": financial_data.get("data_sources", {}),
-            }
+        def build(user_id: str) -> Any:
+            try:
+                return self._build_comprehensive_insight(
+                    financial_data_by_user[user_id], user_id
+                )
+            except Exception as e:
+                print(f">> 사용자 {user_id} 인사이트 생성 실패: {str(e)}")
+                return e
+
+        # 사용자별 스크립트 생성(LLM 호출)은 병렬 실행 - 배치 지연이 LLM 1회 수준
+        with ThreadPoolExecutor(
+            max_workers=max(len(user_ids), 1), thread_name_prefix="insight-batch"
+        ) as executor:
+            return list(executor.map(build, user_ids))
+
+    def _build_comprehensive_insight(self, financial_data: Dict, user_id: str) -> Dict:
+        """수집된 데이터로 스크립트 및 부가 분석 생성"""
+        # 기존 인사이트 생성 로직 재사용
+        comprehensive_script = self._generate_comprehensive_script(
+            financial_data=financial_data, user_id=user_id
+        )
 
-            print(f">> 동기 인사이트 생성 완료: {len(comprehensive_script)}자")
-            return result
+        # 나머지 분석들
+        user_profile = financial_data.get("personalized", {})
 
-        except Exception as e:
-            print(f">> 동기 인사이트 생성 실패: {str(e)}")
-            raise e
+        portfolio_analysis = self._analyze_portfolio_performance(
+            user_profile, financial_data
+        )
+
+        personalized_news = self._filter_personalized_news(
+            financial_data, user_profile
+        )
+
+        disclosure_insights = self._analyze_disclosure_for_portfolio(
+            financial_data.get("disclosures", []),
+            get_portfolio_symbols(user_profile.get("portfolio", [])),
+        )
+
+        graph_analysis = self.graph_rag.create_market_narrative(financial_data)
+
+        return {
+            "script": comprehensive_script,
+            "script_length": len(comprehensive_script),
+            "estimated_reading_time": f"약 {max(1, len(comprehensive_script) // 200)}분",
+            "analysis_method": "Graph RAG + 실시간 데이터 + 개인화 분석 (동기)",
+            "portfolio_analysis": portfolio_analysis,
+            "personalized_news": personalized_news,
+            "disclosure_insights": disclosure_insights,
+            "graph_analysis": graph_analysis,
+            "token_usage": getattr(self, "_last_token_usage", 0),
+            "model_used": getattr(self, "_current_model", "HyperCLOVA-X"),
+            "data_sources": financial_data.get("data_sources", {}),
+        }
 
     def _generate_comprehensive_script(self, financial_data: Dict, user_id: str) -> str:
         """통합 스크립트 생성 (기존 로직 재사용)"""
@@ -17,6 +17,7 @@ class AIStudiosService:
         # 문서에서 확인한 도메인들
         self.base_url_v2 = "https://v2.aistudios.com/api/odin"
         self.base_url_v3 = "https://app.aistudios.com/api/odin/v3"
+        self._client: Optional[httpx.AsyncClient] = None
 
         if not self.api_key:
             raise ValueError(
@@ -25,6 +26,22 @@ class AIStudiosService:
 
         logger.info("AIStudios 서비스 초기화 완료")
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """AIStudios API 공용 HTTP 클라이언트 (커넥션 재사용)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=30.0,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            )
+        return self._client
+
+    async def aclose(self):
+        """공용 HTTP 클라이언트 종료"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     def _get_headers(self) -> Dict[str, str]:
         """AIStudios API 요청 헤더"""
         return {"Authorization": self.api_key, "Content-Type": "application/json"}
@@ -74,42 +91,44 @@ class AIStudiosService:
             logger.info(f"URL: {url}")
             logger.info(f"스크립트 길이: {len(script)}")
 
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(url, headers=headers, json=payload)
-
-                logger.info(f"AIStudios API 응답: {response.status_code}")
-                logger.info(f"응답 내용: {response.text}")
-
-                if response.status_code == 200:
-                    result = response.json()
-                    project_key = result.get("key")  # v2 API는 key를 반환
-
-                    if project_key:
-                        logger.info(f"영상 생성 시작됨: {project_key}")
-                        return {
-                            "success": True,
-                            "project_id": project_key,
-                            "video_url": None,
-                            "status": "processing",
-                            "model_used": model,
-                            "clothes_used": clothes,
-                        }
-                    else:
-                        return {
-                            "success": False,
-                            "error": "프로젝트 키를 받지 못했습니다",
-                            "details": result,
-                        }
+            client = self._get_client()
+            response = await client.post(
+                url, headers=headers, timeout=60.0, json=payload
+            )
+
+            logger.info(f"AIStudios API 응답: {response.status_code}")
+            logger.info(f"응답 내용: {response.text}")
+
+            if response.status_code == 200:
+                result = response.json()
+                project_key = result.get("key")  # v2 API는 key를 반환
+
+                if project_key:
+                    logger.info(f"영상 생성 시작됨: {project_key}")
+                    return {
+                        "success": True,
+                        "project_id": project_key,
+                        "video_url": None,
+                        "status": "processing",
+                        "model_used": model,
+                        "clothes_used": clothes,
+                    }
                 else:
-                    error_detail = await self._parse_error_response(response)
-                    logger.error(
-                        f"AIStudios API 오류: {response.status_code} - {error_detail}"
-                    )
                     return {
                         "success": False,
-                        "error": f"API 요청 실패: {response.status_code}",
-                        "details": error_detail,
+                        "error": "프로젝트 키를 받지 못했습니다",
+                        "details": result,
                     }
+            else:
+                error_detail = await self._parse_error_response(response)
+                logger.error(
+                    f"AIStudios API 오류: {response.status_code} - {error_detail}"
+                )
+                return {
+                    "success": False,
+                    "error": f"API 요청 실패: {response.status_code}",
+                    "details": error_detail,
+                }
 
         except Exception as e:
             logger.error(f"AIStudios 영상 생성 오류: {str(e)}")
@@ -159,35 +178,35 @@ class AIStudiosService:
             headers = self._get_headers()
             url = f"{self.base_url_v2}/editor/progress/{project_id}"
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url, headers=headers)
-
-                logger.info(f"상태 확인 응답: {response.status_code}")
-                logger.info(f"응답 내용: {response.text}")
-
-                if response.status_code == 200:
-                    result = response.json()
-
-                    # v2 API 응답 구조에 맞춰 처리
-                    status = result.get("status", "unknown")
-                    progress = result.get("progress", 0)
-                    video_url = result.get("url")  # v2에서는 url 필드 사용
-
-                    return {
-                        "success": True,
-                        "project_id": project_id,
-                        "status": status.lower() if status else "unknown",
-                        "progress": progress,
-                        "video_url": video_url,
-                        "created_at": result.get("created_at"),
-                    }
-                else:
-                    error_detail = await self._parse_error_response(response)
-                    return {
-                        "success": False,
-                        "error": f"상태 확인 실패: {response.status_code}",
-                        "details": error_detail,
-                    }
+            client = self._get_client()
+            response = await client.get(url, headers=headers, timeout=30.0)
+
+            logger.info(f"상태 확인 응답: {response.status_code}")
+            logger.info(f"응답 내용: {response.text}")
+
+            if response.status_code == 200:
+                result = response.json()
+
+                # v2 API 응답 구조에 맞춰 처리
+                status = result.get("status", "unknown")
+                progress = result.get("progress", 0)
+                video_url = result.get("url")  # v2에서는 url 필드 사용
+
+                return {
+                    "success": True,
+                    "project_id": project_id,
+                    "status": status.lower() if status else "unknown",
+                    "progress": progress,
+                    "video_url": video_url,
+                    "created_at": result.get("created_at"),
+                }
+            else:
+                error_detail = await self._parse_error_response(response)
+                return {
+                    "success": False,
+                    "error": f"상태 확인 실패: {response.status_code}",
+                    "details": error_detail,
+                }
 
         except Exception as e:
             logger.error(f"프로젝트 상태 확인 오류: {str(e)}")
@@ -350,6 +369,11 @@ class VideoGenerationService:
                 "error": f"{self.provider} 상태 확인 실패: {str(e)}",
             }
 
+    async def aclose(self):
+        """제공자 서비스의 HTTP 클라이언트 종료"""
+        if self.service and hasattr(self.service, "aclose"):
+            await self.service.aclose()
+
     def get_provider(self) -> str:
         """현재 사용 중인 제공자 반환"""
         return self.provider
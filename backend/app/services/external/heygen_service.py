@@ -18,6 +18,7 @@ class HeyGenService:
         self.base_url = "https://api.heygen.com/v2"
         self._default_avatars = []
         self._default_voices = []
+        self._client: Optional[httpx.AsyncClient] = None
 
         if not self.api_key:
             raise ValueError(
@@ -28,6 +29,22 @@ class HeyGenService:
         """HeyGen 서비스 사용 가능 여부 확인"""
         return bool(self.api_key)
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """HeyGen API 공용 HTTP 클라이언트 (커넥션 재사용)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=30.0,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            )
+        return self._client
+
+    async def aclose(self):
+        """공용 HTTP 클라이언트 종료"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     async def test_connection(self) -> bool:
         """HeyGen API 연결 테스트"""
         try:
@@ -201,41 +218,44 @@ class HeyGenService:
 
             logger.info(f"HeyGen 영상 생성 요청: 아바타={avatar_id}, 음성={resolved_voice_id}, 배경={background}")
 
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    f"{self.base_url}/video/generate", headers=headers, json=payload
-                )
+            client = self._get_client()
+            response = await client.post(
+                f"{self.base_url}/video/generate",
+                headers=headers,
+                json=payload,
+                timeout=60.0,
+            )
 
-                logger.info(f"HeyGen API 응답: {response.status_code}")
+            logger.info(f"HeyGen API 응답: {response.status_code}")
 
-                if response.status_code == 200:
-                    result = response.json()
-                    video_id = result.get("data", {}).get("video_id")
+            if response.status_code == 200:
+                result = response.json()
+                video_id = result.get("data", {}).get("video_id")
 
-                    if video_id:
-                        logger.info(f"영상 생성 시작됨: {video_id}")
-                        return {
-                            "success": True,
-                            "video_id": video_id,
-                            "video_url": None,  # 생성 중이므로 나중에 확인
-                            "status": "processing",
-                        }
-                    else:
-                        return {
-                            "success": False,
-                            "error": "영상 ID를 받지 못했습니다",
-                            "details": result,
-                        }
+                if video_id:
+                    logger.info(f"영상 생성 시작됨: {video_id}")
+                    return {
+                        "success": True,
+                        "video_id": video_id,
+                        "video_url": None,  # 생성 중이므로 나중에 확인
+                        "status": "processing",
+                    }
                 else:
-                    error_detail = await self._parse_error_response(response)
-                    logger.error(
-                        f"HeyGen API 오류: {response.status_code} - {error_detail}"
-                    )
                     return {
                         "success": False,
-                        "error": f"API 요청 실패: {response.status_code}",
-                        "details": error_detail,
+                        "error": "영상 ID를 받지 못했습니다",
+                        "details": result,
                     }
+            else:
+                error_detail = await self._parse_error_response(response)
+                logger.error(
+                    f"HeyGen API 오류: {response.status_code} - {error_detail}"
+                )
+                return {
+                    "success": False,
+                    "error": f"API 요청 실패: {response.status_code}",
+                    "details": error_detail,
+                }
 
         except Exception as e:
             logger.error(f"HeyGen 영상 생성 오류: {str(e)}")
@@ -259,54 +279,54 @@ class HeyGenService:
             status_url = f"https://api.heygen.com/v1/video_status.get?video_id={video_id}"
             logger.info(f"비디오 상태 확인 URL: {status_url}")
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(status_url, headers=headers)
-
-                logger.info(f"비디오 상태 확인 응답: {response.status_code}")
-
-                if response.status_code == 200:
-                    result = response.json()
-
-                    # HeyGen v1 API 응답 구조
-                    if result.get("code") == 100:  # 성공 코드
-                        data = result.get("data", {})
-
-                        # progress 계산 (HeyGen v1에서는 제공 안 함)
-                        status = data.get("status", "unknown")
-                        progress = 0
-                        if status == "completed":
-                            progress = 100
-                        elif status == "processing":
-                            progress = 50  # 임시값
-                        elif status == "pending" or status == "waiting":
-                            progress = 10  # 임시값
-
-                        return {
-                            "success": True,
-                            "video_id": video_id,
-                            "status": status,
-                            "video_url": data.get("video_url"),
-                            "progress": progress,
-                            "duration": data.get("duration"),
-                            "created_at": data.get("created_at"),
-                            "thumbnail_url": data.get("thumbnail_url"),
-                            "caption_url": data.get("caption_url"),
-                            "gif_url": data.get("gif_url"),
-                        }
-                    else:
-                        # API 에러 응답
-                        error_msg = result.get("message", "알 수 없는 오류")
-                        return {
-                            "success": False,
-                            "error": f"API 에러: {error_msg}",
-                            "details": result
-                        }
+            client = self._get_client()
+            response = await client.get(status_url, headers=headers, timeout=30.0)
+
+            logger.info(f"비디오 상태 확인 응답: {response.status_code}")
+
+            if response.status_code == 200:
+                result = response.json()
+
+                # HeyGen v1 API 응답 구조
+                if result.get("code") == 100:  # 성공 코드
+                    data = result.get("data", {})
+
+                    # progress 계산 (HeyGen v1에서는 제공 안 함)
+                    status = data.get("status", "unknown")
+                    progress = 0
+                    if status == "completed":
+                        progress = 100
+                    elif status == "processing":
+                        progress = 50  # 임시값
+                    elif status == "pending" or status == "waiting":
+                        progress = 10  # 임시값
+
+                    return {
+                        "success": True,
+                        "video_id": video_id,
+                        "status": status,
+                        "video_url": data.get("video_url"),
+                        "progress": progress,
+                        "duration": data.get("duration"),
+                        "created_at": data.get("created_at"),
+                        "thumbnail_url": data.get("thumbnail_url"),
+                        "caption_url": data.get("caption_url"),
+                        "gif_url": data.get("gif_url"),
+                    }
                 else:
+                    # API 에러 응답
+                    error_msg = result.get("message", "알 수 없는 오류")
                     return {
                         "success": False,
-                        "error": f"상태 확인 실패: {response.status_code}",
-                        "details": response.text
+                        "error": f"API 에러: {error_msg}",
+                        "details": result
                     }
+            else:
+                return {
+                    "success": False,
+                    "error": f"상태 확인 실패: {response.status_code}",
+                    "details": response.text
+                }
 
         except Exception as e:
             logger.error(f"비디오 상태 확인 오류: {str(e)}")
@@ -360,23 +380,25 @@ class HeyGenService:
         try:
             headers = {"X-API-KEY": self.api_key}
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(f"{self.base_url}/avatars", headers=headers)
+            client = self._get_client()
+            response = await client.get(
+                f"{self.base_url}/avatars", headers=headers, timeout=30.0
+            )
 
-                if response.status_code == 200:
-                    result = response.json()
-                    # HeyGen API 응답 구조에 맞춰서 반환
-                    return {
-                        "success": True,
-                        "data": result.get("data", {}),
-                        "avatars": result.get("data", {}).get("avatars", []),
-                    }
-                else:
-                    return {
-                        "success": False,
-                        "error": f"아바타 목록 조회 실패: {response.status_code}",
-                        "details": response.text,
-                    }
+            if response.status_code == 200:
+                result = response.json()
+                # HeyGen API 응답 구조에 맞춰서 반환
+                return {
+                    "success": True,
+                    "data": result.get("data", {}),
+                    "avatars": result.get("data", {}).get("avatars", []),
+                }
+            else:
+                return {
+                    "success": False,
+                    "error": f"아바타 목록 조회 실패: {response.status_code}",
+                    "details": response.text,
+                }
 
         except Exception as e:
             return {"success": False, "error": f"아바타 목록 조회 오류: {str(e)}"}
@@ -386,22 +408,24 @@ class HeyGenService:
         try:
             headers = {"X-API-KEY": self.api_key}
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(f"{self.base_url}/voices", headers=headers)
+            client = self._get_client()
+            response = await client.get(
+                f"{self.base_url}/voices", headers=headers, timeout=30.0
+            )
 
-                if response.status_code == 200:
-                    result = response.json()
-                    return {
-                        "success": True,
-                        "data": result.get("data", {}),
-                        "voices": result.get("data", {}).get("voices", []),
-                    }
-                else:
-                    return {
-                        "success": False,
-                        "error": f"음성 목록 조회 실패: {response.status_code}",
-                        "details": response.text,
-                    }
+            if response.status_code == 200:
+                result = response.json()
+                return {
+                    "success": True,
+                    "data": result.get("data", {}),
+                    "voices": result.get("data", {}).get("voices", []),
+                }
+            else:
+                return {
+                    "success": False,
+                    "error": f"음성 목록 조회 실패: {response.status_code}",
+                    "details": response.text,
+                }
 
         except Exception as e:
             return {"success": False, "error": f"음성 목록 조회 오류: {str(e)}"}
@@ -504,35 +528,38 @@ class HeyGenService:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    f"{self.base_url}/video/generate", headers=headers, json=payload
-                )
+            client = self._get_client()
+            response = await client.post(
+                f"{self.base_url}/video/generate",
+                headers=headers,
+                json=payload,
+                timeout=60.0,
+            )
 
-                if response.status_code == 200:
-                    result = response.json()
-                    video_id = result.get("data", {}).get("video_id")
-
-                    if video_id:
-                        return {
-                            "success": True,
-                            "video_id": video_id,
-                            "video_url": None,
-                            "status": "processing",
-                        }
-                    else:
-                        return {
-                            "success": False,
-                            "error": "영상 ID를 받지 못했습니다",
-                            "details": result,
-                        }
+            if response.status_code == 200:
+                result = response.json()
+                video_id = result.get("data", {}).get("video_id")
+
+                if video_id:
+                    return {
+                        "success": True,
+                        "video_id": video_id,
+                        "video_url": None,
+                        "status": "processing",
+                    }
                 else:
-                    error_detail = await self._parse_error_response(response)
                     return {
                         "success": False,
-                        "error": f"API 요청 실패: {response.status_code}",
-                        "details": error_detail,
+                        "error": "영상 ID를 받지 못했습니다",
+                        "details": result,
                     }
+            else:
+                error_detail = await self._parse_error_response(response)
+                return {
+                    "success": False,
+                    "error": f"API 요청 실패: {response.status_code}",
+                    "details": error_detail,
+                }
 
         except Exception as e:
             logger.error(f"커스텀 배경 영상 생성 오류: {str(e)}")
@@ -3,8 +3,13 @@ import json
 import time
 from typing import Dict, List, Optional
 from datetime import datetime
+from requests.adapters import HTTPAdapter
 from app.config import settings
 
+# 모든 클라이언트 인스턴스가 공유하는 keep-alive 세션 (TLS 연결 재사용)
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=20))
+
 
 class HyperClovaXResponse:
     """HyperCLOVA X 응답을 담는 클래스"""
@@ -107,7 +112,7 @@ class HyperClovaXClient:
             print(f"   모델: {self.model}")
             print(f"   토큰: {max_tokens}, 온도: {temperature}")
 
-            response = requests.post(
+            response = _session.post(
                 url, headers=headers, json=request_data, timeout=60
             )
 
@@ -165,7 +170,7 @@ class HyperClovaXClient:
             print(f"   모델: {model}")
             print(f"   텍스트 길이: {len(text)} 문자")
 
-            response = requests.post(url, headers=headers, json=request_data)
+            response = _session.post(url, headers=headers, json=request_data)
 
             if response.status_code == 200:
                 result = response.json()
@@ -1,349 +1,422 @@
 # app/services/playwright_news_crawler.py
 import asyncio
+import concurrent.futures
 import json
 import os
+import re
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
 from playwright.async_api import async_playwright
 
+# 기사 페이지 동시 처리 수
+MAX_PARALLEL_PAGES = 3
+
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# Docker 환경을 위한 브라우저 설정
+BROWSER_ARGS = [
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-software-rasterizer",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-features=TranslateUI",
+    "--disable-ipc-flooding-protection",
+    "--enable-features=NetworkService,NetworkServiceLogging",
+    "--force-color-profile=srgb",
+    "--metrics-recording-only",
+    "--no-first-run",
+    "--headless=new",
+]
+
+NEWS_LIST_URLS = [
+    "https://finance.naver.com/news/news_list.naver?mode=LSS2D&section_id=101&section_id2=258",
+    "https://finance.naver.com/news/news_list.naver?mode=LSS2D&section_id=101&section_id2=259",
+    "https://finance.naver.com/news/mainnews.naver",
+]
+
+CONTENT_SELECTORS = [
+    "div#newsct_article",
+    "div.newsct_article._article_body",
+    "div._article_body_contents",
+    "div.news_end",
+    "div.article_body",
+]
+DATE_SELECTORS = ["span.date", "span.t11", "div.sponsor span"]
+SOURCE_SELECTORS = ["div.press_logo img", "span.source", "div.sponsor"]
+
+
+# 엔티티 사전 (긴 이름 우선 매칭, 대소문자 무시)
+_ENTITY_LEXICON = (
+    "삼성전자",
+    "SK하이닉스",
+    "네이버",
+    "카카오",
+    "현대차",
+    "LG화학",
+    "포스코",
+    "현대캐피탈",
+    "라온시큐어",
+    "삼성운용",
+    "한투운용",
+    "AI",
+    "반도체",
+    "배터리",
+    "전기차",
+    "바이오",
+    "플랫폼",
+    "보안",
+    "비트코인",
+    "암호화폐",
+    "스테이블코인",
+    "블록체인",
+    "기준금리",
+    "환율",
+    "코스피",
+    "코스닥",
+    "실적",
+    "배당",
+)
+_ENTITY_CANONICAL = {entity.upper(): entity for entity in _ENTITY_LEXICON}
+# 겹치는 위치의 엔티티도 모두 찾도록 lookahead 사용
+_ENTITY_PATTERN = re.compile(
+    "(?=("
+    + "|".join(map(re.escape, sorted(_ENTITY_LEXICON, key=len, reverse=True)))
+    + "))",
+    re.IGNORECASE,
+)
+
 
 class PlaywrightNewsCrawler:
     """Playwright 기반 네이버 뉴스 크롤러 (서비스 모듈)"""
 
     def __init__(self, cache_dir: str = "./cache"):
         self.cache_dir = cache_dir
-        self.collected_data = {
-            "collection_time": datetime.now().isoformat(),
-            "source": "naver_finance_playwright",
-            "news_items": [],
-        }
+
+        # lifespan에서 start()로 띄우는 상주 브라우저
+        self._playwright = None
+        self._browser = None
+        self._browser_loop = None
+
+    async def start(self):
+        """브라우저를 미리 실행해 두고 요청 간 재사용 (FastAPI lifespan에서 호출)"""
+        if self._browser is not None:
+            return
+
+        self._playwright = await async_playwright().start()
+        try:
+            self._browser = await self._launch_browser(self._playwright)
+        except Exception:
+            await self._playwright.stop()
+            self._playwright = None
+            raise
+        self._browser_loop = asyncio.get_running_loop()
+        print(">>> Playwright 상주 브라우저 준비 완료")
+
+    async def close(self):
+        """상주 브라우저 종료"""
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+        self._browser_loop = None
+
+    def _shared_browser(self):
+        """현재 이벤트 루프에서 재사용 가능한 상주 브라우저 (없으면 None)"""
+        if (
+            self._browser is not None
+            and self._browser.is_connected()
+            and self._browser_loop is asyncio.get_running_loop()
+        ):
+            return self._browser
+        return None
+
+    def submit_to_browser_loop(self, limit: int) -> Optional[concurrent.futures.Future]:
+        """동기 코드(워커 스레드)에서 상주 브라우저의 이벤트 루프로 수집 작업 제출
+
+        상주 브라우저가 없거나 호출 스레드가 그 루프 자체이면 None (호출 측에서 1회용 브라우저 사용)
+        """
+        loop = self._browser_loop
+        if self._browser is None or loop is None or not loop.is_running():
+            return None
+        try:
+            if asyncio.get_running_loop() is loop:
+                # 같은 루프에서 결과를 동기 대기하면 교착
+                return None
+        except RuntimeError:
+            pass
+        return asyncio.run_coroutine_threadsafe(
+            self.collect_naver_financial_news(limit), loop
+        )
 
     async def collect_naver_financial_news(self, limit: int = 10) -> List[Dict]:
-        """Playwright로 네이버 금융 뉴스 수집"""
+        """Playwright로 네이버 금융 뉴스 수집 (기사 페이지는 제한된 병렬 처리)"""
         print(">>> Playwright 네이버 뉴스 크롤링 시작")
 
-        async with async_playwright() as p:
-            # Docker 환경을 위한 브라우저 설정
-            browser_args = [
-                "--no-sandbox",
-                "--disable-dev-shm-usage",
-                "--disable-gpu",
-                "--disable-software-rasterizer",
-                "--disable-background-timer-throttling",
-                "--disable-backgrounding-occluded-windows",
-                "--disable-renderer-backgrounding",
-                "--disable-features=TranslateUI",
-                "--disable-ipc-flooding-protection",
-                "--enable-features=NetworkService,NetworkServiceLogging",
-                "--force-color-profile=srgb",
-                "--metrics-recording-only",
-                "--no-first-run",
-                "--headless=new",
-            ]
+        # 싱글턴 크롤러를 동시 요청/스레드가 공유하므로 결과는 호출별 리스트에 수집
+        browser = self._shared_browser()
+        if browser is not None:
+            news_items = await self._crawl_with_browser(browser, limit)
+        else:
+            # 상주 브라우저가 없으면 (별도 스레드/루프 등) 1회용 브라우저 실행
+            async with async_playwright() as p:
+                browser = await self._launch_browser(p)
+                try:
+                    news_items = await self._crawl_with_browser(browser, limit)
+                finally:
+                    await browser.close()
 
-            try:
-                browser = await p.chromium.launch(
-                    headless=True,
-                    args=browser_args,
-                    executable_path=None,  # Playwright가 자동으로 찾도록
-                )
-                print(">> Chromium 브라우저 실행 성공")
-            except Exception as e:
-                print(f">> Chromium 실행 실패: {str(e)}")
-                print(f">> 에러 타입: {type(e).__name__}")
+        # JSON 파일 저장
+        await self._save_to_json(news_items)
+
+        return news_items
+
+    async def _crawl_with_browser(self, browser, limit: int) -> List[Dict]:
+        """브라우저 컨텍스트 하나로 목록/기사 페이지 수집 (이번 호출 결과만 반환)"""
+        news_items: List[Dict] = []
+        # 하나의 브라우저 컨텍스트를 모든 페이지가 공유
+        context = await browser.new_context(user_agent=USER_AGENT)
+
+        try:
+            article_links = await self._collect_article_links(context, limit)
+
+            semaphore = asyncio.Semaphore(MAX_PARALLEL_PAGES)
+            results = await asyncio.gather(
+                *[
+                    self._scrape_article(semaphore, context, title, news_url)
+                    for title, news_url in article_links
+                ],
+                return_exceptions=True,
+            )
 
-                # 브라우저 경로 확인
-                import os
+            collected_count = 0
+            for result in results:
+                if isinstance(result, Exception):
+                    print(f"- 뉴스 처리 중 오류: {result}")
+                    continue
 
-                playwright_path = os.environ.get(
-                    "PLAYWRIGHT_BROWSERS_PATH", "/ms-playwright"
+                collected_count += 1
+                result["id"] = (
+                    f"playwright_news_{datetime.now().strftime('%Y%m%d')}_{collected_count}"
                 )
-                print(f">> PLAYWRIGHT_BROWSERS_PATH: {playwright_path}")
+                news_items.append(result)
 
-                if os.path.exists(playwright_path):
-                    print(f">> Playwright 브라우저 디렉토리 존재함")
-                    try:
-                        chromium_dirs = [
-                            d
-                            for d in os.listdir(playwright_path)
-                            if "chromium" in d.lower()
-                        ]
-                        print(f">> 발견된 Chromium 디렉토리: {chromium_dirs}")
-                    except Exception as list_e:
-                        print(f">> 디렉토리 목록 조회 실패: {list_e}")
-                else:
-                    print(
-                        f">> Playwright 브라우저 디렉토리가 존재하지 않음: {playwright_path}"
-                    )
+            print(f">>> 전체 크롤링 완료: {collected_count}개 뉴스 수집")
 
-                # Firefox로 폴백 시도
-                try:
-                    browser = await p.firefox.launch(
-                        headless=True, args=["--no-sandbox"]
-                    )
-                    print(">> Firefox 브라우저로 실행 성공")
-                except Exception as firefox_e:
-                    print(f">> Firefox도 실패: {firefox_e}")
-                    raise Exception(
-                        f"모든 브라우저 실행 실패 - Chromium: {e}, Firefox: {firefox_e}"
-                    )
+        except Exception as e:
+            print(f">> 크롤링 중 오류 발생: {e}")
+
+        finally:
+            await context.close()
+
+        return news_items
 
-            page = await browser.new_page()
+    async def _launch_browser(self, p):
+        """Chromium 실행 (실패 시 Firefox 폴백)"""
+        try:
+            browser = await p.chromium.launch(
+                headless=True,
+                args=BROWSER_ARGS,
+                executable_path=None,  # Playwright가 자동으로 찾도록
+            )
+            print(">> Chromium 브라우저 실행 성공")
+            return browser
+        except Exception as e:
+            print(f">> Chromium 실행 실패: {str(e)}")
+            print(f">> 에러 타입: {type(e).__name__}")
 
-            # User-Agent 설정
-            await page.set_extra_http_headers(
-                {
-                    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-                }
+            # 브라우저 경로 확인
+            playwright_path = os.environ.get(
+                "PLAYWRIGHT_BROWSERS_PATH", "/ms-playwright"
             )
+            print(f">> PLAYWRIGHT_BROWSERS_PATH: {playwright_path}")
+
+            if os.path.exists(playwright_path):
+                print(f">> Playwright 브라우저 디렉토리 존재함")
+                try:
+                    chromium_dirs = [
+                        d
+                        for d in os.listdir(playwright_path)
+                        if "chromium" in d.lower()
+                    ]
+                    print(f">> 발견된 Chromium 디렉토리: {chromium_dirs}")
+                except Exception as list_e:
+                    print(f">> 디렉토리 목록 조회 실패: {list_e}")
+            else:
+                print(
+                    f">> Playwright 브라우저 디렉토리가 존재하지 않음: {playwright_path}"
+                )
 
+            # Firefox로 폴백 시도
             try:
-                # 여러 URL 시도
-                urls_to_try = [
-                    "https://finance.naver.com/news/news_list.naver?mode=LSS2D&section_id=101&section_id2=258",
-                    "https://finance.naver.com/news/news_list.naver?mode=LSS2D&section_id=101&section_id2=259",
-                    "https://finance.naver.com/news/mainnews.naver",
-                ]
+                browser = await p.firefox.launch(headless=True, args=["--no-sandbox"])
+                print(">> Firefox 브라우저로 실행 성공")
+                return browser
+            except Exception as firefox_e:
+                print(f">> Firefox도 실패: {firefox_e}")
+                raise Exception(
+                    f"모든 브라우저 실행 실패 - Chromium: {e}, Firefox: {firefox_e}"
+                )
 
-                collected_count = 0
+    async def _collect_article_links(self, context, limit: int) -> List[tuple]:
+        """뉴스 목록 페이지에서 (제목, URL) 수집 - limit개가 모이면 중단"""
+        article_links = []
+        seen_urls = set()
+        page = await context.new_page()
 
-                for url_index, target_url in enumerate(urls_to_try, 1):
-                    if collected_count >= limit:
-                        break
+        try:
+            for url_index, target_url in enumerate(NEWS_LIST_URLS, 1):
+                if len(article_links) >= limit:
+                    break
 
-                    print(f">> URL {url_index} 처리: {target_url}")
+                print(f">> URL {url_index} 처리: {target_url}")
 
+                try:
                     await page.goto(
                         target_url, wait_until="domcontentloaded", timeout=30000
                     )
                     await page.wait_for_timeout(2000)
-
-                    # 올바른 셀렉터 사용
                     news_elements = await page.query_selector_all("dd.articleSubject a")
-                    print(f"> 발견된 뉴스 링크: {len(news_elements)}개")
-
-                    if not news_elements:
-                        continue
-
-                    # 뉴스 처리
-                    for element in news_elements:
-                        if collected_count >= limit:
-                            break
+                except Exception as e:
+                    print(f"- 목록 페이지 처리 중 오류: {e}")
+                    continue
 
-                        try:
-                            # 제목과 URL 추출
-                            title = await element.inner_text()
-                            news_url = await element.get_attribute("href")
+                print(f"> 발견된 뉴스 링크: {len(news_elements)}개")
 
-                            if not title or len(title.strip()) < 5:
-                                continue
+                for element in news_elements:
+                    if len(article_links) >= limit:
+                        break
 
-                            title = title.strip()
+                    try:
+                        # 제목과 URL 추출
+                        title = await element.inner_text()
+                        news_url = await element.get_attribute("href")
+                    except Exception as e:
+                        print(f"- 뉴스 링크 처리 중 오류: {e}")
+                        continue
 
-                            # URL 정규화
-                            if news_url and not news_url.startswith("http"):
-                                if news_url.startswith("/"):
-                                    news_url = "https://finance.naver.com" + news_url
-                                else:
-                                    news_url = "https://finance.naver.com/" + news_url
-
-                            # 본문 내용 수집
-                            content = ""
-                            article_date = ""
-                            article_source = ""
-
-                            if news_url and "naver.com" in news_url:
-                                # 새 탭에서 기사 열기
-                                article_page = await browser.new_page()
-
-                                try:
-                                    await article_page.goto(
-                                        news_url,
-                                        wait_until="domcontentloaded",
-                                        timeout=20000,
-                                    )
-                                    await article_page.wait_for_timeout(1500)
-
-                                    # 본문 내용 추출
-                                    content_selectors = [
-                                        "div#newsct_article",
-                                        "div.newsct_article._article_body",
-                                        "div._article_body_contents",
-                                        "div.news_end",
-                                        "div.article_body",
-                                    ]
-
-                                    for selector in content_selectors:
-                                        try:
-                                            content_element = (
-                                                await article_page.query_selector(
-                                                    selector
-                                                )
-                                            )
-                                            if content_element:
-                                                content = (
-                                                    await content_element.inner_text()
-                                                )
-                                                break
-                                        except:
-                                            continue
-
-                                    if not content:
-                                        content = "본문을 찾을 수 없습니다."
-
-                                    # 날짜 추출
-                                    try:
-                                        date_selectors = [
-                                            "span.date",
-                                            "span.t11",
-                                            "div.sponsor span",
-                                        ]
-                                        for date_sel in date_selectors:
-                                            date_element = (
-                                                await article_page.query_selector(
-                                                    date_sel
-                                                )
-                                            )
-                                            if date_element:
-                                                article_date = (
-                                                    await date_element.inner_text()
-                                                )
-                                                break
-                                    except:
-                                        article_date = datetime.now().strftime(
-                                            "%Y-%m-%d"
-                                        )
-
-                                    # 출처 추출
-                                    try:
-                                        source_selectors = [
-                                            "div.press_logo img",
-                                            "span.source",
-                                            "div.sponsor",
-                                        ]
-                                        for source_sel in source_selectors:
-                                            source_element = (
-                                                await article_page.query_selector(
-                                                    source_sel
-                                                )
-                                            )
-                                            if source_element:
-                                                if await source_element.get_attribute(
-                                                    "alt"
-                                                ):
-                                                    article_source = await source_element.get_attribute(
-                                                        "alt"
-                                                    )
-                                                else:
-                                                    article_source = (
-                                                        await source_element.inner_text()
-                                                    )
-                                                break
-                                    except:
-                                        article_source = "네이버금융"
-
-                                except Exception as e:
-                                    content = "기사 내용을 가져올 수 없습니다."
-
-                                finally:
-                                    await article_page.close()
-                            else:
-                                content = "외부 링크로 본문 수집 불가"
-                                article_source = "네이버금융"
-                                article_date = datetime.now().strftime("%Y-%m-%d")
-
-                            # 엔티티 추출
-                            entities = self._extract_entities(title + " " + content)
-
-                            # 중요도 계산
-                            importance_score = self._calculate_importance(
-                                title, content
-                            )
+                    if not title or len(title.strip()) < 5:
+                        continue
 
-                            # 데이터 저장
-                            news_item = {
-                                "id": f"playwright_news_{datetime.now().strftime('%Y%m%d')}_{collected_count + 1}",
-                                "title": title,
-                                "url": news_url,
-                                "content": content,
-                                "summary": (
-                                    content[:300] + "..."
-                                    if len(content) > 300
-                                    else content
-                                ),
-                                "source": article_source,
-                                "published_at": article_date,
-                                "entities": entities,
-                                "importance_score": importance_score,
-                                "collected_at": datetime.now().isoformat(),
-                            }
-
-                            self.collected_data["news_items"].append(news_item)
-                            collected_count += 1
-
-                            print(f"> 뉴스 {collected_count} 수집 완료")
-
-                            # 요청 간격 조절
-                            await asyncio.sleep(1)
-
-                        except Exception as e:
-                            print(f"- 뉴스 처리 중 오류: {e}")
-                            continue
+                    # URL 정규화
+                    if news_url and not news_url.startswith("http"):
+                        if news_url.startswith("/"):
+                            news_url = "https://finance.naver.com" + news_url
+                        else:
+                            news_url = "https://finance.naver.com/" + news_url
 
-                print(f">>> 전체 크롤링 완료: {collected_count}개 뉴스 수집")
+                    if news_url in seen_urls:
+                        continue
+                    seen_urls.add(news_url)
+                    article_links.append((title.strip(), news_url))
+        finally:
+            await page.close()
 
-            except Exception as e:
-                print(f">> 크롤링 중 오류 발생: {e}")
+        return article_links
 
-            finally:
-                await browser.close()
+    async def _scrape_article(
+        self, semaphore: asyncio.Semaphore, context, title: str, news_url: str
+    ) -> Dict:
+        """기사 본문/날짜/출처 수집 (semaphore로 동시 페이지 수 제한)"""
+        content = ""
+        article_date = ""
+        article_source = ""
 
-        # JSON 파일 저장
-        await self._save_to_json()
+        if news_url and "naver.com" in news_url:
+            async with semaphore:
+                article_page = await context.new_page()
 
-        return self.collected_data["news_items"]
+                try:
+                    await article_page.goto(
+                        news_url,
+                        wait_until="domcontentloaded",
+                        timeout=20000,
+                    )
+                    await article_page.wait_for_timeout(1500)
 
-    def _extract_entities(self, text: str) -> List[str]:
-        """엔티티 추출"""
-        known_entities = [
-            "삼성전자",
-            "SK하이닉스",
-            "네이버",
-            "카카오",
-            "현대차",
-            "LG화학",
-            "포스코",
-            "현대캐피탈",
-            "라온시큐어",
-            "삼성운용",
-            "한투운용",
-            "AI",
-            "반도체",
-            "배터리",
-            "전기차",
-            "바이오",
-            "플랫폼",
-            "보안",
-            "비트코인",
-            "암호화폐",
-            "스테이블코인",
-            "블록체인",
-            "기준금리",
-            "환율",
-            "코스피",
-            "코스닥",
-            "실적",
-            "배당",
-        ]
+                    # 본문 내용 추출
+                    for selector in CONTENT_SELECTORS:
+                        try:
+                            content_element = await article_page.query_selector(
+                                selector
+                            )
+                            if content_element:
+                                content = await content_element.inner_text()
+                                break
+                        except:
+                            continue
 
-        found_entities = []
-        text_upper = text.upper()
+                    if not content:
+                        content = "본문을 찾을 수 없습니다."
 
-        for entity in known_entities:
-            if entity in text or entity.upper() in text_upper:
-                found_entities.append(entity)
+                    # 날짜 추출
+                    try:
+                        for date_sel in DATE_SELECTORS:
+                            date_element = await article_page.query_selector(date_sel)
+                            if date_element:
+                                article_date = await date_element.inner_text()
+                                break
+                    except:
+                        article_date = datetime.now().strftime("%Y-%m-%d")
+
+                    # 출처 추출
+                    try:
+                        for source_sel in SOURCE_SELECTORS:
+                            source_element = await article_page.query_selector(
+                                source_sel
+                            )
+                            if source_element:
+                                alt_text = await source_element.get_attribute("alt")
+                                if alt_text:
+                                    article_source = alt_text
+                                else:
+                                    article_source = await source_element.inner_text()
+                                break
+                    except:
+                        article_source = "네이버금융"
+
+                except Exception as e:
+                    content = "기사 내용을 가져올 수 없습니다."
+
+                finally:
+                    await article_page.close()
+        else:
+            content = "외부 링크로 본문 수집 불가"
+            article_source = "네이버금융"
+            article_date = datetime.now().strftime("%Y-%m-%d")
+
+        # 엔티티 추출
+        entities = self._extract_entities(title + " " + content)
+
+        # 중요도 계산
+        importance_score = self._calculate_importance(title, content)
+
+        print(f"> 뉴스 수집 완료: {title[:30]}")
+
+        return {
+            "title": title,
+            "url": news_url,
+            "content": content,
+            "summary": (content[:300] + "..." if len(content) > 300 else content),
+            "source": article_source,
+            "published_at": article_date,
+            "entities": entities,
+            "importance_score": importance_score,
+            "collected_at": datetime.now().isoformat(),
+        }
 
-        return list(set(found_entities))
+    def _extract_entities(self, text: str) -> List[str]:
+        """엔티티 추출 (사전 컴파일된 단일 패턴으로 한 번에 스캔)"""
+        return list(
+            dict.fromkeys(
+                _ENTITY_CANONICAL[match.group(1).upper()]
+                for match in _ENTITY_PATTERN.finditer(text)
+            )
+        )
 
     def _calculate_importance(self, title: str, content: str) -> float:
         """중요도 계산"""
@@ -373,9 +446,9 @@ class PlaywrightNewsCrawler:
 
         return min(score, 5.0)
 
-    async def _save_to_json(self):
-        """JSON 파일로 저장"""
-        if not self.collected_data["news_items"]:
+    async def _save_to_json(self, news_items: List[Dict]):
+        """이번 호출 수집 결과를 JSON 파일로 저장"""
+        if not news_items:
             return
 
         # 저장 디렉토리 생성
@@ -388,8 +461,17 @@ class PlaywrightNewsCrawler:
 
         try:
             with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(self.collected_data, f, ensure_ascii=False, indent=2)
+                json.dump(
+                    {
+                        "collection_time": datetime.now().isoformat(),
+                        "source": "naver_finance_playwright",
+                        "news_items": news_items,
+                    },
+                    f,
+                    ensure_ascii=False,
+                    indent=2,
+                )
             print(f">>> JSON 파일 저장 완료: {filepath}")
-            print(f"- 저장된 뉴스 개수: {len(self.collected_data['news_items'])}")
+            print(f"- 저장된 뉴스 개수: {len(news_items)}")
         except Exception as e:
             print(f">>> JSON 파일 저장 실패: {e}")
@@ -1,8 +1,10 @@
 # app/services/enhanced_data_collector.py (최종 수정 - 동기/비동기 명확 분리)
 import requests
+import httpx
 import json
 import os
 import asyncio
+import concurrent.futures
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 import time
@@ -11,12 +13,67 @@ from pykrx import stock
 import OpenDartReader
 import pandas as pd
 import sqlite3
+from selectolax.lexbor import LexborHTMLParser
 from app.config import settings
 from app.models.responses import NewsItem, DisclosureItem, MarketData
 from app.models.user_models import StockPrice
 from ..external.playwright_news_crawler import PlaywrightNewsCrawler
 from ..core.news_to_graph import NewsToGraphPipeline
 
+NAVER_NEWS_LIST_URLS = [
+    "https://finance.naver.com/news/news_list.naver?mode=LSS2D&section_id=101&section_id2=258",
+    "https://finance.naver.com/news/news_list.naver?mode=LSS2D&section_id=101&section_id2=259",
+    "https://finance.naver.com/news/mainnews.naver",
+]
+
+# HTML 앞부분 meta 태그의 charset 선언 (네이버 금융은 EUC-KR)
+_META_CHARSET_RE = re.compile(rb"""<meta[^>]+charset=["']?([\w-]+)""", re.IGNORECASE)
+
+
+def _decode_html(content: bytes) -> str:
+    """meta charset으로 디코딩 (선언이 없거나 알 수 없으면 UTF-8)"""
+    match = _META_CHARSET_RE.search(content, 0, 2048)
+    encoding = match.group(1).decode("ascii") if match else "utf-8"
+    try:
+        return content.decode(encoding, errors="replace")
+    except LookupError:
+        return content.decode("utf-8", errors="replace")
+
+
+# 엔티티 사전 (긴 이름 우선 매칭, 대소문자 무시)
+_ENTITY_LEXICON = (
+    "삼성전자",
+    "SK하이닉스",
+    "네이버",
+    "카카오",
+    "현대차",
+    "LG화학",
+    "AI",
+    "반도체",
+    "배터리",
+    "전기차",
+    "바이오",
+    "플랫폼",
+    "비트코인",
+    "스테이블코인",
+    "암호화폐",
+    "블록체인",
+    "기준금리",
+    "환율",
+    "코스피",
+    "코스닥",
+    "실적",
+    "배당",
+)
+_ENTITY_CANONICAL = {entity.upper(): entity for entity in _ENTITY_LEXICON}
+# 겹치는 위치의 엔티티도 모두 찾도록 lookahead 사용
+_ENTITY_PATTERN = re.compile(
+    "(?=("
+    + "|".join(map(re.escape, sorted(_ENTITY_LEXICON, key=len, reverse=True)))
+    + "))",
+    re.IGNORECASE,
+)
+
 
 class EnhancedDataCollector:
     """향상된 금융 데이터 수집 시스템 (Playwright 통합 - 최종 수정)"""
@@ -31,6 +88,9 @@ class EnhancedDataCollector:
             OpenDartReader(settings.DART_API_KEY) if settings.DART_API_KEY else None
         )
 
+        # 비동기 HTTP 클라이언트 (startup()에서 생성)
+        self.http_client: Optional[httpx.AsyncClient] = None
+
         # Playwright 크롤러 초기화
         self.playwright_crawler = PlaywrightNewsCrawler(self.cache_dir)
 
@@ -40,6 +100,29 @@ class EnhancedDataCollector:
         self.init_database()
         print(">>> 데이터 수집기 초기화 완료 (Playwright 통합 - 최종 수정)")
 
+    async def startup(self):
+        """상주 브라우저 / 커넥션 풀 준비 (FastAPI lifespan에서 1회 호출)"""
+        if self.http_client is None:
+            self.http_client = httpx.AsyncClient(
+                http2=True,
+                timeout=15,
+                headers={"User-Agent": settings.USER_AGENT},
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            )
+
+        try:
+            await self.playwright_crawler.start()
+        except Exception as e:
+            # 브라우저를 못 띄우면 요청마다 1회용 브라우저로 동작
+            print(f">> Playwright 상주 브라우저 실행 실패: {e}")
+
+    async def shutdown(self):
+        """상주 브라우저 / 커넥션 풀 정리"""
+        await self.playwright_crawler.close()
+        if self.http_client is not None:
+            await self.http_client.aclose()
+            self.http_client = None
+
     def init_database(self):
         """SQLite 데이터베이스 및 테이블 초기화"""
         conn = sqlite3.connect(self.db_path)
@@ -68,33 +151,41 @@ class EnhancedDataCollector:
         self, limit: int = 20, use_playwright: bool = True
     ) -> List[NewsItem]:
         """동기 종합 뉴스 수집 (Playwright 스레드 방식)"""
-        print(
-            f">>> 뉴스 수집 모드: {'Playwright' if use_playwright else 'BeautifulSoup'}"
-        )
+        print(f">>> 뉴스 수집 모드: {'Playwright' if use_playwright else '정적 HTML'}")
 
         if use_playwright:
             try:
                 print(">> Playwright 모드로 뉴스 수집 중...")
 
-                # 스레드 방식으로 Playwright 실행 (동기 환경용)
-                import concurrent.futures
-                import threading
-
-                def run_playwright_in_thread():
-                    """별도 스레드에서 Playwright 실행"""
-                    new_loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(new_loop)
+                # 상주 브라우저가 있으면 그 이벤트 루프에 제출해 재사용
+                future = self.playwright_crawler.submit_to_browser_loop(limit)
+                if future is not None:
                     try:
-                        return new_loop.run_until_complete(
-                            self.playwright_crawler.collect_naver_financial_news(limit)
-                        )
-                    finally:
-                        new_loop.close()
+                        playwright_data = future.result(timeout=120)  # 2분 타임아웃
+                    except concurrent.futures.TimeoutError:
+                        future.cancel()
+                        raise
+                else:
+                    # 상주 브라우저가 없으면 별도 스레드/루프에서 1회용 브라우저로 실행
+                    def run_playwright_in_thread():
+                        """별도 스레드에서 Playwright 실행"""
+                        new_loop = asyncio.new_event_loop()
+                        asyncio.set_event_loop(new_loop)
+                        try:
+                            return new_loop.run_until_complete(
+                                self.playwright_crawler.collect_naver_financial_news(
+                                    limit
+                                )
+                            )
+                        finally:
+                            new_loop.close()
 
-                # 스레드에서 실행
-                with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                    future = executor.submit(run_playwright_in_thread)
-                    playwright_data = future.result(timeout=120)  # 2분 타임아웃
+                    with concurrent.futures.ThreadPoolExecutor(
+                        max_workers=1
+                    ) as executor:
+                        playwright_data = executor.submit(
+                            run_playwright_in_thread
+                        ).result(timeout=120)
 
                 # Playwright 데이터를 NewsItem 객체로 변환
                 news_items = []
@@ -133,14 +224,14 @@ class EnhancedDataCollector:
 
                     return news_items
                 else:
-                    print(">> Playwright 수집 실패, BeautifulSoup으로 재시도...")
+                    print(">> Playwright 수집 실패, 정적 HTML 수집으로 재시도...")
 
             except Exception as e:
                 print(f">> Playwright 오류: {e}")
-                print(">> BeautifulSoup 방식으로 폴백...")
+                print(">> 정적 HTML 방식으로 폴백...")
 
-        # BeautifulSoup 폴백
-        print(">> BeautifulSoup 모드로 뉴스 수집 중...")
+        # 정적 HTML 폴백
+        print(">> 정적 HTML 모드로 뉴스 수집 중...")
         return self._collect_naver_financial_news_fallback(limit)
 
     def collect_all_data(
@@ -151,7 +242,7 @@ class EnhancedDataCollector:
     ) -> Dict:
         """전체 데이터 수집 (동기 버전)"""
         print(
-            f">> 실제 금융 데이터 수집 시작 (동기 모드, {'Playwright' if use_playwright else 'BeautifulSoup'})"
+            f">> 실제 금융 데이터 수집 시작 (동기 모드, {'Playwright' if use_playwright else '정적 HTML'})"
         )
 
         # 뉴스 수집 (동기 버전 사용)
@@ -161,17 +252,10 @@ class EnhancedDataCollector:
         disclosures = self.collect_comprehensive_disclosures(limit=10)
 
         # 사용자별 맞춤 종목 리스트 구성
-        all_symbols = ["005930", "000660", "035420"]
         personalized_data = {}
-
         if user_id:
             personalized_data = self.get_personalized_data(user_id)
-            if personalized_data.get("portfolio"):
-                portfolio_symbols = {
-                    holding[0] for holding in personalized_data["portfolio"]
-                }
-                all_symbols.extend(list(portfolio_symbols))
-                all_symbols = list(set(all_symbols))
+        all_symbols = self._build_stock_symbols(personalized_data)
 
         # 주식 데이터 수집
         stock_data = self.collect_comprehensive_stock_data(all_symbols)
@@ -201,6 +285,50 @@ class EnhancedDataCollector:
 
         return result
 
+    def collect_all_data_batch(
+        self, user_ids: List[str], use_playwright: bool = True
+    ) -> Dict[str, Dict]:
+        """여러 사용자 데이터 일괄 수집 (뉴스/공시/시세는 한 번만 수집 후 사용자별 분배)"""
+        print(f">> {len(user_ids)}명 사용자 데이터 일괄 수집 시작 (동기 모드)")
+
+        news = self.collect_comprehensive_news(limit=10, use_playwright=use_playwright)
+        disclosures = self.collect_comprehensive_disclosures(limit=10)
+
+        personalized_by_user = {
+            user_id: self.get_personalized_data(user_id) for user_id in user_ids
+        }
+        symbols_by_user = {
+            user_id: set(self._build_stock_symbols(personalized_data))
+            for user_id, personalized_data in personalized_by_user.items()
+        }
+
+        # 전체 사용자 종목 합집합으로 시세 1회 수집
+        all_symbols = sorted(set().union(*symbols_by_user.values()))
+        stock_data = self.collect_comprehensive_stock_data(all_symbols)
+
+        collected_at = datetime.now().isoformat()
+        results = {}
+        for user_id, personalized_data in personalized_by_user.items():
+            user_symbols = symbols_by_user[user_id]
+            user_stock_data = [s for s in stock_data if s.symbol in user_symbols]
+            results[user_id] = {
+                "news": news,
+                "disclosures": disclosures,
+                "stock_data": user_stock_data,
+                "personalized": personalized_data,
+                "collected_at": collected_at,
+                "data_sources": {
+                    "news_count": len(news),
+                    "disclosures_count": len(disclosures),
+                    "stock_count": len(user_stock_data),
+                    "is_playwright_used": use_playwright,
+                    "is_real_data_only": True,
+                    "collection_mode": "batch",
+                },
+            }
+
+        return results
+
     # === 비동기 버전 메서드들 (FastAPI 전용) ===
 
     async def collect_comprehensive_news_async(
@@ -208,7 +336,7 @@ class EnhancedDataCollector:
     ) -> List[NewsItem]:
         """비동기 종합 뉴스 수집 (FastAPI 환경용)"""
         print(
-            f">>> 뉴스 수집 모드: {'Playwright' if use_playwright else 'BeautifulSoup'} (비동기)"
+            f">>> 뉴스 수집 모드: {'Playwright' if use_playwright else '정적 HTML'} (비동기)"
         )
 
         if use_playwright:
@@ -235,7 +363,7 @@ class EnhancedDataCollector:
                     news_items.append(news_item)
 
                 if news_items:
-                    self._save_news_to_db(news_items)
+                    await asyncio.to_thread(self._save_news_to_db, news_items)
                     print(
                         f">>> Playwright로 뉴스 {len(news_items)}건 수집 및 저장 완료 (비동기)"
                     )
@@ -243,7 +371,9 @@ class EnhancedDataCollector:
                     # Graph DB 업데이트 (비동기 Playwright)
                     try:
                         print(">>> Playwright 뉴스 → Graph DB 업데이트 시작 (비동기)")
-                        update_result = self.news_to_graph.process_latest_news()
+                        update_result = await asyncio.to_thread(
+                            self.news_to_graph.process_latest_news
+                        )
                         if update_result and update_result.get("success"):
                             print(
                                 f">>> Graph DB 업데이트 성공: {update_result.get('entities_created', 0)}개 엔티티, {update_result.get('relationships_created', 0)}개 관계"
@@ -257,15 +387,15 @@ class EnhancedDataCollector:
 
                     return news_items
                 else:
-                    print(">> Playwright 수집 실패, BeautifulSoup으로 재시도...")
+                    print(">> Playwright 수집 실패, 정적 HTML 수집으로 재시도...")
 
             except Exception as e:
                 print(f">> Playwright 오류 (비동기): {e}")
-                print(">> BeautifulSoup 방식으로 폴백...")
+                print(">> 정적 HTML 방식으로 폴백...")
 
-        # BeautifulSoup 폴백
-        print(">> BeautifulSoup 모드로 뉴스 수집 중... (비동기)")
-        return self._collect_naver_financial_news_fallback(limit)
+        # 정적 HTML 폴백 (httpx + selectolax)
+        print(">> 정적 HTML 모드로 뉴스 수집 중... (비동기)")
+        return await self._collect_naver_financial_news_fallback_async(limit)
 
     async def collect_all_data_async(
         self,
@@ -273,35 +403,31 @@ class EnhancedDataCollector:
         refresh_cache: bool = False,
         use_playwright: bool = True,  # 기본값을 True로 복원
     ) -> Dict:
-        """전체 데이터 수집 (비동기 버전 - FastAPI용)"""
+        """전체 데이터 수집 (비동기 버전 - FastAPI용, 독립 수집 작업 병렬 실행)"""
         print(
-            f">> 실제 금융 데이터 수집 시작 (비동기 모드, {'Playwright' if use_playwright else 'BeautifulSoup'})"
+            f">> 실제 금융 데이터 수집 시작 (비동기 모드, {'Playwright' if use_playwright else '정적 HTML'})"
         )
 
-        # 뉴스 수집 (비동기)
-        news = await self.collect_comprehensive_news_async(
-            limit=10, use_playwright=use_playwright
+        async def collect_personalized_and_stocks():
+            # 주식 종목 리스트가 포트폴리오에 의존하므로 순차 실행
+            personalized_data = {}
+            if user_id:
+                personalized_data = await asyncio.to_thread(
+                    self.get_personalized_data, user_id
+                )
+            all_symbols = self._build_stock_symbols(personalized_data)
+            stock_data = await self.collect_comprehensive_stock_data_async(all_symbols)
+            return personalized_data, stock_data
+
+        # 뉴스 / 공시 / (개인화 데이터 → 주식) 병렬 수집
+        news, disclosures, (personalized_data, stock_data) = await asyncio.gather(
+            self.collect_comprehensive_news_async(
+                limit=10, use_playwright=use_playwright
+            ),
+            asyncio.to_thread(self.collect_comprehensive_disclosures, limit=10),
+            collect_personalized_and_stocks(),
         )
 
-        # 공시 수집 (동기)
-        disclosures = self.collect_comprehensive_disclosures(limit=10)
-
-        # 사용자별 맞춤 종목 리스트 구성
-        all_symbols = ["005930", "000660", "035420"]
-        personalized_data = {}
-
-        if user_id:
-            personalized_data = self.get_personalized_data(user_id)
-            if personalized_data.get("portfolio"):
-                portfolio_symbols = {
-                    holding[0] for holding in personalized_data["portfolio"]
-                }
-                all_symbols.extend(list(portfolio_symbols))
-                all_symbols = list(set(all_symbols))
-
-        # 주식 데이터 수집 (동기)
-        stock_data = self.collect_comprehensive_stock_data(all_symbols)
-
         # 데이터 수집 결과 검증
         total_collected = len(news) + len(disclosures) + len(stock_data)
         if total_collected == 0:
@@ -329,79 +455,131 @@ class EnhancedDataCollector:
 
     # === 공통 메서드들 ===
 
+    def _build_stock_symbols(self, personalized_data: Dict) -> List[str]:
+        """기본 종목 + 사용자 포트폴리오 종목 리스트 구성"""
+        all_symbols = ["005930", "000660", "035420"]
+        if personalized_data.get("portfolio"):
+            portfolio_symbols = {
+                holding[0] for holding in personalized_data["portfolio"]
+            }
+            all_symbols.extend(list(portfolio_symbols))
+            all_symbols = list(set(all_symbols))
+        return all_symbols
+
     def _collect_naver_financial_news_fallback(self, limit: int) -> List[NewsItem]:
-        """BeautifulSoup 기반 뉴스 수집 (폴백용)"""
-        from bs4 import BeautifulSoup
+        """정적 HTML 기반 뉴스 수집 (폴백용)"""
+        print(">>> 정적 HTML 폴백 뉴스 수집 시작")
 
-        print(">>> BeautifulSoup 폴백 뉴스 수집 시작")
+        items = self._fetch_naver_news_list(limit)
+        self._finish_fallback_news(items)
+        return items
 
-        urls_to_try = [
-            "https://finance.naver.com/news/news_list.naver?mode=LSS2D&section_id=101&section_id2=258",
-            "https://finance.naver.com/news/news_list.naver?mode=LSS2D&section_id=101&section_id2=259",
-            "https://finance.naver.com/news/mainnews.naver",
-        ]
+    async def _collect_naver_financial_news_fallback_async(
+        self, limit: int
+    ) -> List[NewsItem]:
+        """정적 HTML 기반 뉴스 수집 (폴백용, 공유 httpx 클라이언트 사용)"""
+        if self.http_client is None:
+            return await asyncio.to_thread(
+                self._collect_naver_financial_news_fallback, limit
+            )
 
-        items = []
+        print(">>> 정적 HTML 폴백 뉴스 수집 시작 (비동기)")
+
+        items = await self._fetch_naver_news_list_async(limit)
+        await asyncio.to_thread(self._finish_fallback_news, items)
+        return items
+
+    async def probe_news_source(self, limit: int = 3) -> List[NewsItem]:
+        """헬스 프로브용 뉴스 수집 (목록 페이지 조회/파싱만, DB·Graph DB 저장 없음)"""
+        if self.http_client is None:
+            return await asyncio.to_thread(self._fetch_naver_news_list, limit)
+        return await self._fetch_naver_news_list_async(limit)
 
-        for url in urls_to_try:
+    def _fetch_naver_news_list(self, limit: int) -> List[NewsItem]:
+        """네이버 금융 뉴스 목록 페이지 조회 및 파싱 (첫 성공 URL 기준)"""
+        for url in NAVER_NEWS_LIST_URLS:
             try:
-                print(f">> BeautifulSoup: {url}")
+                print(f">> 정적 HTML: {url}")
                 response = self.session.get(url, timeout=10)
                 response.raise_for_status()
-                soup = BeautifulSoup(response.content, "html.parser")
-
-                # CSS 셀렉터 시도
-                selectors = [
-                    "dd.articleSubject a",
-                    "td.title a",
-                    "div.mainNewsList li a",
-                ]
-
-                for selector in selectors:
-                    news_links = soup.select(selector)
-                    if news_links:
-                        print(f"- {selector}: {len(news_links)}개 발견")
-                        break
-
-                if not news_links:
-                    continue
+                items = self._parse_naver_news_list(response.content, limit)
 
-                for link in news_links[:limit]:
-                    try:
-                        title = link.text.strip()
-                        if not title or len(title) < 5:
-                            continue
-
-                        news_item = NewsItem(
-                            title=title,
-                            summary=title[:100],
-                            source="네이버금융",
-                            published_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                            entities=self._extract_entities_from_text(title),
-                            importance_score=self._calculate_importance_score(
-                                {"title": title}
-                            ),
-                        )
-                        items.append(news_item)
+                if items:
+                    return items
 
-                    except Exception as e:
-                        print(f"- BeautifulSoup 뉴스 파싱 오류: {e}")
-                        continue
+            except Exception as e:
+                print(f"- 정적 HTML URL 실패: {e}")
+                continue
+
+        return []
+
+    async def _fetch_naver_news_list_async(self, limit: int) -> List[NewsItem]:
+        """네이버 금융 뉴스 목록 페이지 조회 및 파싱 (공유 httpx 클라이언트)"""
+        for url in NAVER_NEWS_LIST_URLS:
+            try:
+                print(f">> 정적 HTML: {url}")
+                response = await self.http_client.get(url)
+                response.raise_for_status()
+                items = self._parse_naver_news_list(response.content, limit)
 
                 if items:
-                    break
+                    return items
 
             except Exception as e:
-                print(f"- BeautifulSoup URL 실패: {e}")
+                print(f"- 정적 HTML URL 실패: {e}")
                 continue
 
+        return []
+
+    def _parse_naver_news_list(self, content: bytes, limit: int) -> List[NewsItem]:
+        """네이버 금융 뉴스 목록 HTML 파싱 (selectolax lexbor, meta charset으로 디코딩)"""
+        tree = LexborHTMLParser(_decode_html(content))
+
+        # CSS 셀렉터 시도
+        selectors = [
+            "dd.articleSubject a",
+            "td.title a",
+            "div.mainNewsList li a",
+        ]
+
+        for selector in selectors:
+            news_links = tree.css(selector)
+            if news_links:
+                print(f"- {selector}: {len(news_links)}개 발견")
+                break
+
+        items = []
+        for link in news_links[:limit]:
+            try:
+                title = link.text(strip=True)
+                if not title or len(title) < 5:
+                    continue
+
+                news_item = NewsItem(
+                    title=title,
+                    summary=title[:100],
+                    source="네이버금융",
+                    published_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                    entities=self._extract_entities_from_text(title),
+                    importance_score=self._calculate_importance_score({"title": title}),
+                )
+                items.append(news_item)
+
+            except Exception as e:
+                print(f"- 정적 HTML 뉴스 파싱 오류: {e}")
+                continue
+
+        return items
+
+    def _finish_fallback_news(self, items: List[NewsItem]):
+        """폴백 수집 결과 DB 저장 및 Graph DB 업데이트"""
         if items:
             self._save_news_to_db(items)
-            print(f">>> BeautifulSoup로 뉴스 {len(items)}건 수집 완료")
+            print(f">>> 정적 HTML 파싱으로 뉴스 {len(items)}건 수집 완료")
 
-            # Graph DB 업데이트 (BeautifulSoup 폴백)
+            # Graph DB 업데이트 (정적 HTML 폴백)
             try:
-                print(">>> BeautifulSoup 뉴스 → Graph DB 업데이트 시작")
+                print(">>> 정적 HTML 뉴스 → Graph DB 업데이트 시작")
                 update_result = self.news_to_graph.process_latest_news()
                 if update_result and update_result.get("success"):
                     print(
@@ -414,9 +592,7 @@ class EnhancedDataCollector:
             except Exception as e:
                 print(f">>> Graph DB 업데이트 중 오류 발생: {e}")
         else:
-            print(">>> BeautifulSoup 뉴스 수집 실패")
-
-        return items
+            print(">>> 정적 HTML 뉴스 수집 실패")
 
     def _get_top_companies(self) -> List[Dict[str, str]]:
         """시가총액 상위 기업의 corp_code 조회"""
@@ -498,22 +674,13 @@ class EnhancedDataCollector:
 
         print(f">> {len(symbols)}개 종목의 실제 시세 정보 수집 중...")
 
-        # 여러 날짜 시도
-        dates_to_try = []
-        base_date = datetime.now()
-
-        for i in range(5):
-            target_date = base_date - timedelta(days=i)
-            if target_date.weekday() < 5:  # 평일만
-                dates_to_try.append(target_date.strftime("%Y%m%d"))
-
+        dates_to_try = self._recent_trading_dates()
         print(f">> 시도할 거래일: {dates_to_try}")
 
         stock_data = []
 
         for date_str in dates_to_try:
             print(f"\n>> {date_str} 데이터 수집 시도...")
-            successful_count = 0
 
             try:
                 df = stock.get_market_ohlcv(date_str, market="ALL")
@@ -523,129 +690,148 @@ class EnhancedDataCollector:
                     print(f">> {date_str}: 시장 데이터가 없습니다.")
                     continue
 
-                for symbol in symbols:
-                    try:
-                        name = stock.get_market_ticker_name(symbol)
-                        if not name:
-                            continue
+                stock_data = self._build_stock_prices(symbols, df, cap_df, date_str)
+                if stock_data:
+                    print(f">> {date_str} 데이터로 {len(stock_data)}개 종목 수집 성공!")
+                    break
 
-                        if symbol not in df.index:
-                            print(
-                                f">> {symbol}({name}): {date_str} 거래 데이터가 없습니다."
-                            )
-                            continue
+            except Exception as e:
+                print(f">> {date_str} 전체 데이터 수집 실패: {e}")
+                continue
 
-                        data = df.loc[symbol]
+        self._finish_stock_data(stock_data)
+        return stock_data
 
-                        if (
-                            data["종가"] == 0
-                            or pd.isna(data["종가"])
-                            or data["종가"] < 100
-                        ):
-                            print(
-                                f">> {symbol}({name}): 종가가 유효하지 않습니다 (가격: {data['종가']})"
-                            )
-                            continue
+    async def collect_comprehensive_stock_data_async(
+        self, symbols: Optional[List[str]] = None
+    ) -> List[StockPrice]:
+        """주식 데이터 수집 (비동기 버전 - 시세/시가총액 조회 병렬 실행)"""
+        if not symbols:
+            symbols = ["005930", "000660", "035420"]
 
-                        market_cap = 0
-                        try:
-                            if symbol in cap_df.index and not pd.isna(
-                                cap_df.loc[symbol]["시가총액"]
-                            ):
-                                market_cap = int(cap_df.loc[symbol]["시가총액"])
-                        except Exception as e:
-                            print(f">> {symbol} 시가총액 정보 없음: {e}")
-
-                        change_amount = (
-                            int(data["종가"] - data["시가"])
-                            if not pd.isna(data["시가"])
-                            else 0
-                        )
-                        change_percent = (
-                            float(data["등락률"])
-                            if not pd.isna(data["등락률"])
-                            else 0.0
-                        )
+        print(f">> {len(symbols)}개 종목의 실제 시세 정보 수집 중... (비동기)")
 
-                        stock_price = StockPrice(
-                            symbol=symbol,
-                            company_name=name,
-                            price=int(data["종가"]),
-                            change_amount=change_amount,
-                            change_percent=change_percent,
-                            volume=(
-                                int(data["거래량"])
-                                if not pd.isna(data["거래량"])
-                                else 0
-                            ),
-                            market_cap=market_cap,
-                            date=date_str,
-                        )
+        dates_to_try = self._recent_trading_dates()
+        stock_data = []
 
-                        stock_data.append(stock_price)
-                        successful_count += 1
-                        print(
-                            f">> {name}({symbol}): {stock_price.price:,}원 ({stock_price.change_percent:+.2f}%) [{date_str}]"
-                        )
+        for date_str in dates_to_try:
+            print(f"\n>> {date_str} 데이터 수집 시도...")
 
-                    except Exception as e:
-                        print(f">> {symbol} 개별 수집 실패: {e}")
-                        continue
+            try:
+                df, cap_df = await asyncio.gather(
+                    asyncio.to_thread(stock.get_market_ohlcv, date_str, market="ALL"),
+                    asyncio.to_thread(stock.get_market_cap, date_str, market="ALL"),
+                )
 
-                if successful_count > 0:
-                    print(
-                        f">> {date_str} 데이터로 {successful_count}개 종목 수집 성공!"
-                    )
+                if df.empty:
+                    print(f">> {date_str}: 시장 데이터가 없습니다.")
+                    continue
+
+                stock_data = await asyncio.to_thread(
+                    self._build_stock_prices, symbols, df, cap_df, date_str
+                )
+                if stock_data:
+                    print(f">> {date_str} 데이터로 {len(stock_data)}개 종목 수집 성공!")
                     break
 
             except Exception as e:
                 print(f">> {date_str} 전체 데이터 수집 실패: {e}")
                 continue
 
+        await asyncio.to_thread(self._finish_stock_data, stock_data)
+        return stock_data
+
+    def _recent_trading_dates(self) -> List[str]:
+        """최근 5일 중 평일 날짜 목록 (YYYYMMDD)"""
+        dates_to_try = []
+        base_date = datetime.now()
+
+        for i in range(5):
+            target_date = base_date - timedelta(days=i)
+            if target_date.weekday() < 5:  # 평일만
+                dates_to_try.append(target_date.strftime("%Y%m%d"))
+
+        return dates_to_try
+
+    def _build_stock_prices(
+        self, symbols: List[str], df, cap_df, date_str: str
+    ) -> List[StockPrice]:
+        """하루치 시장 데이터에서 요청 종목의 StockPrice 구성"""
+        stock_data = []
+
+        for symbol in symbols:
+            try:
+                name = stock.get_market_ticker_name(symbol)
+                if not name:
+                    continue
+
+                if symbol not in df.index:
+                    print(f">> {symbol}({name}): {date_str} 거래 데이터가 없습니다.")
+                    continue
+
+                data = df.loc[symbol]
+
+                if data["종가"] == 0 or pd.isna(data["종가"]) or data["종가"] < 100:
+                    print(
+                        f">> {symbol}({name}): 종가가 유효하지 않습니다 (가격: {data['종가']})"
+                    )
+                    continue
+
+                market_cap = 0
+                try:
+                    if symbol in cap_df.index and not pd.isna(
+                        cap_df.loc[symbol]["시가총액"]
+                    ):
+                        market_cap = int(cap_df.loc[symbol]["시가총액"])
+                except Exception as e:
+                    print(f">> {symbol} 시가총액 정보 없음: {e}")
+
+                change_amount = (
+                    int(data["종가"] - data["시가"]) if not pd.isna(data["시가"]) else 0
+                )
+                change_percent = (
+                    float(data["등락률"]) if not pd.isna(data["등락률"]) else 0.0
+                )
+
+                stock_price = StockPrice(
+                    symbol=symbol,
+                    company_name=name,
+                    price=int(data["종가"]),
+                    change_amount=change_amount,
+                    change_percent=change_percent,
+                    volume=(int(data["거래량"]) if not pd.isna(data["거래량"]) else 0),
+                    market_cap=market_cap,
+                    date=date_str,
+                )
+
+                stock_data.append(stock_price)
+                print(
+                    f">> {name}({symbol}): {stock_price.price:,}원 ({stock_price.change_percent:+.2f}%) [{date_str}]"
+                )
+
+            except Exception as e:
+                print(f">> {symbol} 개별 수집 실패: {e}")
+                continue
+
+        return stock_data
+
+    def _finish_stock_data(self, stock_data: List[StockPrice]):
+        """수집된 주식 데이터 DB 저장"""
         if stock_data:
             self._save_stock_data_to_db(stock_data)
             print(f"\n>> 실제 주식 데이터 {len(stock_data)}건 수집 및 저장 완료")
         else:
             print(f"\n>> 모든 날짜에서 주식 데이터 수집 실패")
 
-        return stock_data
-
     # 나머지 헬퍼 메서드들은 기존과 동일...
     def _extract_entities_from_text(self, text: str) -> List[str]:
-        """텍스트에서 금융 엔티티 추출"""
-        known_entities = [
-            "삼성전자",
-            "SK하이닉스",
-            "네이버",
-            "카카오",
-            "현대차",
-            "LG화학",
-            "AI",
-            "반도체",
-            "배터리",
-            "전기차",
-            "바이오",
-            "플랫폼",
-            "비트코인",
-            "스테이블코인",
-            "암호화폐",
-            "블록체인",
-            "기준금리",
-            "환율",
-            "코스피",
-            "코스닥",
-            "실적",
-            "배당",
-        ]
-
-        found_entities = []
-        text_upper = text.upper()
-
-        for entity in known_entities:
-            if entity in text or entity.upper() in text_upper:
-                found_entities.append(entity)
-
-        return list(set(found_entities))
+        """텍스트에서 금융 엔티티 추출 (사전 컴파일된 단일 패턴으로 한 번에 스캔)"""
+        return list(
+            dict.fromkeys(
+                _ENTITY_CANONICAL[match.group(1).upper()]
+                for match in _ENTITY_PATTERN.finditer(text)
+            )
+        )
 
     def _calculate_importance_score(self, article_data: Dict) -> float:
         """뉴스 중요도 점수 계산"""
@@ -0,0 +1,9 @@
+# tests/conftest.py
+"""테스트 공통 설정 - 앱 설정을 읽기 전에 DB/캐시 경로를 임시 디렉터리로 지정"""
+
+import os
+import tempfile
+
+_tmp_dir = tempfile.mkdtemp(prefix="miraeasset-tests-")
+os.environ["DB_PATH"] = os.path.join(_tmp_dir, "financial_data.db")
+os.environ["CACHE_DIR"] = os.path.join(_tmp_dir, "cache")
@@ -0,0 +1,219 @@
+# tests/test_enhanced_chat.py
+"""enhanced_chat 파이프라인 이벤트 순서 및 보조 함수 테스트"""
+
+import asyncio
+
+import orjson
+import pytest
+from fastapi import BackgroundTasks, FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.routes import enhanced_chat
+from app.api.routes.enhanced_chat import _extract_entities_from_results
+
+
+def test_entities_in_order_without_duplicates():
+    results = [{"content": "SK하이닉스와 삼성전자"}, {"content": "삼성전자 실적"}]
+
+    assert _extract_entities_from_results(results) == ["SK하이닉스", "삼성전자"]
+
+
+def test_non_str_keys_do_not_raise():
+    results = [{1: "삼성전자 실적", (2, 3): "SK하이닉스"}]
+
+    assert _extract_entities_from_results(results) == ["삼성전자", "SK하이닉스"]
+
+
+def test_unserializable_values_fall_back_to_str():
+    results = [{"volume": 2**70, "title": "삼성전자"}]
+
+    assert _extract_entities_from_results(results) == ["삼성전자"]
+
+
+def test_empty_results():
+    assert _extract_entities_from_results([]) == []
+
+
+class _SlowMemory:
+    def __init__(self):
+        self.started = asyncio.Event()
+
+    async def get_user_context(self, user_id):
+        self.started.set()
+        await asyncio.sleep(10)
+
+
+class _FailingPlanner:
+    async def plan(self, query, critic_feedback=""):
+        raise RuntimeError("planning 실패")
+
+
+def _patch_pipeline(monkeypatch, memory, planner):
+    async def not_simple(query):
+        return False
+
+    monkeypatch.setattr(enhanced_chat, "_is_simple_query", not_simple)
+    monkeypatch.setattr(enhanced_chat, "get_user_memory", lambda: memory)
+    monkeypatch.setattr(enhanced_chat, "get_planning_agent", lambda: planner)
+
+
+def _user_context_tasks():
+    return [
+        t
+        for t in asyncio.all_tasks()
+        if t.get_coro().__qualname__ == "_SlowMemory.get_user_context"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_user_context_task_cancelled_when_planning_fails(monkeypatch):
+    memory = _SlowMemory()
+    _patch_pipeline(monkeypatch, memory, _FailingPlanner())
+    request = enhanced_chat.ChatRequest(query="삼성전자 전망 분석", user_id="u1")
+
+    with pytest.raises(RuntimeError):
+        async for _ in enhanced_chat._run_chat_pipeline(request, BackgroundTasks()):
+            pass
+
+    tasks = _user_context_tasks()
+    await asyncio.sleep(0)
+    assert tasks and all(t.cancelled() for t in tasks)
+
+
+@pytest.mark.asyncio
+async def test_user_context_task_cancelled_when_stream_closed(monkeypatch):
+    class _Planner:
+        async def plan(self, query, critic_feedback=""):
+            return [{"tool": "news_search", "query": query}]
+
+    memory = _SlowMemory()
+    _patch_pipeline(monkeypatch, memory, _Planner())
+    request = enhanced_chat.ChatRequest(query="삼성전자 전망 분석", user_id="u1")
+
+    events = enhanced_chat._run_chat_pipeline(request, BackgroundTasks())
+    assert (await events.__anext__())["phase"] == "plan"
+    tasks = _user_context_tasks()
+    await events.aclose()
+    await asyncio.sleep(0)
+
+    assert tasks and all(t.cancelled() for t in tasks)
+
+
+class _StubAgents:
+    """Planning → 검색 → 평가(1회 부족 판정) → 통합 → 리포트 대역"""
+
+    def __init__(self):
+        self.critic_calls = 0
+        self.stored = []
+
+    async def get_user_context(self, user_id):
+        return {"user_id": user_id}
+
+    async def plan(self, query, critic_feedback=""):
+        return [{"tool": "news_search", "query": query}]
+
+    async def retrieve(self, query_plan):
+        return {
+            "financial_data": [],
+            "news_data": [{"content": "삼성전자 실적 개선"}],
+            "market_analysis": [],
+            "graph_data": [],
+            "metadata": {
+                "successful_queries": 1,
+                "failed_queries": 0,
+                "tools_used": ["news_search"],
+            },
+        }
+
+    async def evaluate(self, results, query):
+        self.critic_calls += 1
+        return {"sufficiency": self.critic_calls > 1, "feedback": "추가 검색 필요"}
+
+    def integrate(self, results, user_context):
+        return {"results": results, "user": user_context}
+
+    async def generate_iter(self, context, user_context):
+        for chunk in ("삼성전자 ", "매수 검토"):
+            yield chunk
+
+    async def store_insight(self, **kwargs):
+        self.stored.append(kwargs)
+        return "insight-1"
+
+
+@pytest.fixture
+def stub_agents(monkeypatch):
+    agents = _StubAgents()
+
+    async def not_simple(query):
+        return False
+
+    async def skip_extraction(query, user_id):
+        return None
+
+    monkeypatch.setattr(enhanced_chat, "_is_simple_query", not_simple)
+    monkeypatch.setattr(enhanced_chat, "_extract_and_save_user_info", skip_extraction)
+    for name in (
+        "get_user_memory",
+        "get_planning_agent",
+        "get_retriever_agent",
+        "get_critic_agent",
+        "get_context_integrator",
+        "get_report_generator",
+        "get_insight_storage",
+    ):
+        monkeypatch.setattr(enhanced_chat, name, lambda: agents)
+    return agents
+
+
+_EXPECTED_PHASES = [
+    "plan",
+    "retrieval",
+    "critic",
+    "critic",
+    "report_chunk",
+    "report_chunk",
+    "done",
+]
+
+
+@pytest.mark.asyncio
+async def test_pipeline_event_sequence(stub_agents):
+    request = enhanced_chat.ChatRequest(query="삼성전자 전망 분석", user_id="u1")
+
+    events = [
+        event
+        async for event in enhanced_chat._run_chat_pipeline(request, BackgroundTasks())
+    ]
+
+    assert [event["phase"] for event in events] == _EXPECTED_PHASES
+    assert [e["data"]["sufficiency"] for e in events if e["phase"] == "critic"] == [
+        False,
+        True,
+    ]
+    response = events[-1]["response"]
+    assert response.response == "삼성전자 매수 검토"
+    assert response.response_type == "complex"
+    assert response.insight_id == "insight-1"
+    assert response.graph_entities == ["삼성전자"]
+    assert stub_agents.stored[0]["metadata"]["iteration_count"] == 1
+
+
+def test_stream_route_sends_phases_as_sse(stub_agents):
+    app = FastAPI()
+    app.include_router(enhanced_chat.router, prefix="/api")
+
+    with TestClient(app) as client:
+        response = client.post(
+            "/api/chat/stream", json={"query": "삼성전자 전망 분석", "user_id": "u1"}
+        )
+
+    events = [
+        orjson.loads(line[len("data: ") :])
+        for line in response.text.splitlines()
+        if line.startswith("data: ")
+    ]
+    assert [event["phase"] for event in events] == _EXPECTED_PHASES
+    # 리포트 본문은 report_chunk로만 전송되고 done에는 메타데이터만 포함
+    assert "response" not in events[-1]["data"]
+    assert events[-1]["data"]["insight_id"] == "insight-1"
@@ -0,0 +1,140 @@
+# tests/test_http_cache.py
+"""get_or_fetch single-flight 및 etag_response 304 처리 테스트"""
+
+import asyncio
+
+import pytest
+from cachetools import TTLCache
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.api.http_cache import _inflight_locks, etag_response, get_or_fetch
+
+
+class CountingFetch:
+    def __init__(self, delay=0.05, fail=False):
+        self.calls = 0
+        self.delay = delay
+        self.fail = fail
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("fetch failed")
+        return {"value": self.calls}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_fetch_once():
+    cache = TTLCache(maxsize=8, ttl=60)
+    fetch = CountingFetch()
+
+    results = await asyncio.gather(*(get_or_fetch(cache, "k", fetch) for _ in range(5)))
+
+    assert fetch.calls == 1
+    assert results == [{"value": 1}] * 5
+
+
+@pytest.mark.asyncio
+async def test_hit_skips_fetch_and_refresh_refetches():
+    cache = TTLCache(maxsize=8, ttl=60)
+    fetch = CountingFetch(delay=0)
+
+    await get_or_fetch(cache, "k", fetch)
+    assert await get_or_fetch(cache, "k", fetch) == {"value": 1}
+    assert await get_or_fetch(cache, "k", fetch, refresh=True) == {"value": 2}
+    assert fetch.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_fetch_is_not_cached():
+    cache = TTLCache(maxsize=8, ttl=60)
+    failing = CountingFetch(delay=0, fail=True)
+
+    with pytest.raises(RuntimeError):
+        await get_or_fetch(cache, "k", failing)
+
+    assert "k" not in cache
+    assert await get_or_fetch(cache, "k", CountingFetch(delay=0)) == {"value": 1}
+
+
+@pytest.mark.asyncio
+async def test_different_keys_fetch_independently():
+    cache = TTLCache(maxsize=8, ttl=60)
+    fetch = CountingFetch()
+
+    await asyncio.gather(
+        get_or_fetch(cache, "a", fetch), get_or_fetch(cache, "b", fetch)
+    )
+
+    assert fetch.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_single_flight_survives_many_other_keys():
+    cache = TTLCache(maxsize=1024, ttl=60)
+    fetch = CountingFetch(delay=0.1)
+
+    first = asyncio.create_task(get_or_fetch(cache, "slow", fetch))
+    await asyncio.sleep(0)
+    # 진행 중인 lock과 무관한 키가 많이 쌓여도 같은 lock을 공유해야 함
+    await asyncio.gather(
+        *(get_or_fetch(cache, i, CountingFetch(delay=0)) for i in range(300))
+    )
+    second = await get_or_fetch(cache, "slow", fetch)
+
+    assert await first == second
+    assert fetch.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_inflight_lock_released_after_fetch():
+    cache = TTLCache(maxsize=8, ttl=60)
+
+    await get_or_fetch(cache, "k", CountingFetch(delay=0))
+
+    assert (id(cache), "k") not in _inflight_locks
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+
+    @app.get("/items")
+    async def items(request: Request):
+        return etag_response(request, {"items": [1, 2, 3]}, max_age=15)
+
+    return TestClient(app)
+
+
+def test_etag_response_sets_cache_headers(client):
+    response = client.get("/items")
+
+    assert response.status_code == 200
+    assert response.json() == {"items": [1, 2, 3]}
+    assert response.headers["etag"].startswith('"')
+    assert response.headers["cache-control"] == "max-age=15"
+
+
+@pytest.mark.parametrize(
+    "if_none_match",
+    ["{etag}", "W/{etag}", '"other", {etag}', "*"],
+)
+def test_matching_if_none_match_returns_304(client, if_none_match):
+    etag = client.get("/items").headers["etag"]
+
+    response = client.get(
+        "/items", headers={"If-None-Match": if_none_match.format(etag=etag)}
+    )
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+def test_stale_if_none_match_returns_body(client):
+    response = client.get("/items", headers={"If-None-Match": '"stale"'})
+
+    assert response.status_code == 200
+    assert response.json() == {"items": [1, 2, 3]}
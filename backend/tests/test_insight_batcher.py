@@ -0,0 +1,176 @@
+# tests/test_insight_batcher.py
+"""InsightBatcher 배치/폴백/예외 전파 및 generate_batch 병렬 생성 테스트"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.services.core.insight_batcher import InsightBatcher
+from app.services.core.personalized_insight_generator import (
+    PersonalizedInsightGenerator,
+)
+
+LLM_LATENCY = 0.2
+
+
+class FakeCollector:
+    def __init__(self):
+        self.batch_calls = []
+
+    def collect_all_data_batch(self, user_ids, use_playwright=True):
+        self.batch_calls.append(list(user_ids))
+        return {user_id: {"user": user_id} for user_id in user_ids}
+
+
+class FakeGenerator:
+    """generate_comprehensive_insight / generate_batch 호출 기록"""
+
+    def __init__(self, fail_users=(), fail_batch=False):
+        self.single_calls = []
+        self.batch_calls = []
+        self.fail_users = set(fail_users)
+        self.fail_batch = fail_batch
+
+    def generate_comprehensive_insight(self, user_id, refresh_data=False):
+        self.single_calls.append((user_id, refresh_data))
+        return {"user_id": user_id, "mode": "single"}
+
+    def generate_batch(self, user_ids):
+        self.batch_calls.append(list(user_ids))
+        if self.fail_batch:
+            raise RuntimeError("batch failed")
+        return [
+            ValueError(user_id) if user_id in self.fail_users else {"user_id": user_id}
+            for user_id in user_ids
+        ]
+
+
+def _generator_with_slow_builds() -> PersonalizedInsightGenerator:
+    generator = PersonalizedInsightGenerator.__new__(PersonalizedInsightGenerator)
+    generator.data_collector = FakeCollector()
+
+    def build(financial_data, user_id):
+        time.sleep(LLM_LATENCY)  # LLM 호출 1회
+        if user_id == "bad":
+            raise ValueError(user_id)
+        return {"user_id": user_id, "data": financial_data}
+
+    generator._build_comprehensive_insight = build
+    return generator
+
+
+def test_generate_batch_builds_users_concurrently():
+    generator = _generator_with_slow_builds()
+    user_ids = [f"user{i}" for i in range(8)]
+
+    started = time.perf_counter()
+    results = generator.generate_batch(user_ids)
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < LLM_LATENCY * 2
+    assert [result["user_id"] for result in results] == user_ids
+    assert generator.data_collector.batch_calls == [user_ids]
+
+
+def test_generate_batch_returns_exceptions_in_place():
+    generator = _generator_with_slow_builds()
+
+    results = generator.generate_batch(["a", "bad", "a"])
+
+    assert results[0]["user_id"] == "a"
+    assert isinstance(results[1], ValueError)
+    assert results[2]["user_id"] == "a"
+    # 중복 사용자는 데이터 수집 1회
+    assert generator.data_collector.batch_calls == [["a", "bad"]]
+
+
+@pytest.mark.asyncio
+async def test_submit_without_worker_runs_single():
+    generator = FakeGenerator()
+    batcher = InsightBatcher(generator)
+
+    result = await batcher.submit("u1", refresh_data=True)
+
+    assert result == {"user_id": "u1", "mode": "single"}
+    assert generator.single_calls == [("u1", True)]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_submits_share_one_batch_in_order():
+    generator = FakeGenerator()
+    batcher = InsightBatcher(generator, max_batch=8, max_wait=0.05)
+    batcher.start()
+    try:
+        user_ids = [f"user{i}" for i in range(5)]
+        results = await asyncio.gather(*(batcher.submit(u) for u in user_ids))
+    finally:
+        await batcher.stop()
+
+    assert generator.batch_calls == [user_ids]
+    assert [result["user_id"] for result in results] == user_ids
+
+
+@pytest.mark.asyncio
+async def test_batch_is_split_at_max_batch():
+    generator = FakeGenerator()
+    batcher = InsightBatcher(generator, max_batch=2, max_wait=0.05)
+    batcher.start()
+    try:
+        await asyncio.gather(*(batcher.submit(f"user{i}") for i in range(5)))
+    finally:
+        await batcher.stop()
+
+    # 2 + 2 는 배치, 마지막 1건은 단건 경로
+    assert [len(batch) for batch in generator.batch_calls] == [2, 2]
+    assert generator.single_calls == [("user4", False)]
+
+
+@pytest.mark.asyncio
+async def test_lone_request_uses_single_path():
+    generator = FakeGenerator()
+    batcher = InsightBatcher(generator, max_wait=0.01)
+    batcher.start()
+    try:
+        result = await batcher.submit("solo")
+    finally:
+        await batcher.stop()
+
+    assert result["mode"] == "single"
+    assert generator.batch_calls == []
+
+
+@pytest.mark.asyncio
+async def test_per_user_exception_only_fails_that_user():
+    generator = FakeGenerator(fail_users={"bad"})
+    batcher = InsightBatcher(generator, max_wait=0.05)
+    batcher.start()
+    try:
+        results = await asyncio.gather(
+            batcher.submit("ok1"),
+            batcher.submit("bad"),
+            batcher.submit("ok2"),
+            return_exceptions=True,
+        )
+    finally:
+        await batcher.stop()
+
+    assert results[0] == {"user_id": "ok1"}
+    assert isinstance(results[1], ValueError)
+    assert results[2] == {"user_id": "ok2"}
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_fans_out_to_every_waiter():
+    generator = FakeGenerator(fail_batch=True)
+    batcher = InsightBatcher(generator, max_wait=0.05)
+    batcher.start()
+    try:
+        results = await asyncio.gather(
+            *(batcher.submit(f"user{i}") for i in range(3)),
+            return_exceptions=True,
+        )
+    finally:
+        await batcher.stop()
+
+    assert all(isinstance(result, RuntimeError) for result in results)
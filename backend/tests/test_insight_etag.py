@@ -0,0 +1,61 @@
+# tests/test_insight_etag.py
+"""인사이트 생성(POST)과 캐시 조회(GET, ETag/304) 테스트"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.routes import insights
+from app.deps import get_insight_batcher
+
+
+class FakeBatcher:
+    def __init__(self):
+        self.calls = 0
+
+    async def submit(self, user_id, refresh_data=False):
+        self.calls += 1
+        return {"script": f"{user_id} 스크립트", "model_used": "fake"}
+
+
+@pytest.fixture
+def client():
+    insights.insight_cache.clear()
+    batcher = FakeBatcher()
+    app = FastAPI()
+    app.include_router(insights.router, prefix="/api/insights")
+    app.dependency_overrides[get_insight_batcher] = lambda: batcher
+    yield TestClient(app), batcher
+    insights.insight_cache.clear()
+
+
+def test_post_generate_has_no_conditional_headers(client):
+    http, _ = client
+
+    response = http.post("/api/insights/generate/u1", headers={"If-None-Match": "*"})
+
+    assert response.status_code == 200
+    assert response.json()["script"] == "u1 스크립트"
+    assert "etag" not in response.headers
+    assert "cache-control" not in response.headers
+
+
+def test_get_insight_revalidates_from_cache(client):
+    http, batcher = client
+    http.post("/api/insights/generate/u1")
+
+    first = http.get("/api/insights/insight/u1")
+    etag = first.headers["etag"]
+    second = http.get("/api/insights/insight/u1", headers={"If-None-Match": etag})
+
+    assert first.status_code == 200
+    assert first.json()["script"] == "u1 스크립트"
+    assert second.status_code == 304
+    assert batcher.calls == 1
+
+
+def test_get_insight_without_generation_is_404(client):
+    http, batcher = client
+
+    assert http.get("/api/insights/insight/u2").status_code == 404
+    assert batcher.calls == 0
@@ -0,0 +1,53 @@
+# tests/test_news_probe.py
+"""데이터 수집 헬스 프로브가 뉴스/Graph DB를 변경하지 않는지 테스트"""
+
+import pytest
+
+from app.api.routes.financial_data import probe_data_collection
+from app.services.storage.enhanced_data_collector import EnhancedDataCollector
+
+NEWS_LIST_HTML = """<html><head><meta charset="euc-kr"></head><body><dl>
+<dd class="articleSubject"><a href="/n/1">삼성전자 분기 실적 발표</a></dd>
+<dd class="articleSubject"><a href="/n/2">SK하이닉스 신규 투자 계획</a></dd>
+</dl></body></html>""".encode("euc-kr")
+
+
+class FakeResponse:
+    content = NEWS_LIST_HTML
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeHttpClient:
+    def __init__(self):
+        self.urls = []
+
+    async def get(self, url):
+        self.urls.append(url)
+        return FakeResponse()
+
+
+@pytest.fixture
+def collector(monkeypatch):
+    collector = EnhancedDataCollector.__new__(EnhancedDataCollector)
+    collector.http_client = FakeHttpClient()
+
+    def must_not_write(*args, **kwargs):
+        raise AssertionError("프로브가 저장 경로를 호출함")
+
+    monkeypatch.setattr(collector, "_save_news_to_db", must_not_write, raising=False)
+    monkeypatch.setattr(
+        collector, "_finish_fallback_news", must_not_write, raising=False
+    )
+    return collector
+
+
+@pytest.mark.asyncio
+async def test_probe_only_fetches_and_parses_one_page(collector):
+    result = await probe_data_collection(collector)
+
+    assert result["status"] == "success"
+    assert result["news_count"] == 2
+    assert result["sample_news"] == "삼성전자 분기 실적 발표"
+    assert len(collector.http_client.urls) == 1
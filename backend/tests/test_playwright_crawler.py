@@ -0,0 +1,89 @@
+# tests/test_playwright_crawler.py
+"""상주 브라우저 재사용 테스트 (워커 스레드에서의 수집 제출)"""
+
+import asyncio
+
+import pytest
+
+from app.services.external.playwright_news_crawler import PlaywrightNewsCrawler
+
+
+class FakeBrowser:
+    def is_connected(self):
+        return True
+
+
+@pytest.fixture
+def crawler(tmp_path):
+    crawler = PlaywrightNewsCrawler(str(tmp_path))
+    crawler.loops = []
+
+    async def collect(limit=10):
+        crawler.loops.append(asyncio.get_running_loop())
+        return [{"title": f"뉴스 {i}"} for i in range(limit)]
+
+    crawler.collect_naver_financial_news = collect
+    return crawler
+
+
+@pytest.mark.asyncio
+async def test_worker_thread_runs_on_resident_browser_loop(crawler):
+    crawler._browser = FakeBrowser()
+    crawler._browser_loop = asyncio.get_running_loop()
+
+    result = await asyncio.to_thread(
+        lambda: crawler.submit_to_browser_loop(2).result(timeout=5)
+    )
+
+    assert len(result) == 2
+    assert crawler.loops == [asyncio.get_running_loop()]
+
+
+@pytest.mark.asyncio
+async def test_no_resident_browser_returns_none(crawler):
+    assert await asyncio.to_thread(crawler.submit_to_browser_loop, 2) is None
+
+
+@pytest.mark.asyncio
+async def test_same_loop_returns_none_instead_of_deadlocking(crawler):
+    crawler._browser = FakeBrowser()
+    crawler._browser_loop = asyncio.get_running_loop()
+
+    assert crawler.submit_to_browser_loop(2) is None
+
+
+class FakeContext:
+    async def close(self):
+        pass
+
+
+class FakeContextBrowser(FakeBrowser):
+    async def new_context(self, **kwargs):
+        return FakeContext()
+
+
+@pytest.mark.asyncio
+async def test_each_call_returns_only_its_own_news(tmp_path):
+    crawler = PlaywrightNewsCrawler(str(tmp_path))
+    crawler._browser = FakeContextBrowser()
+    crawler._browser_loop = asyncio.get_running_loop()
+
+    async def links(context, limit):
+        return [(f"뉴스 {i}", f"https://news/{i}") for i in range(limit)]
+
+    async def scrape(semaphore, context, title, url):
+        await asyncio.sleep(0)
+        return {"title": title, "url": url}
+
+    crawler._collect_article_links = links
+    crawler._scrape_article = scrape
+
+    first, second = await asyncio.gather(
+        crawler.collect_naver_financial_news(2),
+        crawler.collect_naver_financial_news(3),
+    )
+    third = await crawler.collect_naver_financial_news(1)
+
+    assert [item["title"] for item in first] == ["뉴스 0", "뉴스 1"]
+    assert len(second) == 3
+    assert [item["title"] for item in third] == ["뉴스 0"]
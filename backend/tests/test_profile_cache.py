@@ -0,0 +1,127 @@
+# tests/test_profile_cache.py
+"""GET /users/profile 캐시가 두 라우터(/users, /user)의 쓰기 후 무효화되는지 테스트"""
+
+import asyncio
+import sqlite3
+
+import pytest
+from cachetools import TTLCache
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.http_cache import get_or_fetch
+from app.api.profile_cache import invalidate_profile, profile_cache, profile_cache_key
+from app.api.routes import user_profile, users
+from app.config import settings
+from app.deps import get_data_collector
+
+
+class PortfolioReader:
+    """user_portfolios 를 직접 읽는 get_personalized_data 대역 (호출 횟수 기록)"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def get_personalized_data(self, user_id):
+        self.calls += 1
+        with sqlite3.connect(settings.DB_PATH) as conn:
+            rows = conn.execute(
+                "SELECT symbol, company_name, shares, avg_price, sector "
+                "FROM user_portfolios WHERE user_id = ?",
+                (user_id,),
+            ).fetchall()
+        return {"portfolio": rows, "preferences": {}}
+
+
+@pytest.fixture
+def client_and_reader():
+    user_profile.init_user_tables()
+    profile_cache.clear()
+    reader = PortfolioReader()
+
+    app = FastAPI()
+    app.include_router(users.router, prefix="/api/users")
+    app.include_router(user_profile.router, prefix="/api/user")
+    app.dependency_overrides[get_data_collector] = lambda: reader
+    with TestClient(app) as client:
+        yield client, reader
+
+
+def _holding(symbol):
+    return {"symbol": symbol, "company_name": symbol, "shares": 1, "avg_price": 1.0}
+
+
+def _symbols(client, user_id):
+    response = client.get(f"/api/users/profile/{user_id}")
+    assert response.status_code == 200
+    return [holding["symbol"] for holding in response.json()["portfolio"]]
+
+
+def test_repeat_reads_are_cached(client_and_reader):
+    client, reader = client_and_reader
+
+    _symbols(client, "cached")
+    _symbols(client, "cached")
+
+    assert reader.calls == 1
+
+
+def test_user_profile_portfolio_write_invalidates(client_and_reader):
+    client, reader = client_and_reader
+    user_id = "writer"
+
+    client.post(
+        "/api/user/portfolio", json={"user_id": user_id, "holdings": [_holding("A")]}
+    )
+    assert _symbols(client, user_id) == ["A"]
+
+    client.post(
+        "/api/user/portfolio", json={"user_id": user_id, "holdings": [_holding("B")]}
+    )
+    assert _symbols(client, user_id) == ["B"]
+
+
+def test_user_profile_delete_invalidates(client_and_reader):
+    client, reader = client_and_reader
+    user_id = "deleted"
+
+    client.post(
+        "/api/user/portfolio", json={"user_id": user_id, "holdings": [_holding("A")]}
+    )
+    assert _symbols(client, user_id) == ["A"]
+
+    client.delete(f"/api/user/profile/{user_id}")
+    assert _symbols(client, user_id) == []
+
+
+@pytest.mark.asyncio
+async def test_read_started_before_write_is_not_reused():
+    user_id = "racing"
+    profile_cache.clear()
+    release = asyncio.Event()
+
+    async def slow_stale_read():
+        await release.wait()
+        return "stale"
+
+    stale = asyncio.create_task(
+        get_or_fetch(profile_cache, profile_cache_key(user_id), slow_stale_read)
+    )
+    await asyncio.sleep(0)
+    invalidate_profile(user_id)
+    release.set()
+    assert await stale == "stale"
+
+    async def fresh_read():
+        return "fresh"
+
+    result = await get_or_fetch(profile_cache, profile_cache_key(user_id), fresh_read)
+    assert result == "fresh"
+
+
+def test_generations_are_bounded_and_outlive_cached_profiles():
+    from app.api import profile_cache as module
+
+    assert isinstance(module._profile_generations, TTLCache)
+    assert module._profile_generations.ttl > profile_cache.ttl
+    assert module._profile_generations.maxsize >= profile_cache.maxsize
@@ -0,0 +1,86 @@
+# tests/test_sse_coalescing.py
+"""채팅 SSE 진행 이벤트 묶음 전송(_coalesce_progress) 테스트"""
+
+import asyncio
+
+import pytest
+
+from app.api.routes.chat import _PROGRESS_BATCH_WINDOW, _coalesce_progress
+
+
+async def _source(*steps):
+    """(지연 초, 이벤트) 순서대로 이벤트 발생, 이벤트가 예외면 raise"""
+    for delay, event in steps:
+        await asyncio.sleep(delay)
+        if isinstance(event, Exception):
+            raise event
+        yield event
+
+
+def _step(n):
+    return {"status": "processing", "step": n}
+
+
+async def _collect(events, window=_PROGRESS_BATCH_WINDOW):
+    return [event async for event in _coalesce_progress(events, window)]
+
+
+@pytest.mark.asyncio
+async def test_burst_within_window_is_batched():
+    out = await _collect(_source((0, _step(1)), (0, _step(2)), (0, _step(3))))
+
+    assert out == [{"status": "processing", "batch": [_step(1), _step(2), _step(3)]}]
+
+
+@pytest.mark.asyncio
+async def test_single_event_is_passed_unwrapped():
+    assert await _collect(_source((0, _step(1)))) == [_step(1)]
+
+
+@pytest.mark.asyncio
+async def test_events_further_apart_than_window_are_sent_separately():
+    gap = _PROGRESS_BATCH_WINDOW * 3
+
+    out = await _collect(_source((0, _step(1)), (gap, _step(2))))
+
+    assert out == [_step(1), _step(2)]
+
+
+@pytest.mark.asyncio
+async def test_terminal_event_flushes_batch_without_waiting():
+    loop = asyncio.get_running_loop()
+    done = {"status": "completed", "result": "ok"}
+    started = loop.time()
+
+    out = await _collect(_source((0, _step(1)), (0, _step(2)), (0, done)), window=1.0)
+
+    assert out == [{"status": "processing", "batch": [_step(1), _step(2)]}, done]
+    assert loop.time() - started < 0.5
+
+
+@pytest.mark.asyncio
+async def test_source_exception_propagates_after_pending_events():
+    events = _coalesce_progress(_source((0, _step(1)), (0, RuntimeError("boom"))))
+
+    assert await events.__anext__() == _step(1)
+    with pytest.raises(RuntimeError, match="boom"):
+        await events.__anext__()
+
+
+@pytest.mark.asyncio
+async def test_closing_stream_cancels_source():
+    cancelled = asyncio.Event()
+
+    async def endless():
+        try:
+            while True:
+                yield _step(0)
+                await asyncio.sleep(_PROGRESS_BATCH_WINDOW * 2)
+        finally:
+            cancelled.set()
+
+    events = _coalesce_progress(endless())
+    await events.__anext__()
+    await events.aclose()
+
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
@@ -0,0 +1,59 @@
+# tests/test_video_coalescing.py
+"""영상 생성 요청 병합 테스트"""
+
+import asyncio
+
+import pytest
+
+from app.api.routes.insights import _create_video_coalesced
+
+
+class _FakeVideoService:
+    def __init__(self, success: bool = True):
+        self.calls = 0
+        self.success = success
+
+    def get_provider(self):
+        return "heygen"
+
+    async def create_video(self, script, **params):
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        return {"success": self.success, "video_id": f"v{self.calls}"}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_duplicates_share_one_job():
+    service = _FakeVideoService()
+
+    results = await asyncio.gather(
+        *(_create_video_coalesced(service, "스크립트", avatar="a") for _ in range(3))
+    )
+
+    assert service.calls == 1
+    assert {r["video_id"] for r in results} == {"v1"}
+
+
+@pytest.mark.asyncio
+async def test_completed_job_is_not_reused():
+    service = _FakeVideoService()
+
+    first = await _create_video_coalesced(service, "스크립트", avatar="a")
+    second = await _create_video_coalesced(service, "스크립트", avatar="a")
+
+    assert service.calls == 2
+    assert first["video_id"] != second["video_id"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_job():
+    service = _FakeVideoService()
+
+    cancelled = asyncio.create_task(_create_video_coalesced(service, "스크립트"))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(_create_video_coalesced(service, "스크립트"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    assert (await waiter)["video_id"] == "v1"
+    assert service.calls == 1
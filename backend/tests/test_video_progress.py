@@ -0,0 +1,50 @@
+# tests/test_video_progress.py
+"""영상 진행상황 SSE 스트림 테스트"""
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from app.api.routes import insights
+
+
+def test_progress_returns_503_before_stream_when_service_unavailable(monkeypatch):
+    def unavailable():
+        raise HTTPException(status_code=503, detail="비디오 서비스 초기화 실패")
+
+    monkeypatch.setattr(insights, "get_video_service", unavailable)
+    app = FastAPI()
+    app.include_router(insights.router, prefix="/api/insights")
+
+    response = TestClient(app).get("/api/insights/video-progress/v1")
+
+    assert response.status_code == 503
+    assert "text/event-stream" not in response.headers.get("content-type", "")
+
+
+class _ProcessingService:
+    def get_provider(self):
+        return "heygen"
+
+    async def get_video_status(self, video_id):
+        return {"success": True, "status": "processing", "progress": 10}
+
+
+class _ConnectedRequest:
+    async def is_disconnected(self):
+        return False
+
+
+@pytest.mark.asyncio
+async def test_closed_stream_clears_video_state():
+    events = insights._video_progress_events(
+        _ProcessingService(), "v-closed", _ConnectedRequest()
+    )
+    await events.__anext__()
+    insights._notify_video_webhook("v-closed", {"status": "completed"})
+    assert "v-closed" in insights._video_done_events
+
+    await events.aclose()
+
+    assert "v-closed" not in insights._video_done_events
+    assert "v-closed" not in insights._video_webhook_states